@@ -0,0 +1,103 @@
+import json
+import statistics
+import time
+import tracemalloc
+from array import array
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterable, Optional
+
+__all__ = ["BenchResult", "measure", "print_results"]
+
+
+@dataclass
+class BenchResult:
+    name: str
+    calls: int
+    seconds: float
+    throughput: float
+    p50_us: float
+    p99_us: float
+    peak_kib: float
+
+
+def _percentile(samples: array, q: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _timed_pass(call: Callable, workload: Iterable) -> tuple[float, array]:
+    perf_counter_ns = time.perf_counter_ns
+    latencies = array("d")
+    append = latencies.append
+    start = time.perf_counter()
+    for args, kwargs in workload:
+        t0 = perf_counter_ns()
+        call(*args, **kwargs)
+        append(perf_counter_ns() - t0)
+    return time.perf_counter() - start, latencies
+
+
+def _memory_pass(call: Callable, workload: Iterable) -> int:
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        for args, kwargs in workload:
+            call(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def measure(
+    name: str,
+    call: Callable,
+    make_workload: Callable[[int], Iterable],
+    calls: int,
+    *,
+    memory_calls: Optional[int] = None,
+) -> BenchResult:
+    """Runs `call` over the workload produced by `make_workload(calls)`.
+
+    Latencies are taken from an untraced pass. Peak memory is taken from
+    a second pass under `tracemalloc` which, because tracing slows every
+    allocation down, only replays `memory_calls` items of the workload.
+
+    :param name: Label of the workload in the report.
+    :param call: The (decorated) callable under test.
+    :param make_workload: Factory returning an iterable of
+                          `(args, kwargs)` pairs of the given length.
+    :param calls: Number of calls in the timed pass.
+    :param memory_calls: Number of calls in the traced pass. Defaults to
+                         `calls`.
+    """
+    seconds, latencies = _timed_pass(call, make_workload(calls))
+    peak = _memory_pass(call, make_workload(memory_calls or calls))
+    return BenchResult(
+        name=name,
+        calls=calls,
+        seconds=seconds,
+        throughput=calls / seconds if seconds else float("inf"),
+        p50_us=statistics.median(latencies) / 1e3,
+        p99_us=_percentile(latencies, 0.99) / 1e3,
+        peak_kib=peak / 1024,
+    )
+
+
+def print_results(results: list[BenchResult], as_json: bool = False):
+    if as_json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+        return
+
+    header = (
+        f"{'workload':<24}{'calls':>10}{'ops/s':>14}"
+        f"{'p50 (us)':>12}{'p99 (us)':>12}{'peak (KiB)':>14}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r.name:<24}{r.calls:>10}{r.throughput:>14,.0f}"
+            f"{r.p50_us:>12.2f}{r.p99_us:>12.2f}{r.peak_kib:>14,.1f}"
+        )
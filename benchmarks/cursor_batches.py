@@ -0,0 +1,114 @@
+"""Validation of an sqlite3 result set with `validate_cursor`.
+
+Run with::
+
+    python -m benchmarks.cursor_batches [--rows N]
+
+Reads a table of `--rows` rows from an in-memory database: bare
+(`fetchmany` only), by calling a `validate_params` function on every
+row, and with `validate_cursor` at several batch sizes. Reports rows per
+second and the peak memory of the traced pass.
+"""
+
+import argparse
+import sqlite3
+import time
+import tracemalloc
+from typing import Annotated, Optional
+
+from func_validator import (
+    DependsOn,
+    MustBeBetween,
+    MustBeMemberOf,
+    MustBePositive,
+    validate_cursor,
+    validate_params,
+)
+
+
+@validate_params
+def trade(
+    trade_id: Annotated[int, MustBePositive()],
+    price: Annotated[float, MustBeBetween(min_value=0.0, max_value=1e6)],
+    side: Annotated[str, MustBeMemberOf({"buy", "sell"})],
+    limit: Annotated[Optional[float], DependsOn(side="sell")] = None,
+):
+    pass
+
+
+def _database(rows: int) -> sqlite3.Connection:
+    connection = sqlite3.connect(":memory:")
+    connection.execute('CREATE TABLE trades (trade_id, price, side, "limit")')
+    connection.executemany(
+        "INSERT INTO trades VALUES (?, ?, ?, ?)",
+        (
+            (
+                (i + 1, i % 1000 + 0.5, "sell", 1.0)
+                if i % 2
+                else (i + 1, i % 1000 + 0.5, "buy", None)
+            )
+            for i in range(rows)
+        ),
+    )
+    return connection
+
+
+def _run(connection, consume) -> tuple[float, int]:
+    cursor = connection.execute("SELECT * FROM trades")
+    start = time.perf_counter()
+    consume(cursor)
+    seconds = time.perf_counter() - start
+
+    cursor = connection.execute("SELECT * FROM trades")
+    tracemalloc.start()
+    try:
+        consume(cursor)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def _bare(cursor):
+    while cursor.fetchmany(1_000):
+        pass
+
+
+def _per_row(cursor):
+    while rows := cursor.fetchmany(1_000):
+        for row in rows:
+            trade(*row)
+
+
+def _with_cursor(batch_size):
+    def consume(cursor):
+        for _ in validate_cursor(cursor, trade, batch_size=batch_size):
+            pass
+
+    return consume
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    connection = _database(args.rows)
+    runs = {
+        "fetchmany only": _bare,
+        "call per row": _per_row,
+        **{
+            f"validate_cursor({size})": _with_cursor(size)
+            for size in (10, 100, 1_000, 10_000)
+        },
+    }
+    header = f"{'reader':<24}{'rows/s':>12}{'peak KiB':>11}"
+    print(header)
+    print("-" * len(header))
+    for label, consume in runs.items():
+        seconds, peak = _run(connection, consume)
+        print(f"{label:<24}{args.rows / seconds:>12,.0f}{peak / 1024:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
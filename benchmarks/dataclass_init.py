@@ -0,0 +1,80 @@
+"""Construction throughput of small validated value objects.
+
+Run with::
+
+    python -m benchmarks.dataclass_init [--number N]
+
+Compares a plain dataclass, a `validated_dataclass` and a dataclass
+whose `__init__` is wrapped with `validate_params`.
+"""
+
+import argparse
+import dataclasses
+import timeit
+from typing import Annotated
+
+from func_validator import (
+    MustBeMemberOf,
+    MustBeNonNegative,
+    MustBePositive,
+    validate_params,
+    validated_dataclass,
+)
+
+Price = Annotated[float, MustBeNonNegative()]
+Quantity = Annotated[int, MustBePositive()]
+Currency = Annotated[str, MustBeMemberOf(frozenset({"EUR", "GBP", "USD"}))]
+
+
+@dataclasses.dataclass(slots=True)
+class PlainLine:
+    price: float
+    quantity: int
+    currency: str = "EUR"
+
+
+@validated_dataclass(slots=True)
+class ValidatedLine:
+    price: Price
+    quantity: Quantity
+    currency: Currency = "EUR"
+
+
+@dataclasses.dataclass(slots=True, init=False)
+class DecoratedLine:
+    price: float
+    quantity: int
+    currency: str
+
+    @validate_params
+    def __init__(
+        self, price: Price, quantity: Quantity, currency: Currency = "EUR"
+    ):
+        self.price = price
+        self.quantity = quantity
+        self.currency = currency
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    header = f"{'class':<24}{'objects/s':>14}{'relative':>10}"
+    print(header)
+    print("-" * len(header))
+    baseline = None
+    for cls in (PlainLine, ValidatedLine, DecoratedLine):
+        cls(9.99, 3)  # builds validation code ahead of the timed runs
+        seconds = min(
+            timeit.repeat(
+                lambda: cls(9.99, 3, "USD"), number=args.number, repeat=3
+            )
+        )
+        rate = args.number / seconds
+        baseline = baseline or rate
+        print(f"{cls.__name__:<24}{rate:>14,.0f}{rate / baseline:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""End-to-end workloads modelled on typical `validate_params` usage.
+
+Run all of them with::
+
+    python -m benchmarks.macro
+
+Use `--scale` to shrink or grow every workload proportionally and
+`--json` to get machine readable output that can be diffed between
+releases.
+"""
+
+import argparse
+import random
+from typing import Annotated, Optional
+
+from func_validator import (
+    DependsOn,
+    MustBeBetween,
+    MustBeGreaterThanOrEqual,
+    MustBeMemberOf,
+    MustBeNonNegative,
+    MustBePositive,
+    MustHaveLengthLessThanOrEqual,
+    MustHaveValuesBetween,
+    MustMatchRegex,
+    validate_params,
+)
+
+from ._harness import measure, print_results
+
+ROLES = frozenset({"admin", "editor", "viewer"})
+CURRENCIES = frozenset({"EUR", "GBP", "USD"})
+
+
+# Request handler
+
+
+@validate_params
+def handle_request(
+    user_id: Annotated[int, MustBePositive()],
+    username: Annotated[str, MustMatchRegex(r"[a-z][a-z0-9_]{2,31}")],
+    email: Annotated[
+        str,
+        MustMatchRegex(r"[^@\s]+@[^@\s]+\.[a-z]+", match_type="fullmatch"),
+    ],
+    age: Annotated[int, MustBeBetween(min_value=13, max_value=130)],
+    role: Annotated[str, MustBeMemberOf(ROLES)],
+    tags: Annotated[list, MustHaveLengthLessThanOrEqual(8)],
+    min_price: Annotated[float, MustBeNonNegative(), DependsOn("max_price")],
+    max_price: Annotated[float, MustBeNonNegative()],
+    page: Annotated[int, MustBeGreaterThanOrEqual(1)] = 1,
+    include_deleted: bool = False,
+    deleted_since: Annotated[
+        Optional[int], DependsOn(include_deleted=True)
+    ] = None,
+):
+    return user_id, page
+
+
+def _request_workload(n: int):
+    rng = random.Random(0)
+    for i in range(n):
+        include_deleted = i % 10 == 0
+        yield (
+            (
+                i + 1,
+                f"user_{i % 5000}",
+                f"user{i}@example.com",
+                rng.randint(13, 90),
+                "viewer",
+                ["a", "b"],
+                1.0,
+                rng.uniform(2.0, 100.0),
+            ),
+            {
+                "page": 1 + i % 20,
+                "include_deleted": include_deleted,
+                "deleted_since": 1_700_000_000 if include_deleted else None,
+            },
+        )
+
+
+# Batch ETL
+
+
+@validate_params
+def transform_record(
+    record_id: Annotated[int, MustBePositive()],
+    amount: Annotated[float, MustBeBetween(min_value=0, max_value=1e6)],
+    currency: Annotated[str, MustBeMemberOf(CURRENCIES)],
+    quantity: Annotated[int, MustBeGreaterThanOrEqual(1)],
+):
+    return record_id, amount * quantity, currency
+
+
+def _etl_workload(n: int):
+    currencies = sorted(CURRENCIES)
+    for i in range(n):
+        yield (i + 1, (i % 997) * 1.5, currencies[i % 3], 1 + i % 7), {}
+
+
+# Numeric kernel
+
+
+@validate_params
+def normalise(
+    samples: Annotated[
+        list, MustHaveValuesBetween(min_value=-1.0, max_value=1.0)
+    ],
+    weights: Annotated[list, MustHaveValuesBetween(min_value=0, max_value=1)],
+):
+    return sum(s * w for s, w in zip(samples, weights))
+
+
+def _kernel_workload(size: int):
+    rng = random.Random(0)
+    samples = [rng.uniform(-1.0, 1.0) for _ in range(size)]
+    weights = [rng.random() for _ in range(size)]
+
+    def workload(n: int):
+        for _ in range(n):
+            yield (samples, weights), {}
+
+    return workload
+
+
+def run(scale: float = 1.0):
+    def scaled(n: int) -> int:
+        return max(1, int(n * scale))
+
+    return [
+        measure(
+            "request_handler",
+            handle_request,
+            _request_workload,
+            scaled(100_000),
+            memory_calls=scaled(10_000),
+        ),
+        measure(
+            "batch_etl",
+            transform_record,
+            _etl_workload,
+            scaled(1_000_000),
+            memory_calls=scaled(100_000),
+        ),
+        measure(
+            "numeric_kernel",
+            normalise,
+            _kernel_workload(100_000),
+            scaled(200),
+            memory_calls=scaled(20),
+        ),
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiplier applied to the number of calls of every workload.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print results as JSON."
+    )
+    args = parser.parse_args(argv)
+    print_results(run(args.scale), as_json=args.json)
+
+
+if __name__ == "__main__":
+    main()
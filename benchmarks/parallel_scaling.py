@@ -0,0 +1,69 @@
+"""Scaling of parallel collection validation with the number of workers.
+
+Run with::
+
+    python -m benchmarks.parallel_scaling [--size N] [--max-workers N]
+
+Checks a list and an `array.array` of `--size` floats with
+`MustHaveValuesBetween`, sequentially and then with 1 to `--max-workers`
+workers, and reports the speed-up over the sequential scan. Worker
+start-up is excluded: each configuration is warmed up once first.
+"""
+
+import argparse
+import os
+import time
+from array import array
+
+from func_validator import (
+    MustHaveValuesBetween,
+    disable_parallel_validation,
+    enable_parallel_validation,
+)
+
+
+def _best_of(repeat: int, call) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=10_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--executor", choices=("auto", "thread", "process"), default="auto"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    validator = MustHaveValuesBetween(min_value=0.0, max_value=1.0)
+    values = [i / args.size for i in range(args.size)]
+    inputs = {"list": values, "array('d')": array("d", values)}
+
+    header = f"{'input':<14}{'workers':>9}{'seconds':>11}{'speed-up':>10}"
+    print(header)
+    print("-" * len(header))
+    for label, data in inputs.items():
+        disable_parallel_validation()
+        baseline = _best_of(args.repeat, lambda: validator(data, "xs"))
+        print(f"{label:<14}{'-':>9}{baseline:>11.3f}{1:>10.2f}")
+        for workers in range(1, args.max_workers + 1):
+            enable_parallel_validation(
+                workers=workers, threshold=1, executor=args.executor
+            )
+            validator(data, "xs")
+            seconds = _best_of(args.repeat, lambda: validator(data, "xs"))
+            print(
+                f"{label:<14}{workers:>9}{seconds:>11.3f}"
+                f"{baseline / seconds:>10.2f}"
+            )
+    disable_parallel_validation()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Per-worker memory of a pre-forking server with and without
+`func_validator.warmup`.
+
+Run with::
+
+    python -m benchmarks.prefork_rss [--functions N] [--workers N]
+
+A parent process imports a module with many decorated functions and
+forks workers that each call every function once. Without warm-up each
+worker builds its own validation plans; with warm-up (and `gc.freeze`)
+the plans built by the parent are shared copy-on-write. Each worker
+reports its RSS and its private (unshared) memory. Linux only.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import types
+
+import func_validator
+
+MODULE_NAME = "_prefork_bench_models"
+
+FUNCTION_TEMPLATE = """
+@validate_params
+def handler_{i}(
+    a: Annotated[int, MustBePositive()],
+    b: Annotated[float, MustBeBetween(min_value=0, max_value=100)],
+    c: Annotated[str, MustBeMemberOf(("x", "y", "z"))],
+    d: Annotated[list, MustHaveLengthLessThanOrEqual(10)],
+):
+    return a
+"""
+
+
+def _build_module(functions: int) -> types.ModuleType:
+    source = (
+        "from typing import Annotated\n"
+        "from func_validator import (MustBeBetween, MustBeMemberOf,\n"
+        "    MustBePositive, MustHaveLengthLessThanOrEqual, validate_params)\n"
+    ) + "".join(FUNCTION_TEMPLATE.format(i=i) for i in range(functions))
+    module = types.ModuleType(MODULE_NAME)
+    exec(source, vars(module))
+    sys.modules[MODULE_NAME] = module
+    return module
+
+
+def _memory_kib() -> dict[str, int]:
+    with open("/proc/self/status") as f:
+        status = dict(line.split(":", 1) for line in f)
+    with open("/proc/self/smaps_rollup") as f:
+        rollup = dict(line.split(":", 1) for line in f if ":" in line)
+    return {
+        "rss_kib": int(status["VmRSS"].split()[0]),
+        "private_kib": int(rollup["Private_Clean"].split()[0])
+        + int(rollup["Private_Dirty"].split()[0]),
+    }
+
+
+def _worker(module: types.ModuleType, functions: int, write_fd: int):
+    for i in range(functions):
+        getattr(module, f"handler_{i}")(1, 2.0, "x", [])
+    gc.collect()
+    os.write(write_fd, json.dumps(_memory_kib()).encode())
+    os._exit(0)
+
+
+def _run(functions: int, workers: int, warm: bool) -> list[dict[str, int]]:
+    module = _build_module(functions)
+    if warm:
+        func_validator.warmup([module])
+
+    results = []
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            _worker(module, functions, write_fd)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as f:
+            results.append(json.loads(f.read()))
+        os.waitpid(pid, 0)
+
+    if warm:
+        gc.unfreeze()
+    del sys.modules[MODULE_NAME]
+    return results
+
+
+def _fork_and_run(functions: int, workers: int, warm: bool):
+    # Each scenario starts from a fresh parent, so that plans built by the
+    # first scenario do not leak into the second.
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        results = _run(functions, workers, warm)
+        os.write(write_fd, json.dumps(results).encode())
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        results = json.loads(f.read())
+    os.waitpid(pid, 0)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=5_000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    if not sys.platform.startswith("linux"):
+        raise SystemExit("This benchmark needs /proc (Linux).")
+
+    header = (
+        f"{'scenario':<12}{'worker':>8}{'RSS (KiB)':>14}"
+        f"{'private (KiB)':>16}"
+    )
+    print(header)
+    print("-" * len(header))
+    for label, warm in (("cold", False), ("warmup", True)):
+        results = _fork_and_run(args.functions, args.workers, warm)
+        for i, mem in enumerate(results):
+            print(
+                f"{label:<12}{i:>8}{mem['rss_kib']:>14,}"
+                f"{mem['private_kib']:>16,}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Cost of `MustHaveUniqueValues` with the number of values.
+
+Run with::
+
+    python -m benchmarks.unique_values [--max-size N]
+
+For sizes from 10**3 to `--max-size` (10**7 by default), times the check
+of unique ints, of ints whose only duplicate is the last value, of
+unhashable values (one-item lists, sorted) and, if NumPy is installed,
+of an int64 array. The quadratic loop such checks are often written as
+is timed too, up to 10**4 values.
+"""
+
+import argparse
+import time
+
+from func_validator import MustHaveUniqueValues, ValidationError
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+#: Largest size the quadratic and the unhashable inputs are timed at.
+QUADRATIC_MAX_SIZE = 10_000
+UNHASHABLE_MAX_SIZE = 1_000_000
+
+
+def _naive(values, arg_name):
+    for i, value in enumerate(values):
+        if value in values[i + 1 :]:
+            raise ValidationError(f"{arg_name} has duplicates.")
+
+
+def _seconds(check, values) -> float:
+    start = time.perf_counter()
+    try:
+        check(values, "xs")
+    except ValidationError:
+        pass
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-size", type=int, default=10**7)
+    args = parser.parse_args(argv)
+
+    validator = MustHaveUniqueValues()
+    header = f"{'input':<22}{'size':>12}{'seconds':>11}{'ns/value':>10}"
+    print(header)
+    print("-" * len(header))
+    size = 1_000
+    while size <= args.max_size:
+        ints = list(range(size))
+        inputs = {
+            "unique ints": (validator, ints),
+            "last is duplicate": (validator, ints[:-1] + [0]),
+        }
+        if size <= UNHASHABLE_MAX_SIZE:
+            lists = [[i] for i in range(size)]
+            inputs["unique lists"] = (validator, lists)
+        if np is not None:
+            inputs["int64 array"] = (validator, np.arange(size))
+        if size <= QUADRATIC_MAX_SIZE:
+            inputs["quadratic loop"] = (_naive, ints)
+        for label, (check, values) in inputs.items():
+            seconds = _seconds(check, values)
+            print(
+                f"{label:<22}{size:>12,}{seconds:>11.4f}"
+                f"{seconds / size * 1e9:>10.1f}"
+            )
+        size *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,111 @@
+"""Names are resolved lazily (PEP 562) so that `import func_validator`
+only pays for the validator families that are actually used.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from . import validators
-from ._func_arg_validator import validate_params
-from .validators import *
+
+if TYPE_CHECKING:
+    from ._class_validator import Validated, validate_class
+    from ._cursor import validate_cursor
+    from ._dataclass_validator import validated_dataclass
+    from ._func_arg_validator import compile_all, validate_params
+    from ._instrumentation import (
+        disable_instrumentation,
+        enable_instrumentation,
+        reset_stats,
+        stats,
+    )
+    from ._parallel import (
+        disable_parallel_validation,
+        enable_parallel_validation,
+    )
+    from ._proof import Certified, ValidationSpec
+    from ._records import RecordFailure, validate_records
+    from ._shadow import (
+        SHADOW_QUEUE_SIZE,
+        flush_shadow_queue,
+        set_shadow_queue_size,
+    )
+    from ._trust import IMMUTABLE_TYPES, trusted_context
+    from ._validated_collections import (
+        ValidatedDict,
+        ValidatedList,
+        ValidatedSet,
+    )
+    from ._warmup import warmup
+    from .validators import *
 
 __version__ = "1.5.0"
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "validate_params": "._func_arg_validator",
+    "validate_class": "._class_validator",
+    "Validated": "._class_validator",
+    "validated_dataclass": "._dataclass_validator",
+    "validate_cursor": "._cursor",
+    "compile_all": "._func_arg_validator",
+    "disable_instrumentation": "._instrumentation",
+    "enable_instrumentation": "._instrumentation",
+    "reset_stats": "._instrumentation",
+    "stats": "._instrumentation",
+    "warmup": "._warmup",
+    "trusted_context": "._trust",
+    "IMMUTABLE_TYPES": "._trust",
+    "enable_parallel_validation": "._parallel",
+    "disable_parallel_validation": "._parallel",
+    "Certified": "._proof",
+    "ValidationSpec": "._proof",
+    "RecordFailure": "._records",
+    "validate_records": "._records",
+    "SHADOW_QUEUE_SIZE": "._shadow",
+    "flush_shadow_queue": "._shadow",
+    "set_shadow_queue_size": "._shadow",
+    "ValidatedDict": "._validated_collections",
+    "ValidatedList": "._validated_collections",
+    "ValidatedSet": "._validated_collections",
+    **{name: ".validators" for name in validators.__all__},
+}
+
+__all__ = [
+    "validate_params",
+    "validate_class",
+    "Validated",
+    "validated_dataclass",
+    "compile_all",
+    "disable_instrumentation",
+    "enable_instrumentation",
+    "reset_stats",
+    "stats",
+    "warmup",
+    "trusted_context",
+    "IMMUTABLE_TYPES",
+    "enable_parallel_validation",
+    "disable_parallel_validation",
+    "Certified",
+    "ValidationSpec",
+    "RecordFailure",
+    "validate_records",
+    "validate_cursor",
+    "SHADOW_QUEUE_SIZE",
+    "flush_shadow_queue",
+    "set_shadow_queue_size",
+    "ValidatedDict",
+    "ValidatedList",
+    "ValidatedSet",
+    *validators.__all__,
+]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
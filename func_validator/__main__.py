@@ -0,0 +1,252 @@
+"""Command line interface of func_validator.
+
+Usage::
+
+    python -m func_validator validate module:function data.jsonl
+    python -m func_validator validate module:function data.csv \\
+        --rejects bad.jsonl --workers 4
+
+`validate` checks every row of a JSON Lines or CSV file against the
+annotated parameters of a function decorated with `validate_params`,
+used as the schema of a row: keys (or CSV columns) are parameter names.
+The function itself is not called. The file is streamed in chunks of
+rows, so memory use does not depend on its size, and with `--workers`
+the chunks are checked by as many processes.
+
+Rejected rows are written, in order, to a JSON Lines reject file, one
+object per row: `{"line": ..., "row": ..., "errors": [...]}`, each error
+giving the argument, the validator and the message. The exit status is
+1 if any row was rejected.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from itertools import islice
+from typing import Iterator, Optional, TextIO
+
+from ._rows import RowChecker, _error, load_function
+
+__all__ = ["main"]
+
+#: Default number of rows per chunk.
+CHUNK_ROWS = 1_000
+
+_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+#: Row checker of a worker process, see `_init_worker`.
+_CHECKER: Optional[RowChecker] = None
+
+
+def _read_rows(file: TextIO, fmt: str) -> Iterator[tuple[int, object]]:
+    """Yields `(line, row)` pairs: JSON Lines rows are left unparsed,
+    so that parsing is spread over the workers too.
+    """
+    if fmt == "jsonl":
+        for line_no, line in enumerate(file, 1):
+            if line.strip():
+                yield line_no, line
+        return
+
+    reader = csv.DictReader(file)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def _check_chunk(
+    checker: RowChecker, chunk: list[tuple[int, object]]
+) -> list[dict]:
+    """Returns the reject records of the rows of `chunk`."""
+    rejects = []
+    for line_no, row in chunk:
+        if isinstance(row, str):
+            try:
+                row = json.loads(row)
+            except ValueError as exc:
+                errors = [_error(None, None, f"Invalid JSON: {exc}.")]
+                rejects.append(_reject(line_no, row.rstrip("\n"), errors))
+                continue
+            if not isinstance(row, dict):
+                errors = [_error(None, None, "Expected a JSON object.")]
+                rejects.append(_reject(line_no, row, errors))
+                continue
+        elif None in row:
+            # More CSV fields than columns.
+            message = f"Unexpected fields {row.pop(None)!r}."
+            errors = [_error(None, None, message)]
+            rejects.append(_reject(line_no, row, errors))
+            continue
+        errors = checker.check(row)
+        if errors:
+            rejects.append(_reject(line_no, row, errors))
+    return rejects
+
+
+def _reject(line_no: int, row: object, errors: list[dict]) -> dict:
+    return {"line": line_no, "row": row, "errors": errors}
+
+
+def _init_worker(target: str, parse_text: bool) -> None:
+    global _CHECKER
+    _CHECKER = RowChecker(load_function(target), parse_text=parse_text)
+
+
+def _check_chunk_in_worker(chunk: list[tuple[int, object]]) -> list[dict]:
+    return _check_chunk(_CHECKER, chunk)
+
+
+def _chunks(rows: Iterator, size: int) -> Iterator[list]:
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def _checked_chunks(
+    opts: argparse.Namespace, rows: Iterator, parse_text: bool
+) -> Iterator[tuple[int, list[dict]]]:
+    """Yields the number of rows and the reject records of each chunk,
+    in order.
+    """
+    if opts.workers <= 1:
+        checker = RowChecker(load_function(opts.target), parse_text=parse_text)
+        for chunk in _chunks(rows, opts.chunk_rows):
+            yield len(chunk), _check_chunk(checker, chunk)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        opts.workers,
+        initializer=_init_worker,
+        initargs=(opts.target, parse_text),
+    ) as pool:
+        # A bounded number of chunks is in flight, so memory use does
+        # not depend on the size of the file.
+        pending = deque()
+        for chunk in _chunks(rows, opts.chunk_rows):
+            if len(pending) >= 2 * opts.workers:
+                size, future = pending.popleft()
+                yield size, future.result()
+            pending.append(
+                (len(chunk), pool.submit(_check_chunk_in_worker, chunk))
+            )
+        while pending:
+            size, future = pending.popleft()
+            yield size, future.result()
+
+
+def _validate_file(
+    opts: argparse.Namespace, fmt: str, rejects_path: str
+) -> tuple[int, int]:
+    """Returns the numbers of rows checked and rejected."""
+    try:
+        # Fail early, before any file is opened.
+        RowChecker(load_function(opts.target))
+        data = (
+            sys.stdin
+            if opts.data == "-"
+            else open(opts.data, newline="", encoding=opts.encoding)
+        )
+    except (AttributeError, ImportError, OSError, TypeError, ValueError) as e:
+        raise SystemExit(f"error: {e}") from e
+
+    rows_count = rejected = 0
+    try:
+        with open(rejects_path, "w", encoding="utf-8") as rejects_file:
+            rows = _read_rows(data, fmt)
+            for size, rejects in _checked_chunks(opts, rows, fmt == "csv"):
+                rows_count += size
+                rejected += len(rejects)
+                for reject in rejects:
+                    rejects_file.write(json.dumps(reject, default=repr))
+                    rejects_file.write("\n")
+    finally:
+        if data is not sys.stdin:
+            data.close()
+    return rows_count, rejected
+
+
+def _validate(opts: argparse.Namespace, out: TextIO) -> int:
+    fmt = opts.format
+    if fmt is None:
+        fmt = _FORMATS.get(os.path.splitext(opts.data)[1].lower())
+        if fmt is None:
+            raise SystemExit(
+                f"Can not tell the format of {opts.data!r}, use --format."
+            )
+    rejects_path = opts.rejects
+    if rejects_path is None:
+        base = "stdin" if opts.data == "-" else opts.data
+        rejects_path = f"{base}.rejects.jsonl"
+
+    # The current directory is importable, as with `python -m`.
+    saved_path = sys.path[:]
+    sys.path.insert(0, os.getcwd())
+    try:
+        rows_count, rejected = _validate_file(opts, fmt, rejects_path)
+    finally:
+        sys.path[:] = saved_path
+
+    print(
+        f"{rows_count} rows checked, {rejected} rejected"
+        + (f" (see {rejects_path})" if rejected else "")
+        + ".",
+        file=out,
+    )
+    return 1 if rejected else 0
+
+
+def main(argv: Optional[list[str]] = None, out: TextIO = sys.stdout) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m func_validator",
+        description=__doc__.split("\n\n")[0],
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate = commands.add_parser(
+        "validate",
+        help="Validate the rows of a JSON Lines or CSV file.",
+        description=__doc__.split("\n\n")[2].replace("\n", " "),
+    )
+    validate.add_argument(
+        "target", help="Decorated function, as module:function."
+    )
+    validate.add_argument("data", help="Data file, or - for stdin.")
+    validate.add_argument(
+        "--format",
+        choices=("csv", "jsonl"),
+        default=None,
+        help="Format of the data. Default: from the file extension.",
+    )
+    validate.add_argument(
+        "--rejects",
+        default=None,
+        help="Reject file. Default: DATA.rejects.jsonl.",
+    )
+    validate.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes checking chunks of rows. Default: 1.",
+    )
+    validate.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=CHUNK_ROWS,
+        help=f"Number of rows per chunk. Default: {CHUNK_ROWS}.",
+    )
+    validate.add_argument(
+        "--encoding", default="utf-8", help="Encoding of the data file."
+    )
+    opts = parser.parse_args(argv)
+    if opts.workers < 1:
+        parser.error("--workers must be a positive integer.")
+    if opts.chunk_rows < 1:
+        parser.error("--chunk-rows must be positive.")
+    return _validate(opts, out)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
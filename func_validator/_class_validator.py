@@ -0,0 +1,202 @@
+from functools import partial
+from operator import attrgetter
+from types import FunctionType
+from typing import Callable, Optional, TypeVar, get_type_hints
+
+from ._func_arg_validator import (
+    _ArgPlan,
+    _build_arg_plan,
+    _decorate,
+)
+from .validators import DependsOn
+
+__all__ = ["Validated", "validate_class"]
+
+C = TypeVar("C", bound=type)
+
+#: Dunder methods that `validate_class` decorates. Other dunder methods
+#: are protocol hooks whose arguments are not user input.
+VALIDATED_DUNDERS = frozenset({"__init__", "__new__", "__call__"})
+
+
+class Validated(property):
+    """Class attribute validated, on assignment, with the validators of
+    its `typing.Annotated` annotation.
+
+    The value is kept in a separate storage attribute (a slot when the
+    class is decorated with `validate_class(slots=True)`) and is read
+    back through `operator.attrgetter`, so reading a validated attribute
+    costs no Python-level call. `DependsOn` validators see the other
+    attributes of the instance.
+
+    ```python
+    @validate_class(slots=True)
+    class Rectangle:
+        width: Annotated[float, MustBePositive()] = Validated()
+        height: Annotated[float, MustBePositive()] = Validated()
+
+        def __init__(self, width: float, height: float):
+            self.width = width
+            self.height = height
+    ```
+    """
+
+    def __init__(self, *, check_type: bool = False) -> None:
+        """
+        :param check_type: If True, also checks that assigned values are
+                           instances of the annotated type.
+        """
+        super().__init__()
+        self.check_type = check_type
+        self.name: Optional[str] = None
+        self.storage_name: Optional[str] = None
+        self.owner: Optional[type] = None
+        self.arg_plan: Optional[_ArgPlan] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.owner = owner
+        self.storage_name = f"_validated_{name}"
+        property.__init__(self, attrgetter(self.storage_name), self._set)
+
+    def _compile(self) -> _ArgPlan:
+        # Resolved on first assignment, for the same reasons plans of
+        # functions are built on their first call.
+        annotation = get_type_hints(self.owner, include_extras=True).get(
+            self.name
+        )
+        self.arg_plan = _build_arg_plan(
+            self.name, annotation, self.check_type
+        ) or _ArgPlan(self.name, (), (), ())
+        return self.arg_plan
+
+    def _set(self, instance: object, value: object) -> None:
+        arg_plan = self.arg_plan or self._compile()
+        if value is None:
+            validators = arg_plan.validators_if_none
+        else:
+            validators = arg_plan.validators
+
+        if validators:
+            arguments = {"self": instance}
+            for validator in validators:
+                if isinstance(validator, DependsOn):
+                    validator.arguments = arguments
+                validator(value, self.name)
+
+        object.__setattr__(instance, self.storage_name, value)
+
+
+def _fix_class_cells(member: object, old_cls: type, new_cls: type):
+    # Zero-argument super() reads the class from the `__class__` cell,
+    # which still points at the class that was replaced.
+    if isinstance(member, (staticmethod, classmethod)):
+        member = member.__func__
+    if isinstance(member, property):
+        for accessor in (member.fget, member.fset, member.fdel):
+            _fix_class_cells(accessor, old_cls, new_cls)
+        return
+    if not isinstance(member, FunctionType) or not member.__closure__:
+        return
+    for name, cell in zip(member.__code__.co_freevars, member.__closure__):
+        if name == "__class__" and cell.cell_contents is old_cls:
+            cell.cell_contents = new_cls
+
+
+def _add_slots(cls: C) -> C:
+    storage = tuple(
+        member.storage_name
+        for member in vars(cls).values()
+        if isinstance(member, Validated)
+    )
+    user_slots = cls.__dict__.get("__slots__", ())
+    if isinstance(user_slots, str):
+        user_slots = (user_slots,)
+
+    cls_dict = dict(cls.__dict__)
+    for name in (*user_slots, "__dict__", "__weakref__"):
+        cls_dict.pop(name, None)
+    cls_dict["__slots__"] = (*user_slots, *storage)
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    for member in cls_dict.values():
+        _fix_class_cells(member, cls, new_cls)
+    return new_cls
+
+
+def _validate_methods(
+    cls: C, check_arg_types: bool, instrument: Optional[bool]
+) -> None:
+    for name, member in list(vars(cls).items()):
+        if (
+            name.startswith("__")
+            and name.endswith("__")
+            and name not in VALIDATED_DUNDERS
+        ):
+            continue
+
+        wrapper_type = None
+        fn = member
+        if isinstance(member, (staticmethod, classmethod)):
+            wrapper_type = type(member)
+            fn = member.__func__
+        if not isinstance(fn, FunctionType):
+            continue
+
+        plan = getattr(fn, "__validation_plan__", None)
+        if plan is None:
+            fn = _decorate(fn, check_arg_types, instrument)
+            plan = fn.__validation_plan__
+            setattr(cls, name, wrapper_type(fn) if wrapper_type else fn)
+        if plan.owner is None:
+            plan.owner = cls
+
+
+def validate_class(
+    cls: Optional[C] = None,
+    /,
+    *,
+    check_arg_types: bool = False,
+    instrument: Optional[bool] = None,
+    slots: bool = False,
+) -> C | Callable[[C], C]:
+    """Class decorator that applies `validate_params` to every method
+    defined in the class body, static and class methods included. Dunder
+    methods other than `__init__`, `__new__` and `__call__` are left
+    alone, and so are methods that are already decorated.
+
+    Annotations of the methods are resolved against the class namespace
+    as well as the module, so they may refer to the class itself and to
+    names defined in its body.
+
+    :param cls: The class to decorate. If None, the decorator is
+                returned for later application. Default is None.
+    :param check_arg_types: If True, checks that all argument types
+                            match. Default is False.
+    :param instrument: See `validate_params`. Default is None.
+    :param slots: If True, the class is re-created with `__slots__`
+                  holding the values of its `Validated` attributes (and
+                  any slots it already declares), like
+                  `dataclasses.dataclass(slots=True)`. Default is False.
+
+    :raises TypeError: If `cls` is not a class or None.
+
+    :return: The decorated class, or the decorator itself if `cls` is
+             None.
+    """
+    if cls is None:
+        return partial(
+            validate_class,
+            check_arg_types=check_arg_types,
+            instrument=instrument,
+            slots=slots,
+        )
+
+    if not isinstance(cls, type):
+        raise TypeError("The first argument must be a class or None.")
+
+    if slots:
+        cls = _add_slots(cls)
+    _validate_methods(cls, check_arg_types, instrument)
+    return cls
@@ -0,0 +1,279 @@
+"""Validation of the rows of a DB-API 2.0 cursor.
+
+Rows are fetched `batch_size` at a time with `fetchmany` and every
+batch is checked a column at a time: each validator runs over the
+values of its column in one tight loop, rather than every validator of
+every column for each row in turn. Memory use is bounded by the size of
+a batch, whatever the size of the result set.
+"""
+
+from typing import (
+    Any,
+    Callable,
+    Final,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Sequence,
+    Union,
+)
+
+from ._func_arg_validator import _ArgPlan, _build_arg_plan
+from ._rows import RowError, _error
+from .validators import DependsOn, ValidationError, Validator
+
+__all__ = ["BATCH_ROWS", "validate_cursor"]
+
+#: Default number of rows fetched at a time.
+BATCH_ROWS: Final[int] = 1_000
+
+#: A function decorated with `validate_params`, or a mapping of column
+#: names to `Annotated` types.
+Schema = Union[Callable, Mapping[str, Any]]
+
+_NO_COLUMN: Final[int] = -1
+
+
+class _Column(NamedTuple):
+    plan: _ArgPlan
+    #: Index of the column in a row, or `_NO_COLUMN` if the result set
+    #: does not have it and `default` is used instead.
+    index: int
+    default: Any
+    #: For each of `plan.validators`, whether it runs on None.
+    runs_if_none: tuple[bool, ...]
+
+
+def _schema_plans(
+    schema: Schema, check_arg_types: bool
+) -> tuple[tuple[_ArgPlan, ...], dict[str, Any]]:
+    """Returns the plans of the columns of `schema` and the defaults of
+    the columns that may be left out of the result set.
+
+    :raises TypeError: If `schema` is neither a decorated function nor a
+                       mapping.
+    """
+    if isinstance(schema, Mapping):
+        arg_plans = []
+        for name, annotation in schema.items():
+            arg_plan = _build_arg_plan(name, annotation, check_arg_types)
+            if arg_plan is not None:
+                arg_plans.append(arg_plan)
+        return tuple(arg_plans), {}
+
+    plan = getattr(schema, "__validation_plan__", None)
+    if plan is None:
+        raise TypeError(
+            f"{getattr(schema, '__qualname__', schema)!r} is neither a "
+            "mapping nor a function decorated with validate_params."
+        )
+    plan = plan.compile()
+    defaults = {
+        param.name: param.default
+        for param in plan.signature.parameters.values()
+        if param.default is not param.empty
+    }
+    if plan.var_keyword is not None:
+        defaults[plan.var_keyword] = {}
+    return plan.arg_plans, defaults
+
+
+def _plan_columns(
+    arg_plans: Sequence[_ArgPlan],
+    defaults: dict[str, Any],
+    names: list[str],
+) -> list[_Column]:
+    columns = []
+    for arg_plan in arg_plans:
+        if arg_plan.name in names:
+            index, default = names.index(arg_plan.name), None
+        elif arg_plan.name in defaults:
+            index, default = _NO_COLUMN, defaults[arg_plan.name]
+        else:
+            raise ValueError(
+                f"Column {arg_plan.name!r} is not in the result set, "
+                f"whose columns are {names!r}."
+            )
+        if_none = set(map(id, arg_plan.validators_if_none))
+        columns.append(
+            _Column(
+                arg_plan,
+                index,
+                default,
+                tuple(id(v) in if_none for v in arg_plan.validators),
+            )
+        )
+    return columns
+
+
+def _check_batch(
+    columns: list[_Column],
+    names: list[str],
+    defaults: dict[str, Any],
+    rows: Sequence[Sequence],
+) -> dict[int, list[RowError]]:
+    """Returns the errors of the invalid rows of a batch, by index: the
+    first failing validator of every column.
+    """
+    errors: dict[int, list[RowError]] = {}
+    for column in columns:
+        arg_name = column.plan.name
+        if column.index == _NO_COLUMN:
+            values = [column.default] * len(rows)
+        else:
+            index = column.index
+            values = [row[index] for row in rows]
+        nones = {i for i, value in enumerate(values) if value is None}
+        # Rows are only checked until a validator of the column fails.
+        failed: set[int] = set()
+
+        for validator, runs_if_none in zip(
+            column.plan.validators, column.runs_if_none
+        ):
+            skipped = failed if runs_if_none else failed | nones
+            if isinstance(validator, DependsOn):
+                _check_depends_on(
+                    validator,
+                    arg_name,
+                    values,
+                    skipped,
+                    rows,
+                    names,
+                    defaults,
+                    failed,
+                    errors,
+                )
+                continue
+            if not skipped:
+                # Fast path: a bare loop over the column.
+                try:
+                    for value in values:
+                        validator(value, arg_name)
+                    continue
+                except (ValidationError, TypeError):
+                    pass
+            for i, value in enumerate(values):
+                if i in skipped:
+                    continue
+                try:
+                    validator(value, arg_name)
+                except (ValidationError, TypeError) as exc:
+                    _fail(errors, failed, i, arg_name, validator, exc)
+    return errors
+
+
+def _check_depends_on(
+    validator: DependsOn,
+    arg_name: str,
+    values: list,
+    skipped: set[int],
+    rows: Sequence[Sequence],
+    names: list[str],
+    defaults: dict[str, Any],
+    failed: set[int],
+    errors: dict[int, list[RowError]],
+) -> None:
+    """Checks a column with a `DependsOn`, which needs the other values
+    of each row.
+    """
+    for i, value in enumerate(values):
+        if i in skipped:
+            continue
+        validator.arguments = {**defaults, **dict(zip(names, rows[i]))}
+        try:
+            validator(value, arg_name)
+        except (ValidationError, TypeError) as exc:
+            _fail(errors, failed, i, arg_name, validator, exc)
+
+
+def _fail(
+    errors: dict[int, list[RowError]],
+    failed: set[int],
+    i: int,
+    arg_name: str,
+    validator: Validator,
+    exc: Exception,
+) -> None:
+    failed.add(i)
+    errors.setdefault(i, []).append(
+        _error(arg_name, type(validator).__name__, str(exc))
+    )
+
+
+def _iter_rows(
+    cursor,
+    columns: list[_Column],
+    names: list[str],
+    defaults: dict[str, Any],
+    batch_size: int,
+    with_errors: bool,
+) -> Iterator:
+    fetchmany = cursor.fetchmany
+    while rows := fetchmany(batch_size):
+        errors = _check_batch(columns, names, defaults, rows)
+        if with_errors:
+            for i, row in enumerate(rows):
+                yield row, errors.get(i, [])
+        elif not errors:
+            yield from rows
+        else:
+            for i, row in enumerate(rows):
+                if i not in errors:
+                    yield row
+
+
+def validate_cursor(
+    cursor,
+    schema: Schema,
+    *,
+    batch_size: int = BATCH_ROWS,
+    with_errors: bool = False,
+    check_arg_types: bool = False,
+) -> Iterator[Union[Sequence, tuple[Sequence, list[RowError]]]]:
+    """Validates the rows of the result set of a DB-API 2.0 cursor,
+    fetching them `batch_size` at a time.
+
+    ```python
+    cursor.execute("SELECT id, price, side FROM trades")
+    for row in validate_cursor(cursor, trade):
+        process(row)
+    ```
+
+    :param cursor: A cursor on which a query was executed. Its columns
+                   are named by `cursor.description`.
+    :param schema: A function decorated with `validate_params`, whose
+                   parameters name the columns (those with a default
+                   may be left out of the result set; the function is
+                   not called), or a mapping of column names to
+                   `Annotated` types.
+    :param batch_size: Number of rows fetched at a time. Default is
+                       `BATCH_ROWS`.
+    :param with_errors: If True, every row is yielded, as a
+                        `(row, errors)` pair, where `errors` lists the
+                        first failing validator of each column (and is
+                        empty if the row is valid). Default is False:
+                        only valid rows are yielded.
+    :param check_arg_types: Whether the columns of a mapping schema are
+                            checked against their annotated type. A
+                            function schema uses its own setting.
+                            Default is False.
+
+    :raises TypeError: If `schema` is neither a mapping nor a decorated
+                       function.
+    :raises ValueError: If no query was executed on `cursor`, the result
+                        set lacks a column of `schema` or `batch_size`
+                        is not positive.
+
+    :return: An iterator over the valid rows, or over `(row, errors)`
+             pairs.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive.")
+    arg_plans, defaults = _schema_plans(schema, check_arg_types)
+    if cursor.description is None:
+        raise ValueError("No query was executed on the cursor.")
+    names = [column[0] for column in cursor.description]
+    columns = _plan_columns(arg_plans, defaults, names)
+    return _iter_rows(
+        cursor, columns, names, defaults, batch_size, with_errors
+    )
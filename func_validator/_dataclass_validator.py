@@ -0,0 +1,138 @@
+import dataclasses
+from functools import partial
+from typing import Callable, Optional, TypeVar, get_type_hints
+
+from ._func_arg_validator import _build_arg_plan
+from .validators import DependsOn
+
+__all__ = ["validated_dataclass"]
+
+C = TypeVar("C", bound=type)
+
+
+def _user_post_init(cls: type) -> Optional[Callable]:
+    post_init = getattr(cls, "__post_init__", None)
+    # Validation hooks of validated base classes are not user code.
+    return getattr(post_init, "__user_post_init__", post_init)
+
+
+def _generate_post_init(cls: type, check_arg_types: bool) -> Callable:
+    """Generates the `__post_init__` that validates every init field of
+    the dataclass `cls`, with one direct call per validator.
+    """
+    type_hints = get_type_hints(cls, include_extras=True)
+    user_post_init = _user_post_init(cls)
+    namespace = {
+        "_user_post_init": user_post_init,
+    }
+    body: list[str] = []
+    field_lines: list[str] = []
+    depends_on: list[str] = []
+
+    def calls(validators, arg_name: str, indent: str) -> list[str]:
+        lines = []
+        for validator in validators:
+            ref = f"_v{len(namespace)}"
+            namespace[ref] = validator
+            if isinstance(validator, DependsOn):
+                depends_on.append(ref)
+            lines.append(f"{indent}{ref}(value, {arg_name!r})")
+        return lines or [f"{indent}pass"]
+
+    init_fields = [f for f in dataclasses.fields(cls) if f.init]
+    for f in init_fields:
+        arg_plan = _build_arg_plan(
+            f.name, type_hints.get(f.name), check_arg_types
+        )
+        if arg_plan is None or not arg_plan.validators:
+            continue
+
+        field_lines.append(f"    value = self.{f.name}")
+        if arg_plan.validators_if_none == arg_plan.validators:
+            field_lines += calls(arg_plan.validators, f.name, "    ")
+        else:
+            field_lines.append("    if value is None:")
+            field_lines += calls(arg_plan.validators_if_none, f.name, " " * 8)
+            field_lines.append("    else:")
+            field_lines += calls(arg_plan.validators, f.name, " " * 8)
+
+    if depends_on:
+        items = ", ".join(f"{f.name!r}: self.{f.name}" for f in init_fields)
+        body.append(f"    arguments = {{'self': self, {items}}}")
+        body += [f"    {ref}.arguments = arguments" for ref in depends_on]
+    body += field_lines
+    if user_post_init is not None:
+        body.append("    _user_post_init(self, *initvars)")
+
+    source = "def __post_init__(self, *initvars):\n" + "\n".join(
+        body or ["    pass"]
+    )
+    exec(source, namespace)
+    post_init = namespace["__post_init__"]
+    post_init.__qualname__ = f"{cls.__qualname__}.__post_init__"
+    post_init.__user_post_init__ = user_post_init
+    return post_init
+
+
+def validated_dataclass(
+    cls: Optional[C] = None,
+    /,
+    *,
+    check_arg_types: bool = False,
+    **dataclass_kwargs,
+) -> C | Callable[[C], C]:
+    """Creates a dataclass whose fields are validated, on construction,
+    with the validators of their `typing.Annotated` annotations.
+
+    The generated `__init__` of `dataclasses.dataclass` is kept (so
+    defaults, `default_factory`, `frozen`, `kw_only`, `slots` and
+    `InitVar` behave as usual) and calls a generated `__post_init__` in
+    which every validator is a direct call on the field value. Unlike
+    wrapping `__init__` with `validate_params`, no `Signature.bind` runs
+    per instance. A `__post_init__` defined on the class still runs, once
+    the fields are validated.
+
+    The validation code is generated on the first instantiation, so
+    annotations may contain forward references.
+
+    ```python
+    @validated_dataclass(frozen=True, slots=True)
+    class Point:
+        x: Annotated[float, MustBeNonNegative()]
+        y: Annotated[float, MustBeNonNegative()] = 0.0
+    ```
+
+    :param cls: The class to decorate. If None, the decorator is
+                returned for later application. Default is None.
+    :param check_arg_types: If True, checks that all field types match.
+                            Default is False.
+    :param dataclass_kwargs: Passed on to `dataclasses.dataclass`.
+
+    :raises TypeError: If `cls` is not a class or None.
+
+    :return: The dataclass, or the decorator itself if `cls` is None.
+    """
+    if cls is None:
+        return partial(
+            validated_dataclass,
+            check_arg_types=check_arg_types,
+            **dataclass_kwargs,
+        )
+
+    if not isinstance(cls, type):
+        raise TypeError("The first argument must be a class or None.")
+
+    # dataclass() only makes __init__ call __post_init__ if it exists when
+    # the class is processed, so a placeholder that generates the real
+    # hook on first use is installed first.
+    owner: list[type] = []
+
+    def __post_init__(self, *initvars):
+        post_init = _generate_post_init(owner[0], check_arg_types)
+        owner[0].__post_init__ = post_init
+        post_init(self, *initvars)
+
+    __post_init__.__user_post_init__ = _user_post_init(cls)
+    cls.__post_init__ = __post_init__
+    owner.append(dataclasses.dataclass(cls, **dataclass_kwargs))
+    return owner[0]
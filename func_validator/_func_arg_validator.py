@@ -1,8 +1,16 @@
 import inspect
+import sys
+import weakref
 from functools import partial, wraps
+from time import perf_counter
 from typing import (
     Annotated,
     Callable,
+    Hashable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Optional,
     ParamSpec,
     TypeAlias,
     TypeVar,
@@ -12,7 +20,34 @@ from typing import (
     get_type_hints,
 )
 
-from .validators import DependsOn, MustBeA, Validator
+from ._identity_cache import IdentityCache, VersionOf
+from ._instrumentation import get_function_stats, is_instrumentation_enabled
+from ._proof import (
+    _PROOF_CARRIERS,
+    _PROOFS,
+    Certified,
+    _proven_keys,
+    _validator_key,
+)
+from ._result_cache import (
+    _MISSING,
+    RESULT_CACHE_SIZE,
+    ResultCache,
+    _raw_key,
+)
+from ._shadow import (
+    ShadowFailureHandler,
+    ShadowStats,
+    _log_failure,
+    shadow_queue,
+)
+from ._trust import _TRUSTED, IMMUTABLE_TYPES, _PassedChecks
+from .validators import DependsOn, MustBeA, ValidationError, Validator
+from .validators.combinators import AllOf, _merge_bounds
+from .validators.mapping_arg_validators import (
+    MustHaveValuesFor,
+    _typed_dict_of,
+)
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -20,8 +55,7 @@ T = TypeVar("T")
 DecoratorOrWrapper: TypeAlias = (
     Callable[[Callable[P, R]], Callable[P, R]] | Callable[P, R]
 )
-
-ALLOWED_OPTIONAL_VALUES = (None,)
+Mode = Literal["enforce", "shadow"]
 
 
 def _is_arg_type_optional(arg_type: T) -> bool:
@@ -31,58 +65,748 @@ def _is_arg_type_optional(arg_type: T) -> bool:
     return is_optional
 
 
+class _ArgPlan(NamedTuple):
+    """Validators of a single argument, in the order they run."""
+
+    name: str
+    validators: tuple[Validator, ...]
+    #: Validators that still run when an `Optional` argument is None.
+    validators_if_none: tuple[Validator, ...]
+    #: `_validator_key` of each of `validators`.
+    keys: tuple[Optional[Hashable], ...]
+
+
+def _build_arg_plan(
+    arg_name: str, arg_annotation: T, check_arg_types: bool
+) -> Optional[_ArgPlan]:
+    """Builds the plan of an argument (or attribute) from its annotation.
+    Returns None if the annotation carries no metadata.
+
+    :raises ValueError: If bounds of the argument are contradictory.
+    """
+    if get_origin(arg_annotation) is Annotated:
+        arg_type, *arg_validators = get_args(arg_annotation)
+    elif _typed_dict_of(arg_annotation) is not None:
+        arg_type, arg_validators = arg_annotation, []
+    else:
+        return None
+
+    validators = []
+    for v in arg_validators:
+        if isinstance(v, AllOf):
+            validators.extend(v.validators)
+        elif isinstance(v, Validator):
+            validators.append(v)
+    # Stacked bounds run as one comparison chain; contradictions surface
+    # here, when the plan is built, rather than on every call.
+    validators = _merge_bounds(validators, arg_name)
+
+    typed_dict = _typed_dict_of(arg_type)
+    if typed_dict is not None:
+        values_for = MustHaveValuesFor(typed_dict)
+        if values_for.plan.checks:
+            validators.append(values_for)
+        elif arg_type is arg_annotation:
+            # Like any plain annotation, a plain `TypedDict` whose fields
+            # carry no validators is left unchecked.
+            return None
+        # `TypedDict` classes do not support `isinstance`.
+        arg_type = Optional[dict] if arg_type is not typed_dict else dict
+    type_checkers = [MustBeA(arg_type)] if check_arg_types else []
+
+    if _is_arg_type_optional(arg_type):
+        validators_if_none = type_checkers + [
+            v for v in validators if isinstance(v, DependsOn)
+        ]
+    else:
+        validators_if_none = type_checkers + validators
+
+    validators = type_checkers + validators
+    return _ArgPlan(
+        arg_name,
+        tuple(validators),
+        tuple(validators_if_none),
+        tuple(map(_validator_key, validators)),
+    )
+
+
+def _owner_namespace(owner: Optional[type]) -> Optional[dict]:
+    if owner is None:
+        return None
+    return {owner.__name__: owner, **vars(owner)}
+
+
+class _ValidationPlan:
+    """Everything `validate_params` needs to validate a call to `fn`.
+
+    Building a plan resolves the annotations of `fn`, so it is deferred
+    to the first call (or to `compile_all`): forward references only
+    have to resolve by then, and decorating stays cheap.
+    """
+
+    __slots__ = (
+        "fn",
+        "check_arg_types",
+        "owner",
+        "signature",
+        "arg_plans",
+        "depends_on",
+        "var_positional",
+        "var_keyword",
+        "identity_cache",
+        "__weakref__",
+    )
+
+    def __init__(self, fn: Callable[P, R], check_arg_types: bool) -> None:
+        self.fn = fn
+        self.check_arg_types = check_arg_types
+        #: Class the function is a method of, if known. Names defined in
+        #: the class body are then visible to the annotations.
+        self.owner: Optional[type] = None
+        self.signature: Optional[inspect.Signature] = None
+        self.arg_plans: Optional[tuple[_ArgPlan, ...]] = None
+        self.depends_on: tuple[DependsOn, ...] = ()
+        #: Names of the `*args` and `**kwargs` parameters, if any.
+        self.var_positional: Optional[str] = None
+        self.var_keyword: Optional[str] = None
+        self.identity_cache: Optional[IdentityCache] = None
+
+    @property
+    def is_compiled(self) -> bool:
+        return self.arg_plans is not None
+
+    def compile(self) -> "_ValidationPlan":
+        if self.arg_plans is not None:
+            return self
+
+        func_type_hints = get_type_hints(
+            self.fn,
+            localns=_owner_namespace(self.owner),
+            include_extras=True,
+        )
+        func_type_hints.pop("return", None)
+
+        arg_plans = []
+        for arg_name, arg_annotation in func_type_hints.items():
+            arg_plan = _build_arg_plan(
+                arg_name, arg_annotation, self.check_arg_types
+            )
+            if arg_plan is not None:
+                arg_plans.append(arg_plan)
+
+        self.signature = _signature(self.fn)
+        for param in self.signature.parameters.values():
+            if param.kind is inspect.Parameter.VAR_POSITIONAL:
+                self.var_positional = param.name
+            elif param.kind is inspect.Parameter.VAR_KEYWORD:
+                self.var_keyword = param.name
+        self.depends_on = tuple(
+            v
+            for arg_plan in arg_plans
+            for v in arg_plan.validators
+            if isinstance(v, DependsOn)
+        )
+        self.arg_plans = tuple(arg_plans)
+        return self
+
+
+#: Plans of every function decorated so far, see `compile_all`.
+_PLANS: "weakref.WeakSet[_ValidationPlan]" = weakref.WeakSet()
+
+
+def _signature(fn: Callable[P, R]) -> inspect.Signature:
+    # Only the parameters are needed to bind arguments, so annotations
+    # must not be evaluated here (Python 3.14+ evaluates them by default).
+    if sys.version_info >= (3, 14):
+        from annotationlib import Format
+
+        return inspect.signature(fn, annotation_format=Format.FORWARDREF)
+    return inspect.signature(fn)
+
+
+#: Keys of the checks that certified argument values already passed,
+#: by argument name.
+_Proofs = dict[str, frozenset]
+
+
+def _collect_proofs(
+    plan: _ValidationPlan, arguments: dict
+) -> Optional[_Proofs]:
+    """Finds the argument values that carry a proof (see
+    `func_validator.ValidationSpec` and `func_validator.ValidatedList`) or
+    that the identity cache of the
+    plan remembers, and unwraps `Certified` values in `arguments` before
+    any validator (`DependsOn` included) sees them.
+
+    Returns None if no argument carries a proof and no `Certified` value
+    was unwrapped, i.e. if the function can be called with the arguments
+    as passed.
+    """
+    proofs = None
+    identity_cache = plan.identity_cache
+    for arg_plan in plan.arg_plans:
+        arg_name = arg_plan.name
+        arg_value = arguments[arg_name]
+        arg_type = type(arg_value)
+        if arg_type is Certified:
+            keys = arg_value.keys
+            arguments[arg_name] = arg_value.value
+        elif arg_type in _PROOF_CARRIERS:
+            keys = arg_value.validated_keys
+        elif id(arg_value) in _PROOFS:
+            keys = _proven_keys(arg_value)
+        elif identity_cache is not None:
+            keys = identity_cache.get(arg_name, arg_value)
+        else:
+            continue
+        if keys is None:
+            continue
+        if proofs is None:
+            proofs = {}
+        proofs[arg_name] = keys
+    if _unwrap_certified(plan, arguments) and proofs is None:
+        proofs = {}
+    return proofs
+
+
+def _unwrap_certified(plan: _ValidationPlan, arguments: dict) -> bool:
+    """Unwraps the `Certified` values left in `arguments`: those of
+    parameters without validators, and those passed through `*args` and
+    `**kwargs`. Their proofs are not used. Returns whether there were
+    any.
+    """
+    unwrapped = False
+    if Certified in map(type, arguments.values()):
+        for arg_name, arg_value in arguments.items():
+            if type(arg_value) is Certified:
+                arguments[arg_name] = arg_value.value
+        unwrapped = True
+    var_positional = plan.var_positional
+    if var_positional is not None:
+        values = arguments[var_positional]
+        if Certified in map(type, values):
+            arguments[var_positional] = tuple(
+                v.value if type(v) is Certified else v for v in values
+            )
+            unwrapped = True
+    var_keyword = plan.var_keyword
+    if var_keyword is not None:
+        values = arguments[var_keyword]
+        if Certified in map(type, values.values()):
+            arguments[var_keyword] = {
+                k: v.value if type(v) is Certified else v
+                for k, v in values.items()
+            }
+            unwrapped = True
+    return unwrapped
+
+
+def _remember_arguments(
+    plan: _ValidationPlan, arguments: dict, proofs: Optional[_Proofs]
+) -> None:
+    """Records, in the identity cache of the plan, the argument values
+    that just passed all their validators.
+    """
+    for arg_plan in plan.arg_plans:
+        arg_name = arg_plan.name
+        arg_value = arguments[arg_name]
+        if arg_value is None or (proofs is not None and arg_name in proofs):
+            continue
+        plan.identity_cache.remember(arg_name, arg_value, arg_plan.keys)
+
+
+def _unproven_validators(
+    arg_plan: _ArgPlan, proven: frozenset
+) -> tuple[Validator, ...]:
+    return tuple(
+        arg_validator
+        for arg_validator, key in zip(arg_plan.validators, arg_plan.keys)
+        if key is None or key not in proven
+    )
+
+
+def _iter_arg_validators(
+    plan: _ValidationPlan,
+    arguments: dict,
+    proofs: Optional[_Proofs] = None,
+    passed: Optional[_PassedChecks] = None,
+) -> Iterator[tuple[str, T, Validator]]:
+    """Yields `(arg_name, arg_value, validator)` for every validator that
+    must run on the bound `arguments`, in order, leaving out the checks
+    covered by `proofs` (see `_collect_proofs`).
+
+    With `passed` (see `_validate_arguments_trusted`), checks that
+    already passed are not yielded and resuming the iterator marks the
+    last yielded check as passed.
+    """
+    for dep_validator in plan.depends_on:
+        dep_validator.arguments = arguments
+
+    for arg_plan in plan.arg_plans:
+        arg_name = arg_plan.name
+        arg_value = arguments[arg_name]
+        # Not `in (None,)`: that compares with `==`, which is ambiguous
+        # (or raises) for values such as NumPy arrays.
+        if arg_value is None:
+            for arg_validator in arg_plan.validators_if_none:
+                yield arg_name, arg_value, arg_validator
+            continue
+
+        proven = proofs.get(arg_name) if proofs is not None else None
+        if passed is None or type(arg_value) not in IMMUTABLE_TYPES:
+            validators = arg_plan.validators
+            if proven is not None:
+                validators = _unproven_validators(arg_plan, proven)
+            for arg_validator in validators:
+                yield arg_name, arg_value, arg_validator
+            continue
+
+        entry = passed.get(id(arg_value))
+        if entry is None:
+            entry = passed[id(arg_value)] = (arg_value, set())
+        passed_keys = entry[1]
+        if proven is not None:
+            passed_keys |= proven
+        for arg_validator, key in zip(arg_plan.validators, arg_plan.keys):
+            if key is None or key not in passed_keys:
+                yield arg_name, arg_value, arg_validator
+                if key is not None:
+                    passed_keys.add(key)
+
+
+def _validate_arguments(
+    plan: _ValidationPlan, arguments: dict, proofs: Optional[_Proofs]
+) -> None:
+    for dep_validator in plan.depends_on:
+        dep_validator.arguments = arguments
+
+    for arg_plan in plan.arg_plans:
+        arg_name = arg_plan.name
+        arg_value = arguments[arg_name]
+        if arg_value is None:
+            validators = arg_plan.validators_if_none
+        elif proofs is not None and arg_name in proofs:
+            validators = _unproven_validators(arg_plan, proofs[arg_name])
+        else:
+            validators = arg_plan.validators
+        for arg_validator in validators:
+            arg_validator(arg_value, arg_name)
+
+
+def _validate_arguments_trusted(
+    plan: _ValidationPlan,
+    arguments: dict,
+    proofs: Optional[_Proofs],
+    passed: _PassedChecks,
+) -> None:
+    """Like `_validate_arguments`, but skips the checks that immutable
+    argument values already passed in the current call chain, and
+    records the ones they pass now.
+    """
+    for arg_name, arg_value, arg_validator in _iter_arg_validators(
+        plan, arguments, proofs, passed
+    ):
+        arg_validator(arg_value, arg_name)
+
+
+def _bind_arguments(
+    plan: _ValidationPlan, args, kwargs
+) -> inspect.BoundArguments:
+    if plan.arg_plans is None:
+        plan.compile()
+    bound_args = plan.signature.bind(*args, **kwargs)
+    bound_args.apply_defaults()
+    return bound_args
+
+
+def _cache_key(plan: _ValidationPlan, arguments: dict) -> tuple:
+    """Builds the result cache key of the bound `arguments` (defaults
+    applied). Argument types, including those of the values of `*args`
+    and `**kwargs`, are part of the key, as validators may accept `1`
+    but reject `1.0` or `True`.
+
+    Like any key holding unhashable values, the key of a call with an
+    unhashable `**kwargs` value is not hashable: `ResultCache` then
+    neither looks it up nor stores it, and the call is not cached.
+    """
+    values = tuple(arguments.values())
+    types = tuple(map(type, values))
+    if plan.var_positional is not None:
+        types += tuple(map(type, arguments[plan.var_positional]))
+    if plan.var_keyword is not None:
+        # `**kwargs` is always the last parameter.
+        kwargs_items = tuple(
+            (name, value, type(value)) for name, value in values[-1].items()
+        )
+        try:
+            kwargs_items = frozenset(kwargs_items)
+        except TypeError:
+            pass
+        values = values[:-1] + (kwargs_items,)
+    return values + types
+
+
+def _new_plan(fn: Callable[P, R], check_arg_types: bool) -> _ValidationPlan:
+    plan = _ValidationPlan(fn, check_arg_types)
+    _PLANS.add(plan)
+    return plan
+
+
 def _process_func(fn: Callable[P, R], check_arg_types: bool) -> Callable[P, R]:
+    plan = _new_plan(fn, check_arg_types)
+
     @wraps(fn)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        sig = inspect.signature(fn)
-        bound_args = sig.bind(*args, **kwargs)
-        bound_args.apply_defaults()
+        bound_args = _bind_arguments(plan, args, kwargs)
         arguments = bound_args.arguments
-        func_type_hints = get_type_hints(fn, include_extras=True)
+        proofs = _collect_proofs(plan, arguments)
+        _validate_arguments(plan, arguments, proofs)
+        if plan.identity_cache is not None:
+            _remember_arguments(plan, arguments, proofs)
+        if proofs is not None:
+            # Certified values were unwrapped.
+            return fn(*bound_args.args, **bound_args.kwargs)
+        return fn(*args, **kwargs)
 
-        if "return" in func_type_hints:
-            del func_type_hints["return"]
+    wrapper.__validation_plan__ = plan
+    return wrapper
 
-        for arg_name, arg_annotation in func_type_hints.items():
-            arg_value = arguments[arg_name]
 
-            if get_origin(arg_annotation) is Annotated:
+def _process_func_trusted(
+    fn: Callable[P, R], check_arg_types: bool
+) -> Callable[P, R]:
+    plan = _new_plan(fn, check_arg_types)
+
+    def call(args, kwargs, passed: _PassedChecks) -> R:
+        bound_args = _bind_arguments(plan, args, kwargs)
+        arguments = bound_args.arguments
+        proofs = _collect_proofs(plan, arguments)
+        _validate_arguments_trusted(plan, arguments, proofs, passed)
+        if plan.identity_cache is not None:
+            _remember_arguments(plan, arguments, proofs)
+        if proofs is not None:
+            return fn(*bound_args.args, **bound_args.kwargs)
+        return fn(*args, **kwargs)
+
+    wrapper = _trusted_wrapper(fn, call)
+    wrapper.__validation_plan__ = plan
+    return wrapper
+
+
+def _trusted_wrapper(fn: Callable[P, R], call: Callable) -> Callable[P, R]:
+    """Wraps `call(args, kwargs, passed)` so that it runs in the trusted
+    context of the current call chain, opening one if there is none.
+    """
+
+    @wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        passed = _TRUSTED.get()
+        if passed is not None:
+            return call(args, kwargs, passed)
+
+        # Outermost call of the chain: open the trusted context.
+        passed = {}
+        token = _TRUSTED.set(passed)
+        try:
+            return call(args, kwargs, passed)
+        finally:
+            _TRUSTED.reset(token)
+
+    return wrapper
+
+
+def _process_func_cached(
+    fn: Callable[P, R],
+    check_arg_types: bool,
+    trust_chain: bool,
+    result_cache: ResultCache,
+) -> Callable[P, R]:
+    plan = _new_plan(fn, check_arg_types)
+
+    def call(args, kwargs, passed: Optional[_PassedChecks]) -> R:
+        raw_key = _raw_key(args, kwargs)
+        result = result_cache.get_unbound(raw_key)
+        if result is not _MISSING:
+            return result
+
+        bound_args = _bind_arguments(plan, args, kwargs)
+        arguments = bound_args.arguments
+        proofs = _collect_proofs(plan, arguments)
+        # The arguments are bound once, for the cache key and for the
+        # validators alike; a hit skips both the validation and the call.
+        cache_key = _cache_key(plan, arguments)
+        result = result_cache.get(cache_key, raw_key)
+        if result is not _MISSING:
+            return result
 
-                arg_type, *arg_validators = get_args(arg_annotation)
+        if passed is None:
+            _validate_arguments(plan, arguments, proofs)
+        else:
+            _validate_arguments_trusted(plan, arguments, proofs, passed)
+        if plan.identity_cache is not None:
+            _remember_arguments(plan, arguments, proofs)
+        result = fn(*bound_args.args, **bound_args.kwargs)
+        result_cache.put(cache_key, raw_key, result)
+        return result
 
-                if check_arg_types:
-                    type_checker = MustBeA(arg_type)
-                    type_checker(arg_value, arg_name)
+    if trust_chain:
+        wrapper = _trusted_wrapper(fn, call)
+    else:
+
+        @wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            return call(args, kwargs, None)
+
+    wrapper.__validation_plan__ = plan
+    return wrapper
+
+
+def _process_func_instrumented(
+    fn: Callable[P, R],
+    check_arg_types: bool,
+    trust_chain: bool,
+    result_cache: Optional[ResultCache] = None,
+) -> Callable[P, R]:
+    plan = _new_plan(fn, check_arg_types)
+    fn_stats = get_function_stats(f"{fn.__module__}.{fn.__qualname__}")
+
+    @wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        token = None
+        passed = None
+        if trust_chain:
+            passed = _TRUSTED.get()
+            if passed is None:
+                passed = {}
+                token = _TRUSTED.set(passed)
+        try:
+            return _instrumented_call(args, kwargs, passed)
+        finally:
+            if token is not None:
+                _TRUSTED.reset(token)
 
-                for arg_validator in arg_validators:
-                    is_depends_on_validator = isinstance(
-                        arg_validator, DependsOn
+    def _instrumented_call(args, kwargs, passed: Optional[_PassedChecks]):
+        records = []
+        start = bound = perf_counter()
+        try:
+            bound_args = _bind_arguments(plan, args, kwargs)
+            arguments = bound_args.arguments
+            proofs = _collect_proofs(plan, arguments)
+            bound = perf_counter()
+
+            if result_cache is not None:
+                raw_key = _raw_key(args, kwargs)
+                cache_key = _cache_key(plan, arguments)
+                result = result_cache.get(cache_key, raw_key)
+                if result is not _MISSING:
+                    fn_stats.record(
+                        perf_counter() - start,
+                        records,
+                        failed=False,
+                        bind_seconds=bound - start,
                     )
-                    is_arg_optional = _is_arg_type_optional(arg_type)
-                    skip = (
-                        is_arg_optional
-                        and arg_value in ALLOWED_OPTIONAL_VALUES
-                        and not is_depends_on_validator
+                    return result
+
+            for arg_name, arg_value, arg_validator in _iter_arg_validators(
+                plan, arguments, proofs, passed
+            ):
+                v_start = perf_counter()
+                try:
+                    checked = arg_validator(arg_value, arg_name)
+                except Exception:
+                    elapsed = perf_counter() - v_start
+                    records.append(
+                        (arg_name, arg_validator, elapsed, True, None)
                     )
+                    raise
+                elapsed = perf_counter() - v_start
+                # Collection validators return the number of values
+                # they checked.
+                if type(checked) is not int:
+                    checked = None
+                records.append(
+                    (arg_name, arg_validator, elapsed, False, checked)
+                )
+        except Exception:
+            # Validation errors, bad calls (`TypeError`) and validators
+            # that raise anything else alike.
+            fn_stats.record(
+                perf_counter() - start,
+                records,
+                failed=True,
+                bind_seconds=bound - start,
+            )
+            raise
+
+        if plan.identity_cache is not None:
+            _remember_arguments(plan, arguments, proofs)
+        if proofs is not None:
+            args, kwargs = bound_args.args, bound_args.kwargs
+        validated = perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+            if result_cache is not None:
+                result_cache.put(cache_key, raw_key, result)
+            return result
+        finally:
+            fn_stats.record(
+                validated - start,
+                records,
+                failed=False,
+                bind_seconds=bound - start,
+                body_seconds=perf_counter() - validated,
+            )
+
+    wrapper.__validation_plan__ = plan
+    return wrapper
 
-                    if skip:
-                        continue
 
-                    if isinstance(arg_validator, Validator):
-                        if is_depends_on_validator:
-                            arg_validator.arguments = arguments
-                        arg_validator(arg_value, arg_name)
+def _process_func_shadow(
+    fn: Callable[P, R],
+    check_arg_types: bool,
+    on_failure: ShadowFailureHandler,
+) -> Callable[P, R]:
+    plan = _new_plan(fn, check_arg_types)
+    fn_name = f"{fn.__module__}.{fn.__qualname__}"
+    shadow_stats = ShadowStats(get_function_stats(fn_name))
+    checks = shadow_queue()
 
+    def check(args, kwargs) -> None:
+        shadow_stats.count("checks")
+        try:
+            bound_args = _bind_arguments(plan, args, kwargs)
+        except TypeError:
+            # The call itself raised.
+            return
+        arguments = bound_args.arguments
+        try:
+            proofs = _collect_proofs(plan, arguments)
+            _validate_arguments(plan, arguments, proofs)
+        except (ValidationError, TypeError) as e:
+            shadow_stats.count("failures")
+            on_failure(fn_name, e)
+
+    @wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        # `args` is a tuple and `kwargs` a new dict: queuing them is the
+        # snapshot. Argument values are not copied, so a value mutated
+        # by the function is checked as the worker finds it.
+        if not checks.submit(partial(check, args, kwargs)):
+            shadow_stats.count("drops")
+        if Certified in map(type, args) or (
+            kwargs and Certified in map(type, kwargs.values())
+        ):
+            args, kwargs = _uncertified(args, kwargs)
         return fn(*args, **kwargs)
 
+    wrapper.__validation_plan__ = plan
+    wrapper.shadow_info = shadow_stats.info
     return wrapper
 
 
+def _uncertified(args: tuple, kwargs: dict) -> tuple[tuple, dict]:
+    """Unwraps the `Certified` values of the arguments of a call."""
+    args = tuple(a.value if type(a) is Certified else a for a in args)
+    kwargs = {
+        k: v.value if type(v) is Certified else v for k, v in kwargs.items()
+    }
+    return args, kwargs
+
+
+def _decorate(
+    fn: Callable[P, R],
+    check_arg_types: bool,
+    instrument: Optional[bool],
+    trust_chain: bool = False,
+    identity_cache: bool = False,
+    version_of: Optional[VersionOf] = None,
+    cache: Union[bool, int] = False,
+    cache_ttl: Optional[float] = None,
+    mode: Mode = "enforce",
+    on_shadow_failure: Optional[ShadowFailureHandler] = None,
+) -> Callable[P, R]:
+    if mode == "shadow":
+        if instrument or trust_chain or identity_cache or cache:
+            raise ValueError(
+                "mode='shadow' can not be combined with instrument, "
+                "trust_chain, identity_cache or cache."
+            )
+        if version_of is not None:
+            raise ValueError("mode='shadow' can not be used with version_of.")
+        return _process_func_shadow(
+            fn, check_arg_types, on_shadow_failure or _log_failure
+        )
+    if mode != "enforce":
+        raise ValueError(f"mode must be 'enforce' or 'shadow', got {mode!r}.")
+    if on_shadow_failure is not None:
+        raise ValueError("on_shadow_failure requires mode='shadow'.")
+
+    result_cache = _new_result_cache(fn, cache, cache_ttl)
+    if instrument is None:
+        instrument = is_instrumentation_enabled()
+    if instrument:
+        wrapper = _process_func_instrumented(
+            fn, check_arg_types, trust_chain, result_cache
+        )
+    elif result_cache is not None:
+        wrapper = _process_func_cached(
+            fn, check_arg_types, trust_chain, result_cache
+        )
+    elif trust_chain:
+        wrapper = _process_func_trusted(fn, check_arg_types)
+    else:
+        wrapper = _process_func(fn, check_arg_types)
+
+    if identity_cache or version_of is not None:
+        wrapper.__validation_plan__.identity_cache = IdentityCache(
+            get_function_stats(f"{fn.__module__}.{fn.__qualname__}"),
+            version_of,
+        )
+    if result_cache is not None:
+        wrapper.cache_info = result_cache.info
+        wrapper.cache_clear = result_cache.clear
+    return wrapper
+
+
+def _new_result_cache(
+    fn: Callable[P, R],
+    cache: Union[bool, int],
+    cache_ttl: Optional[float],
+) -> Optional[ResultCache]:
+    if cache is False:
+        if cache_ttl is not None:
+            raise ValueError("cache_ttl requires cache to be enabled.")
+        return None
+    if cache is True:
+        maxsize = RESULT_CACHE_SIZE
+    elif isinstance(cache, int) and cache > 0:
+        maxsize = cache
+    else:
+        raise ValueError(
+            f"cache must be a bool or a positive int, got {cache!r}."
+        )
+    if cache_ttl is not None and not cache_ttl > 0:
+        raise ValueError(f"cache_ttl must be positive, got {cache_ttl!r}.")
+    return ResultCache(
+        get_function_stats(f"{fn.__module__}.{fn.__qualname__}"),
+        maxsize,
+        cache_ttl,
+    )
+
+
 def validate_params(
     func: Callable[P, R] | None = None,
     /,
     *,
     check_arg_types: bool = False,
+    instrument: Optional[bool] = None,
+    trust_chain: bool = False,
+    identity_cache: bool = False,
+    version_of: Optional[VersionOf] = None,
+    cache: Union[bool, int] = False,
+    cache_ttl: Optional[float] = None,
+    mode: Mode = "enforce",
+    on_shadow_failure: Optional[ShadowFailureHandler] = None,
 ) -> DecoratorOrWrapper:
     """Decorator to validate function arguments at runtime based on their
     type annotations using `typing.Annotated` and custom validators. This
@@ -95,9 +819,83 @@ def validate_params(
     :param check_arg_types: If True, checks that all argument types match.
                             Default is False.
 
+    :param instrument: If True, records call counts, validation time and
+                       failures of the decorated function, see
+                       `func_validator.stats`. If None, follows
+                       `func_validator.enable_instrumentation`. The choice
+                       is made once, at decoration time. Default is None.
+
+    :param trust_chain: If True, checks that an immutable argument value
+                        (see `func_validator.IMMUTABLE_TYPES`) already
+                        passed in an enclosing `trust_chain` call, or in
+                        the current `func_validator.trusted_context`, are
+                        skipped. Mutable values are always validated.
+                        Default is False.
+
+    :param identity_cache: If True, remembers (by identity, for the
+                           lifetime of the value) the tuples,
+                           frozensets, strings, bytes and frozen
+                           dataclass instances that passed their
+                           validators, so that passing the same object
+                           again skips its scan. Hits and misses are
+                           counted in `func_validator.stats`. Default is
+                           False.
+
+    :param version_of: Opts mutable argument values into the identity
+                       cache (implies `identity_cache`): called with
+                       every other argument value, it returns a version
+                       (e.g. a modification counter or a hash) that must
+                       be unchanged for a remembered value to be trusted
+                       again, or None for values that must not be
+                       cached. Default is None.
+
+    :param cache: Memoizes the function: if True, the results of the 128
+                  most recently used argument combinations are cached;
+                  an int sets that number instead. The cache key is
+                  built from the bound arguments the validators check
+                  (argument types included), so a hit skips both the
+                  validation and the call. Arguments must be hashable
+                  for their call to be cached. Hits, misses and
+                  evictions are counted in `func_validator.stats` and
+                  returned by the `cache_info()` method of the decorated
+                  function, `cache_clear()` empties the cache. Default
+                  is False.
+
+    :param cache_ttl: Number of seconds a cached result stays valid for
+                      (requires `cache`). Default is None, results do not
+                      expire.
+
+    :param mode: "enforce" rejects calls whose arguments fail validation.
+                 "shadow" calls the function right away, whatever its
+                 arguments, and queues them to be validated by a
+                 background thread, to measure how often validation
+                 would fail without paying for it on the call path.
+                 Arguments are queued as passed, not copied, so an
+                 argument mutated before the background thread gets to
+                 it is checked as it is then. Checks are dropped when
+                 the queue (shared by every shadowed function, see
+                 `func_validator.set_shadow_queue_size`) is full.
+                 Checks, failures and drops are counted in
+                 `func_validator.stats` and returned, with the queue
+                 depth, by the `shadow_info()` method of the decorated
+                 function. Can not be combined with `instrument`,
+                 `trust_chain`, `identity_cache`, `version_of` or
+                 `cache`. Default is "enforce".
+
+    :param on_shadow_failure: Called by the background thread, in shadow
+                              mode, with the qualified name of the
+                              function and the error its arguments
+                              raised. Default is None, failures are
+                              logged as warnings by the
+                              "func_validator" logger.
+
     :raises TypeError: If `func` is not callable or None, or if a validator
                        is not callable.
 
+    :raises ValueError: If `cache`, `cache_ttl` or `mode` is invalid, or
+                        if `mode` is "shadow" with options it can not
+                        be combined with.
+
     :return: The decorated function with argument validation, or the
              decorator itself if `func` is None.
     """
@@ -105,12 +903,56 @@ def validate_params(
     # If no function is provided, return the decorator
     # validate_params was called with parenthesis
     if func is None:
-        return partial(_process_func, check_arg_types=check_arg_types)
+        return partial(
+            _decorate,
+            check_arg_types=check_arg_types,
+            instrument=instrument,
+            trust_chain=trust_chain,
+            identity_cache=identity_cache,
+            version_of=version_of,
+            cache=cache,
+            cache_ttl=cache_ttl,
+            mode=mode,
+            on_shadow_failure=on_shadow_failure,
+        )
 
     # If a function is provided, apply the decorator directly and
     # return the wrapper function
     # validate_params was called with no parenthesis
     if callable(func):
-        return _process_func(func, check_arg_types)
+        return _decorate(
+            func,
+            check_arg_types,
+            instrument,
+            trust_chain,
+            identity_cache,
+            version_of,
+            cache,
+            cache_ttl,
+            mode,
+            on_shadow_failure,
+        )
 
     raise TypeError("The first argument must be a callable function or None.")
+
+
+def compile_all() -> int:
+    """Builds the validation plan of every decorated function that has not
+    been called yet.
+
+    Plans are otherwise built on the first call of each function. Call
+    this once all modules are imported (e.g. at the end of application
+    start-up) to pay that cost ahead of time and to surface annotations
+    that cannot be resolved.
+
+    :raises NameError: If an annotation refers to an undefined name.
+    :raises ValueError: If the bounds of an argument are contradictory.
+
+    :return: The number of plans that were built.
+    """
+    compiled = 0
+    for plan in list(_PLANS):
+        if not plan.is_compiled:
+            plan.compile()
+            compiled += 1
+    return compiled
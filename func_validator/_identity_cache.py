@@ -0,0 +1,126 @@
+"""Per-function cache of the argument values that already passed their
+validators, so that a large value passed again is not scanned again.
+"""
+
+import threading
+import weakref
+from typing import Callable, Final, Hashable, Iterable, Optional
+
+from ._instrumentation import FunctionStats
+from ._proof import _is_frozen_dataclass
+
+__all__ = ["IDENTITY_CACHE_SIZE", "IdentityCache"]
+
+#: Number of argument values remembered per function.
+IDENTITY_CACHE_SIZE: Final[int] = 128
+
+#: Immutable types worth caching: checking an `int` costs about as much
+#: as looking it up, scanning a tuple does not.
+_CACHED_IMMUTABLE_TYPES: Final[frozenset[type]] = frozenset(
+    {bytes, frozenset, str, tuple}
+)
+
+VersionOf = Callable[[object], Optional[Hashable]]
+
+
+class IdentityCache:
+    """Remembers which argument values, by identity, passed every
+    validator of their argument.
+
+    Immutable values (exact tuples, frozensets, strings and bytes, and
+    frozen dataclass instances) are trusted as long as they are alive.
+    Other values are only cached with a `version_of` function, whose
+    result must be unchanged for a cached value to be trusted again.
+
+    Values that support weak references are referenced weakly; others
+    are kept alive by the cache, which is why it is bounded.
+    """
+
+    __slots__ = ("entries", "maxsize", "version_of", "fn_stats", "_lock")
+
+    def __init__(
+        self,
+        fn_stats: FunctionStats,
+        version_of: Optional[VersionOf] = None,
+        maxsize: int = IDENTITY_CACHE_SIZE,
+    ) -> None:
+        #: `(arg_name, id(value))` maps to a reference to the value, how
+        #: to dereference it, its version and the keys of the checks it
+        #: passed.
+        self.entries: dict[
+            tuple[str, int], tuple[object, bool, Hashable, frozenset]
+        ] = {}
+        self.maxsize = maxsize
+        self.version_of = version_of
+        self.fn_stats = fn_stats
+        # Re-entrant: a weak reference callback may run, through garbage
+        # collection, while the lock is held by the same thread.
+        self._lock = threading.RLock()
+
+    def _version(self, value: object) -> tuple[bool, Hashable]:
+        """Returns whether `value` can be cached, and its version."""
+        if type(value) in _CACHED_IMMUTABLE_TYPES or _is_frozen_dataclass(
+            value
+        ):
+            return True, None
+        if self.version_of is None:
+            return False, None
+        version = self.version_of(value)
+        return version is not None, version
+
+    def get(self, arg_name: str, value: object) -> Optional[frozenset]:
+        """Returns the keys of the checks `value` passed as `arg_name`, or
+        None if it is not cached (or has changed since).
+        """
+        cacheable, version = self._version(value)
+        if not cacheable:
+            return None
+
+        entry = self.entries.get((arg_name, id(value)))
+        if entry is not None:
+            ref, is_weak, cached_version, keys = entry
+            if (ref() if is_weak else ref) is value and (
+                cached_version == version
+            ):
+                self.fn_stats.count("identity_cache_hits")
+                return keys
+        self.fn_stats.count("identity_cache_misses")
+        return None
+
+    def remember(
+        self,
+        arg_name: str,
+        value: object,
+        keys: Iterable[Optional[Hashable]],
+    ) -> None:
+        """Records that `value` passed the checks `keys` (`None` keys
+        excepted) as `arg_name`.
+        """
+        cacheable, version = self._version(value)
+        keys = frozenset(key for key in keys if key is not None)
+        if not cacheable or not keys:
+            return
+
+        cache_key = (arg_name, id(value))
+        try:
+            ref = weakref.ref(value, lambda r: self._forget(cache_key, r))
+            is_weak = True
+        except TypeError:
+            ref, is_weak = value, False
+
+        with self._lock:
+            if cache_key not in self.entries:
+                while len(self.entries) >= self.maxsize:
+                    del self.entries[next(iter(self.entries))]
+                    self.fn_stats.count("identity_cache_evictions")
+            self.entries[cache_key] = (ref, is_weak, version, keys)
+
+    def _forget(self, cache_key: tuple[str, int], ref: weakref.ref):
+        with self._lock:
+            entry = self.entries.get(cache_key)
+            if entry is not None and entry[0] is ref:
+                del self.entries[cache_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.entries.clear()
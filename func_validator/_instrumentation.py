@@ -0,0 +1,364 @@
+"""Opt-in runtime statistics for functions decorated with `validate_params`.
+
+Instrumentation is decided once, when a function is decorated: an
+instrumented function gets a wrapper that times every validator, while
+an uninstrumented one gets the plain wrapper and pays nothing extra.
+"""
+
+import os
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Final, Optional
+
+from .validators import Validator
+
+__all__ = [
+    "LATENCY_BUCKETS",
+    "FunctionStats",
+    "StatsSnapshot",
+    "ValidatorStats",
+    "disable_instrumentation",
+    "enable_instrumentation",
+    "get_function_stats",
+    "is_instrumentation_enabled",
+    "reset_stats",
+    "stats",
+]
+
+#: Upper bounds (in seconds) of the validation latency histogram buckets.
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    1e-6,
+    5e-6,
+    1e-5,
+    5e-5,
+    1e-4,
+    5e-4,
+    1e-3,
+    5e-3,
+    1e-2,
+    5e-2,
+    1e-1,
+    5e-1,
+    1.0,
+)
+
+_ENABLED: bool = os.environ.get("FUNC_VALIDATOR_INSTRUMENT", "") not in (
+    "",
+    "0",
+)
+_REGISTRY: dict[str, "FunctionStats"] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+@dataclass
+class ValidatorStats:
+    """Counters of a single validator attached to a single argument."""
+
+    scans_values: bool = False
+    calls: int = 0
+    failures: int = 0
+    seconds: float = 0.0
+    #: Number of values of collection arguments actually checked, as
+    #: reported by the validator (e.g. fewer than the length of the
+    #: collection when `MustHaveValues*` validators sample).
+    values_checked: int = 0
+
+
+@dataclass
+class FunctionStats:
+    """Counters of a single decorated function."""
+
+    name: str
+    calls: int = 0
+    failures: int = 0
+    validation_seconds: float = 0.0
+    bind_seconds: float = 0.0
+    body_seconds: float = 0.0
+    histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+    validators: dict[tuple[str, str], ValidatorStats] = field(
+        default_factory=dict
+    )
+    #: Event counters of optional features (e.g. identity cache hits),
+    #: kept whether or not the function is instrumented.
+    counters: dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record(
+        self,
+        validation_seconds: float,
+        validator_records: list[
+            tuple[str, Validator, float, bool, Optional[int]]
+        ],
+        failed: bool,
+        *,
+        bind_seconds: float = 0.0,
+        body_seconds: float = 0.0,
+    ) -> None:
+        """Records one call.
+
+        :param validation_seconds: Time spent validating the arguments,
+                                   binding included.
+        :param validator_records: `(arg_name, validator, seconds, failed,
+                                  values_checked)` for every validator
+                                  that ran, `values_checked` being None
+                                  if the validator does not report it.
+        :param failed: Whether the call was rejected, by a validator
+                       (or one that raised) or for not matching the
+                       signature.
+        :param bind_seconds: Time spent binding the arguments to the
+                             signature.
+        :param body_seconds: Time spent in the decorated function itself.
+        """
+        bucket = bisect_left(LATENCY_BUCKETS, validation_seconds)
+        with self._lock:
+            self.calls += 1
+            self.failures += failed
+            self.validation_seconds += validation_seconds
+            self.bind_seconds += bind_seconds
+            self.body_seconds += body_seconds
+            self.histogram[bucket] += 1
+            for (
+                arg_name,
+                validator,
+                seconds,
+                v_failed,
+                values_checked,
+            ) in validator_records:
+                key = (arg_name, type(validator).__name__)
+                v_stats = self.validators.get(key)
+                if v_stats is None:
+                    v_stats = self.validators[key] = ValidatorStats(
+                        scans_values=validator.SCANS_VALUES
+                    )
+                v_stats.calls += 1
+                v_stats.failures += v_failed
+                v_stats.seconds += seconds
+                if values_checked is not None:
+                    v_stats.values_checked += values_checked
+
+    def count(self, counter: str, n: int = 1) -> None:
+        """Adds `n` to the event counter `counter`."""
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + n
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.failures = 0
+            self.validation_seconds = 0.0
+            self.bind_seconds = 0.0
+            self.body_seconds = 0.0
+            self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+            self.validators = {}
+            self.counters = {}
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "failures": self.failures,
+                "validation_seconds": self.validation_seconds,
+                "bind_seconds": self.bind_seconds,
+                "body_seconds": self.body_seconds,
+                "histogram": {
+                    "buckets": list(LATENCY_BUCKETS),
+                    "counts": list(self.histogram),
+                },
+                "validators": [
+                    {
+                        "argument": arg_name,
+                        "validator": validator_name,
+                        "scans_values": v_stats.scans_values,
+                        "calls": v_stats.calls,
+                        "failures": v_stats.failures,
+                        "seconds": v_stats.seconds,
+                        "values_checked": v_stats.values_checked,
+                    }
+                    for (arg_name, validator_name), v_stats in (
+                        self.validators.items()
+                    )
+                ],
+                "counters": dict(self.counters),
+            }
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    pairs = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+    return "{" + pairs + "}"
+
+
+@dataclass(frozen=True)
+class StatsSnapshot:
+    """Point-in-time copy of the statistics of every instrumented
+    function, keyed by the function's qualified name.
+    """
+
+    functions: dict[str, dict]
+
+    def __getitem__(self, name: str) -> dict:
+        return self.functions[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.functions
+
+    def to_dict(self) -> dict:
+        return {"functions": self.functions}
+
+    def to_json(self, **kwargs) -> str:
+        """Serializes the snapshot as JSON. Keyword arguments are passed
+        to `json.dumps`.
+        """
+        import json
+
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_prometheus(self) -> str:
+        """Serializes the snapshot in the Prometheus text exposition
+        format.
+        """
+        lines: list[str] = []
+
+        def metric(name: str, kind: str, help_text: str):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        metric(
+            "func_validator_calls_total",
+            "counter",
+            "Calls to validated functions.",
+        )
+        for fn_name, data in self.functions.items():
+            lines.append(
+                f"func_validator_calls_total{_labels(function=fn_name)} "
+                f"{data['calls']}"
+            )
+
+        metric(
+            "func_validator_failures_total",
+            "counter",
+            "Calls rejected by a validator.",
+        )
+        for fn_name, data in self.functions.items():
+            lines.append(
+                f"func_validator_failures_total{_labels(function=fn_name)} "
+                f"{data['failures']}"
+            )
+
+        metric(
+            "func_validator_validation_seconds",
+            "histogram",
+            "Time spent validating arguments per call.",
+        )
+        for fn_name, data in self.functions.items():
+            cumulative = 0
+            counts = data["histogram"]["counts"]
+            bounds = [*map(repr, LATENCY_BUCKETS), "+Inf"]
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                lbl = _labels(function=fn_name, le=bound)
+                lines.append(
+                    f"func_validator_validation_seconds_bucket{lbl} "
+                    f"{cumulative}"
+                )
+            lbl = _labels(function=fn_name)
+            lines.append(
+                f"func_validator_validation_seconds_sum{lbl} "
+                f"{data['validation_seconds']!r}"
+            )
+            lines.append(
+                f"func_validator_validation_seconds_count{lbl} "
+                f"{data['calls']}"
+            )
+
+        for suffix, key, kind, help_text in (
+            ("calls_total", "calls", "counter", "Validator invocations."),
+            ("failures_total", "failures", "counter", "Validator failures."),
+            ("seconds_total", "seconds", "counter", "Validator run time."),
+            (
+                "values_checked_total",
+                "values_checked",
+                "counter",
+                "Values of collections checked.",
+            ),
+        ):
+            name = f"func_validator_validator_{suffix}"
+            metric(name, kind, help_text)
+            for fn_name, data in self.functions.items():
+                for v_data in data["validators"]:
+                    lbl = _labels(
+                        function=fn_name,
+                        argument=v_data["argument"],
+                        validator=v_data["validator"],
+                    )
+                    lines.append(f"{name}{lbl} {v_data[key]!r}")
+
+        counter_names = sorted(
+            {c for data in self.functions.values() for c in data["counters"]}
+        )
+        for counter in counter_names:
+            name = f"func_validator_{counter}_total"
+            metric(name, "counter", counter.replace("_", " ").capitalize())
+            for fn_name, data in self.functions.items():
+                if counter in data["counters"]:
+                    lbl = _labels(function=fn_name)
+                    lines.append(f"{name}{lbl} {data['counters'][counter]}")
+
+        return "\n".join(lines) + "\n"
+
+
+def enable_instrumentation() -> None:
+    """Instruments every function decorated from now on.
+
+    Functions decorated before this call keep their uninstrumented
+    wrapper. Instrumentation can also be switched on for a whole process
+    by setting the `FUNC_VALIDATOR_INSTRUMENT` environment variable.
+    """
+    global _ENABLED
+    _ENABLED = True
+
+
+def disable_instrumentation() -> None:
+    """Stops instrumenting functions decorated from now on."""
+    global _ENABLED
+    _ENABLED = False
+
+
+def is_instrumentation_enabled() -> bool:
+    return _ENABLED
+
+
+def get_function_stats(name: str) -> FunctionStats:
+    """Returns the (possibly new) statistics record for `name`."""
+    with _REGISTRY_LOCK:
+        fn_stats = _REGISTRY.get(name)
+        if fn_stats is None:
+            fn_stats = _REGISTRY[name] = FunctionStats(name)
+        return fn_stats
+
+
+def reset_stats() -> None:
+    """Clears the counters of every instrumented function."""
+    with _REGISTRY_LOCK:
+        registry = list(_REGISTRY.values())
+    for fn_stats in registry:
+        fn_stats.reset()
+
+
+def stats() -> StatsSnapshot:
+    """Returns a snapshot of the statistics of every instrumented
+    function.
+    """
+    with _REGISTRY_LOCK:
+        registry = dict(_REGISTRY)
+    return StatsSnapshot(
+        {name: fn_stats.to_dict() for name, fn_stats in registry.items()}
+    )
@@ -0,0 +1,423 @@
+"""Parallel scans of very large collection arguments.
+
+Above a size threshold, the values of a sequence are checked in chunks
+by a pool of workers: threads on free-threaded CPython, processes
+otherwise. Buffers (e.g. `array.array`) are copied once into shared
+memory, which every worker process maps; other sequences are sent to
+the workers chunk by chunk.
+
+Workers share the index of the first failure found so far and stop
+scanning as soon as the rest of their chunk comes after it, so the
+failure reported is always the first one of the whole sequence.
+"""
+
+import os
+import struct
+import sys
+import threading
+from array import array
+from typing import Callable, Final, Iterable, Literal, NamedTuple, Optional
+
+__all__ = [
+    "PARALLEL_THRESHOLD",
+    "disable_parallel_validation",
+    "enable_parallel_validation",
+]
+
+#: Default number of values a sequence must have to be split.
+PARALLEL_THRESHOLD: Final[int] = 1_000_000
+
+#: Number of values scanned between two looks at the first failure.
+_BLOCK: Final[int] = 8192
+
+#: Chunks per worker: smaller chunks balance the load better and let
+#: workers give up sooner once a failure is found.
+_CHUNKS_PER_WORKER: Final[int] = 4
+
+#: Sequence types that can be split. Only exact types are split, as
+#: subclasses may iterate differently than they index.
+_SPLITTABLE_TYPES: Final[frozenset[type]] = frozenset(
+    {array, bytearray, bytes, list, memoryview, range, tuple}
+)
+
+#: Item formats of the buffers shared with worker processes.
+_SHAREABLE_FORMATS: Final[frozenset[str]] = frozenset("bBhHiIlLqQfd")
+
+Executor = Literal["auto", "thread", "process"]
+
+
+class _Settings(NamedTuple):
+    workers: int
+    threshold: int
+    executor: Executor
+
+
+_SETTINGS: Optional[_Settings] = None
+_POOLS: dict = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def enable_parallel_validation(
+    *,
+    workers: Optional[int] = None,
+    threshold: int = PARALLEL_THRESHOLD,
+    executor: Executor = "auto",
+) -> None:
+    """Checks the values of sequences of at least `threshold` values in
+    parallel, in every `MustHaveValues*` validator.
+
+    A failure is reported exactly as a sequential scan reports it: the
+    first failing value of the sequence raises the error of its
+    validator, with a note giving its index.
+
+    :param workers: Number of worker threads or processes. Defaults to
+                    the number of CPUs.
+    :param threshold: Minimum number of values of a sequence for it to
+                      be split. Default is `PARALLEL_THRESHOLD`.
+    :param executor: "thread", "process", or "auto" to use threads on
+                     free-threaded CPython and processes otherwise.
+                     Validators that can not be pickled are run
+                     sequentially instead of in processes. Default is
+                     "auto".
+
+    :raises ValueError: If `workers`, `threshold` or `executor` is
+                        invalid.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be positive, got {workers!r}.")
+    if threshold < 1:
+        raise ValueError(f"threshold must be positive, got {threshold!r}.")
+    if executor not in ("auto", "thread", "process"):
+        raise ValueError(
+            "executor must be 'auto', 'thread' or 'process', "
+            f"got {executor!r}."
+        )
+
+    global _SETTINGS
+    disable_parallel_validation()
+    _SETTINGS = _Settings(workers, threshold, executor)
+
+
+def disable_parallel_validation() -> None:
+    """Goes back to sequential scans and shuts the workers down."""
+    global _SETTINGS
+    _SETTINGS = None
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.shutdown(cancel_futures=True)
+
+
+def should_split(values: object) -> bool:
+    """Returns whether the values of `values` are to be checked in
+    parallel.
+    """
+    settings = _SETTINGS
+    return (
+        settings is not None
+        and type(values) in _SPLITTABLE_TYPES
+        and len(values) >= settings.threshold
+    )
+
+
+def _is_free_threaded() -> bool:
+    return not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def _pool(kind: str, workers: int):
+    with _POOLS_LOCK:
+        pool = _POOLS.get(kind)
+        if pool is None:
+            if kind == "thread":
+                from concurrent.futures import ThreadPoolExecutor
+
+                pool = ThreadPoolExecutor(
+                    workers, thread_name_prefix="func_validator"
+                )
+            else:
+                from concurrent.futures import ProcessPoolExecutor
+
+                pool = ProcessPoolExecutor(workers)
+            _POOLS[kind] = pool
+        return pool
+
+
+class _FirstFailure:
+    """Index of the first failure found so far, shared by worker
+    threads.
+    """
+
+    __slots__ = ("index", "_lock")
+
+    def __init__(self) -> None:
+        self.index = sys.maxsize
+        self._lock = threading.Lock()
+
+    def get(self) -> int:
+        return self.index
+
+    def propose(self, index: int) -> None:
+        with self._lock:
+            if index < self.index:
+                self.index = index
+
+
+class _SharedFirstFailure:
+    """Index of the first failure found so far, in shared memory.
+
+    Updates are not atomic, so a later index may overwrite an earlier
+    one: the index only tells workers when to give up, the failure
+    reported is taken from the results of the chunks.
+    """
+
+    __slots__ = ("buf",)
+
+    def __init__(self, buf: memoryview) -> None:
+        self.buf = buf
+
+    def get(self) -> int:
+        return struct.unpack_from("q", self.buf)[0]
+
+    def propose(self, index: int) -> None:
+        if index < self.get():
+            struct.pack_into("q", self.buf, 0, index)
+
+
+def _first_failure(
+    values,
+    start: int,
+    stop: int,
+    func: Callable,
+    arg_name: str,
+    failure,
+    offset: int = 0,
+) -> Optional[int]:
+    """Returns the index (plus `offset`) of the first value of
+    `values[start:stop]` that `func` rejects, or None. Gives up, also
+    returning None, once `failure` holds an index before the values
+    still to be scanned.
+    """
+    for block_start in range(start, stop, _BLOCK):
+        if failure.get() < offset + block_start:
+            return None
+        block = values[block_start : min(block_start + _BLOCK, stop)]
+        try:
+            for value in block:
+                func(value, arg_name)
+        except Exception:
+            # Failures are rare: only then is the failing value located.
+            # The caller raises the actual error again, in order.
+            for index, value in enumerate(block, offset + block_start):
+                try:
+                    func(value, arg_name)
+                except Exception:
+                    failure.propose(index)
+                    return index
+    return None
+
+
+def _attach(name: str):
+    from multiprocessing import shared_memory
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    return shared_memory.SharedMemory(name)
+
+
+def _scan_shared(
+    buffer_name: str,
+    item_format: str,
+    start: int,
+    stop: int,
+    func: Callable,
+    arg_name: str,
+    failure_name: str,
+) -> Optional[int]:
+    """Worker process side of a scan of a buffer in shared memory."""
+    buffer_shm = _attach(buffer_name)
+    failure_shm = _attach(failure_name)
+    values = buffer_shm.buf.cast(item_format)
+    try:
+        return _first_failure(
+            values,
+            start,
+            stop,
+            func,
+            arg_name,
+            _SharedFirstFailure(failure_shm.buf),
+        )
+    finally:
+        values.release()
+        buffer_shm.close()
+        failure_shm.close()
+
+
+def _scan_chunk(
+    chunk: list,
+    offset: int,
+    func: Callable,
+    arg_name: str,
+    failure_name: str,
+) -> Optional[int]:
+    """Worker process side of a scan of a chunk sent by value."""
+    failure_shm = _attach(failure_name)
+    try:
+        return _first_failure(
+            chunk,
+            0,
+            len(chunk),
+            func,
+            arg_name,
+            _SharedFirstFailure(failure_shm.buf),
+            offset,
+        )
+    finally:
+        failure_shm.close()
+
+
+def _chunks(length: int, count: int) -> Iterable[tuple[int, int]]:
+    count = min(count, length)
+    bounds = [length * k // count for k in range(count + 1)]
+    return zip(bounds, bounds[1:])
+
+
+def _first_result(futures: list) -> Optional[int]:
+    # Chunks are in order: the first chunk that failed holds the first
+    # failure, once every chunk before it passed.
+    for future in futures:
+        index = future.result()
+        if index is not None:
+            for later in futures:
+                later.cancel()
+            return index
+    return None
+
+
+def _scan_with_threads(
+    values, func: Callable, arg_name: str, settings: _Settings
+) -> Optional[int]:
+    pool = _pool("thread", settings.workers)
+    failure = _FirstFailure()
+    futures = [
+        pool.submit(_first_failure, values, lo, hi, func, arg_name, failure)
+        for lo, hi in _chunks(
+            len(values), settings.workers * _CHUNKS_PER_WORKER
+        )
+    ]
+    return _first_result(futures)
+
+
+def _shareable_view(values) -> Optional[memoryview]:
+    if type(values) in (list, range, tuple):
+        return None
+    view = memoryview(values)
+    if (
+        view.ndim == 1
+        and view.c_contiguous
+        and view.format in _SHAREABLE_FORMATS
+    ):
+        return view
+    view.release()
+    return None
+
+
+def _scan_with_processes(
+    values, func: Callable, arg_name: str, settings: _Settings
+) -> Optional[int]:
+    from multiprocessing import shared_memory
+
+    pool = _pool("process", settings.workers)
+    chunks = _chunks(len(values), settings.workers * _CHUNKS_PER_WORKER)
+    failure_shm = shared_memory.SharedMemory(create=True, size=8)
+    struct.pack_into("q", failure_shm.buf, 0, sys.maxsize)
+    buffer_shm = None
+    try:
+        view = _shareable_view(values)
+        if view is not None:
+            with view:
+                buffer_shm = shared_memory.SharedMemory(
+                    create=True, size=view.nbytes
+                )
+                buffer_shm.buf[: view.nbytes] = view.cast("B")
+                item_format = view.format
+            futures = [
+                pool.submit(
+                    _scan_shared,
+                    buffer_shm.name,
+                    item_format,
+                    lo,
+                    hi,
+                    func,
+                    arg_name,
+                    failure_shm.name,
+                )
+                for lo, hi in chunks
+            ]
+        else:
+            futures = [
+                pool.submit(
+                    _scan_chunk,
+                    values[lo:hi],
+                    lo,
+                    func,
+                    arg_name,
+                    failure_shm.name,
+                )
+                for lo, hi in chunks
+            ]
+        return _first_result(futures)
+    finally:
+        for shm in (failure_shm, buffer_shm):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+
+def _is_picklable(obj: object) -> bool:
+    import pickle
+
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+    return True
+
+
+def check_values(values, arg_name: str, func: Callable) -> None:
+    """Calls `func(value, arg_name)` on every value of `values`, in
+    parallel (see `enable_parallel_validation`).
+
+    :raises Exception: Whatever `func` raises for the first value it
+                       rejects, with a note giving the index of that
+                       value.
+    """
+    settings = _SETTINGS
+    if settings is None:
+        kind = None
+    elif settings.executor == "auto":
+        kind = "thread" if _is_free_threaded() else "process"
+    else:
+        kind = settings.executor
+    if kind == "process" and not _is_picklable(func):
+        kind = None
+
+    if kind == "thread":
+        first = _scan_with_threads(values, func, arg_name, settings)
+    elif kind == "process":
+        first = _scan_with_processes(values, func, arg_name, settings)
+    else:
+        first = 0
+    if first is None:
+        return
+
+    index = first
+    try:
+        for index in range(first, len(values)):
+            func(values[index], arg_name)
+    except Exception as exc:
+        if kind is not None and hasattr(exc, "add_note"):
+            exc.add_note(f"First failing value at index {index}.")
+        raise
@@ -0,0 +1,197 @@
+"""Proof-carrying values: a value checked against a `ValidationSpec` once
+carries that proof to every validated function it is later passed to,
+through queues and caches alike, and the checks it covers are skipped.
+"""
+
+import weakref
+from typing import Generic, Hashable, Optional, TypeVar
+
+from .validators import DependsOn, Validator
+from .validators.combinators import IntervalCheck, _merge_bounds
+
+__all__ = ["Certified", "ValidationSpec"]
+
+T = TypeVar("T")
+
+
+def _freeze(value: T) -> Hashable:
+    """Returns a hashable copy of `value`. Containers are tagged with
+    their type, so that e.g. a dict and a list of its items, which
+    validators treat differently, do not freeze to the same key.
+    """
+    if isinstance(value, dict):
+        items = tuple((k, _freeze(v)) for k, v in value.items())
+        return type(value), items
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(value)
+    return value
+
+
+def _validator_key(validator: Validator) -> Optional[Hashable]:
+    """Key under which identically configured validators compare equal,
+    so that a check passed in one place can be recognised in another.
+
+    Returns None for validators whose outcome depends on more than the
+    value they check (`DependsOn`). The configuration of a validator is
+    read when its key is built (when a plan is built, or a spec
+    created): validators must not be reconfigured after use.
+    """
+    if isinstance(validator, DependsOn):
+        return None
+    if type(validator) is IntervalCheck:
+        # Equal to any other merge of identically configured bounds.
+        return (
+            IntervalCheck,
+            frozenset(map(_validator_key, validator.validators)),
+        )
+    try:
+        key = (type(validator), _freeze(vars(validator)))
+        hash(key)
+    except TypeError:
+        key = (type(validator), id(validator))
+    return key
+
+
+#: Proofs of objects certified without a wrapper: `id(obj)` maps to a
+#: weak reference to the object and the keys of the checks it passed.
+_PROOFS: dict[int, tuple[weakref.ref, frozenset]] = {}
+
+
+#: Types whose instances keep themselves valid and expose the keys of
+#: the checks they pass as `validated_keys`, e.g. `ValidatedList`. Only
+#: exact types are looked up.
+_PROOF_CARRIERS: set[type] = set()
+
+
+def _forget(obj_id: int, ref: weakref.ref) -> None:
+    entry = _PROOFS.get(obj_id)
+    if entry is not None and entry[0] is ref:
+        del _PROOFS[obj_id]
+
+
+def _proven_keys(value: object) -> Optional[frozenset]:
+    """Returns the keys of the checks `value` was certified against
+    without a wrapper, if any.
+    """
+    entry = _PROOFS.get(id(value))
+    if entry is not None and entry[0]() is value:
+        return entry[1]
+    return None
+
+
+def _is_frozen_dataclass(value: object) -> bool:
+    params = getattr(type(value), "__dataclass_params__", None)
+    return params is not None and params.frozen
+
+
+class Certified(Generic[T]):
+    """A value together with the proof that it passed a `ValidationSpec`.
+
+    Functions decorated with `validate_params` unwrap certified arguments
+    and skip the validators the spec covers; the function body receives
+    the plain value.
+    """
+
+    __slots__ = ("value", "keys", "spec_id")
+
+    def __init__(self, value: T, spec: "ValidationSpec") -> None:
+        self.value = value
+        self.keys = spec.keys
+        self.spec_id = spec.spec_id
+
+    def __repr__(self) -> str:
+        return f"Certified({self.value!r}, spec_id={self.spec_id!r})"
+
+
+class ValidationSpec:
+    """A reusable group of validators that values can be certified
+    against.
+
+    ```python
+    POSITIVE_IDS = ValidationSpec(
+        MustHaveLengthLessThanOrEqual(1000),
+        MustHaveValuesGreaterThan(0),
+        spec_id="positive_ids",
+    )
+    ids = POSITIVE_IDS.certify(tuple(ids))   # validated once, here
+    queue.put(ids)
+    ...
+    process(queue.get())   # MustHaveValuesGreaterThan(0) is skipped
+    ```
+
+    A validator of a decorated function is covered by the spec if the
+    spec contains a validator of the same type and configuration.
+    `DependsOn` validators are never covered.
+    """
+
+    def __init__(
+        self, *validators: Validator, spec_id: Optional[str] = None
+    ) -> None:
+        """
+        :param validators: The validators certified values pass.
+        :param spec_id: Name of the spec, for display purposes.
+        """
+        self.validators: tuple[Validator, ...] = validators
+        # Keys of the merged bounds too, to cover functions whose
+        # stacked bounds were merged (see `IntervalCheck`).
+        self.keys: frozenset = frozenset(
+            key
+            for key in map(
+                _validator_key, (*validators, *_merge_bounds(validators))
+            )
+            if key is not None
+        )
+        self.spec_id = spec_id or ", ".join(
+            type(v).__name__ for v in validators
+        )
+
+    def check(self, value: T, arg_name: str = "value") -> None:
+        """Runs every validator of the spec on `value`.
+
+        :raises ValidationError: If a validator fails.
+        """
+        for validator in self.validators:
+            validator(value, arg_name)
+
+    def certify(
+        self,
+        value: T,
+        arg_name: str = "value",
+        *,
+        wrap: Optional[bool] = None,
+    ) -> "T | Certified[T]":
+        """Checks `value` and attaches the proof to it.
+
+        :param value: The value to check.
+        :param arg_name: Name used in error messages.
+        :param wrap: If True, returns a `Certified` wrapper. If False,
+                     records the proof in a weak identity cache instead
+                     and returns `value` itself; only do this for
+                     objects that are not mutated afterwards. If None,
+                     instances of frozen dataclasses that support weak
+                     references are cached and anything else is wrapped.
+                     Default is None.
+
+        :raises ValidationError: If a validator fails.
+        :raises TypeError: If `wrap` is False and `value` does not
+                           support weak references.
+
+        :return: `value`, or `value` wrapped in `Certified`.
+        """
+        self.check(value, arg_name)
+
+        if wrap is None:
+            wrap = not (
+                _is_frozen_dataclass(value)
+                and hasattr(type(value), "__weakref__")
+            )
+        if wrap:
+            return Certified(value, self)
+
+        obj_id = id(value)
+        ref = weakref.ref(value, lambda r: _forget(obj_id, r))
+        known = _proven_keys(value) or frozenset()
+        _PROOFS[obj_id] = (ref, known | self.keys)
+        return value
@@ -0,0 +1,351 @@
+"""Validation of the columns of binary files of fixed-width records.
+
+The file is memory-mapped and decoded a bounded number of records at a
+time, and the pages already checked are handed back to the kernel, so
+memory use does not grow with the size of the file.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from typing import Final, Mapping, NamedTuple, Optional, Sequence, Union
+
+from ._validated_collections import LENGTH_VALIDATORS, _Length
+from .validators import DependsOn, ValidationError, Validator
+
+__all__ = [
+    "CHUNK_RECORDS",
+    "MAX_FAILURES",
+    "RecordFailure",
+    "validate_records",
+]
+
+#: Default number of records decoded at a time.
+CHUNK_RECORDS: Final[int] = 65_536
+
+#: Default number of failures after which the file is no longer walked.
+MAX_FAILURES: Final[int] = 100
+
+_NATIVE_ORDER: Final[str] = "<" if sys.byteorder == "little" else ">"
+
+#: Byte order prefixes of struct formats, as `<` or `>` (`@` and `=`
+#: are native).
+_BYTE_ORDERS: Final[dict[str, str]] = {
+    "@": _NATIVE_ORDER,
+    "=": _NATIVE_ORDER,
+    "<": "<",
+    ">": ">",
+    "!": ">",
+}
+
+#: Codes of dtype-like layouts (`<kind><size>`), as struct codes.
+_DTYPE_CODES: Final[dict[str, str]] = {
+    "b1": "?",
+    "i1": "b",
+    "i2": "h",
+    "i4": "i",
+    "i8": "q",
+    "u1": "B",
+    "u2": "H",
+    "u4": "I",
+    "u8": "Q",
+    "f2": "e",
+    "f4": "f",
+    "f8": "d",
+}
+
+#: Struct codes `memoryview.cast` accepts.
+_CAST_CODES: Final[str] = "?bBhHiIlLqQfd"
+
+Layout = Union[str, Sequence[tuple[str, str]]]
+ColumnValidators = Mapping[
+    Union[str, int], Union[Validator, Sequence[Validator]]
+]
+
+
+class RecordFailure(NamedTuple):
+    """A value rejected by a validator of its column."""
+
+    #: Index of the record in the file, or None if a length validator
+    #: rejected the number of records.
+    record: Optional[int]
+    #: Offset of the record in the file, in bytes (or None).
+    offset: Optional[int]
+    column: Union[str, int]
+    value: object
+    message: str
+
+
+class _Column(NamedTuple):
+    index: int
+    name: Union[str, int]
+    #: Validators that check every value of a collection, run on the
+    #: values of a whole chunk.
+    each_value: tuple[Validator, ...]
+    #: Validators of a single value, run on every value.
+    per_value: tuple[Validator, ...]
+    #: Validators of the number of records.
+    length: tuple[Validator, ...]
+
+
+def _value_count(record: struct.Struct) -> int:
+    return len(record.unpack(bytes(record.size)))
+
+
+def _parse_layout(layout: Layout) -> tuple[struct.Struct, list]:
+    """Returns the struct of a record and the names of its columns.
+
+    :raises ValueError: If the layout is invalid.
+    """
+    if isinstance(layout, str):
+        try:
+            record = struct.Struct(layout)
+        except struct.error as exc:
+            raise ValueError(f"Invalid record layout {layout!r}.") from exc
+        # Columns are numbered: "2i" is two columns.
+        return record, list(range(_value_count(record)))
+
+    orders = set()
+    codes = []
+    for name, code in layout:
+        if code[:1] in _BYTE_ORDERS:
+            orders.add(_BYTE_ORDERS[code[0]])
+            code = code[1:]
+        elif code[:1] == "|":
+            code = code[1:]
+        code = _DTYPE_CODES.get(code, code)
+        try:
+            field = struct.Struct("<" + code)
+        except struct.error as exc:
+            raise ValueError(f"Invalid code of field {name!r}.") from exc
+        if _value_count(field) != 1:
+            raise ValueError(
+                f"Field {name!r} must hold a single value, got {code!r}."
+            )
+        codes.append(code)
+    if len(orders) > 1:
+        raise ValueError("All fields of a layout must share a byte order.")
+    # Fields are packed, as in NumPy structured dtypes.
+    order = orders.pop() if orders else "="
+    return struct.Struct(order + "".join(codes)), [n for n, _ in layout]
+
+
+def _cast_code(record: struct.Struct) -> Optional[str]:
+    """Returns the code `memoryview.cast` reads records of a single
+    value with, or None if records must be unpacked.
+    """
+    order, code = record.format[0], record.format[1:]
+    if order not in _BYTE_ORDERS:
+        order, code = "@", record.format
+    if (
+        len(code) != 1
+        or code not in _CAST_CODES
+        or _BYTE_ORDERS[order] != _NATIVE_ORDER
+        or struct.calcsize("@" + code) != record.size
+    ):
+        return None
+    return code
+
+
+def _plan_columns(
+    validators: ColumnValidators, columns: list
+) -> list[_Column]:
+    plans = []
+    for name, column_validators in validators.items():
+        if name not in columns:
+            raise ValueError(
+                f"Unknown column {name!r}, columns are {columns!r}."
+            )
+        if isinstance(column_validators, Validator):
+            column_validators = (column_validators,)
+        each_value, per_value, length = [], [], []
+        for validator in column_validators:
+            if isinstance(validator, DependsOn):
+                raise TypeError("DependsOn can not validate a column.")
+            if isinstance(validator, LENGTH_VALIDATORS):
+                length.append(validator)
+            elif validator.CHECKS_EACH_VALUE:
+                each_value.append(validator)
+            elif validator.SCANS_VALUES:
+                raise TypeError(
+                    f"{type(validator).__name__} validates a whole "
+                    "collection, it can not validate a column."
+                )
+            else:
+                per_value.append(validator)
+        plans.append(
+            _Column(
+                columns.index(name),
+                name,
+                tuple(each_value),
+                tuple(per_value),
+                tuple(length),
+            )
+        )
+    return plans
+
+
+def _check_column(
+    column: _Column,
+    values: Sequence,
+    first: int,
+    budget: int,
+) -> list[tuple[int, object, str]]:
+    """Returns `(record, value, message)` for (at most `budget` of) the
+    values of a chunk that the validators of `column` reject.
+    """
+    failures = []
+    arg_name = str(column.name)
+    for validator in column.each_value:
+        try:
+            validator(values, arg_name)
+            continue
+        except ValidationError:
+            pass
+        # Failures are rare: only then are the values checked one by one.
+        for record, value in enumerate(values, first):
+            try:
+                validator((value,), arg_name)
+            except ValidationError as exc:
+                failures.append((record, value, str(exc)))
+                if len(failures) >= budget:
+                    return failures
+    for validator in column.per_value:
+        for record, value in enumerate(values, first):
+            try:
+                validator(value, arg_name)
+            except ValidationError as exc:
+                failures.append((record, value, str(exc)))
+                if len(failures) >= budget:
+                    return failures
+    return failures
+
+
+def _release_pages(mm: mmap.mmap, start: int, end: int) -> int:
+    """Hands the pages of `mm[start:end]` back to the kernel, where the
+    platform allows it. Returns the end of the released pages.
+    """
+    end -= end % mmap.PAGESIZE
+    if end > start and hasattr(mmap, "MADV_DONTNEED"):
+        mm.madvise(mmap.MADV_DONTNEED, start, end - start)
+        return end
+    return start
+
+
+def validate_records(
+    path: Union[str, os.PathLike],
+    layout: Layout,
+    validators: ColumnValidators,
+    *,
+    offset: int = 0,
+    chunk_records: int = CHUNK_RECORDS,
+    max_failures: Optional[int] = MAX_FAILURES,
+) -> list[RecordFailure]:
+    """Validates the columns of a binary file of fixed-width records,
+    without loading it in memory.
+
+    ```python
+    failures = validate_records(
+        "trades.bin",
+        [("id", "<u8"), ("price", "<f8"), ("side", "<i1")],
+        {
+            "price": MustBePositive(),
+            "side": MustBeMemberOf({-1, 1}),
+        },
+    )
+    # [RecordFailure(record=12, offset=204, column='price', ...)]
+    ```
+
+    :param path: Path of the file.
+    :param layout: Layout of a record: a `struct` format, whose columns
+                   are numbered from 0, or a sequence of `(name, code)`
+                   pairs, packed, where a code is a `struct` code or a
+                   NumPy-like one (e.g. `"<i8"`, `"f4"`).
+    :param validators: Validators of each column (by name or number):
+                       validators of a single value (e.g.
+                       `MustBeBetween`), of every value of a collection
+                       (e.g. `MustHaveValuesBetween`), or of a length,
+                       which check the number of records.
+    :param offset: Number of bytes before the first record, e.g. of a
+                   header. Default is 0.
+    :param chunk_records: Number of records decoded at a time. Default
+                          is `CHUNK_RECORDS`.
+    :param max_failures: Number of failures after which the walk stops,
+                         or None to report all of them. Default is
+                         `MAX_FAILURES`.
+
+    :raises ValueError: If the layout is invalid, a column is unknown or
+                        the file does not hold a whole number of
+                        records.
+    :raises TypeError: If a validator can not check a column.
+
+    :return: The failures, by record and then in the order of
+             `validators`. An empty list means the file is valid.
+    """
+    record, columns = _parse_layout(layout)
+    plans = _plan_columns(validators, columns)
+    if chunk_records < 1:
+        raise ValueError("chunk_records must be positive.")
+    limit = sys.maxsize if max_failures is None else max_failures
+
+    size = os.path.getsize(path) - offset
+    count, trailing = divmod(max(size, 0), record.size)
+    if size < 0 or trailing:
+        raise ValueError(
+            f"{os.fspath(path)!r} does not hold a whole number of "
+            f"{record.size} byte records after offset {offset}."
+        )
+
+    failures = []
+    for column in plans:
+        for validator in column.length:
+            try:
+                validator(_Length(count), str(column.name))
+            except ValidationError as exc:
+                failures.append(
+                    RecordFailure(None, None, column.name, count, str(exc))
+                )
+    if count == 0 or not any(c.each_value or c.per_value for c in plans):
+        return failures[:limit]
+
+    cast_code = _cast_code(record)
+    with (
+        open(path, "rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        released = 0
+        for first in range(0, count, chunk_records):
+            if len(failures) >= limit:
+                break
+            start = offset + first * record.size
+            end = offset + min(first + chunk_records, count) * record.size
+            with memoryview(mm)[start:end] as chunk:
+                if cast_code is not None:
+                    with chunk.cast(cast_code) as values:
+                        chunk_columns = (values.tolist(),)
+                else:
+                    chunk_columns = tuple(zip(*record.iter_unpack(chunk)))
+
+            chunk_failures = []
+            for column in plans:
+                chunk_failures += (
+                    RecordFailure(
+                        index,
+                        offset + index * record.size,
+                        column.name,
+                        value,
+                        message,
+                    )
+                    for index, value, message in _check_column(
+                        column,
+                        chunk_columns[column.index],
+                        first,
+                        limit - len(failures),
+                    )
+                )
+            chunk_failures.sort(key=lambda failure: failure.record)
+            failures += chunk_failures
+            del chunk_columns
+            released = _release_pages(mm, released, end)
+    return failures[:limit]
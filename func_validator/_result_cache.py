@@ -0,0 +1,193 @@
+"""Memoization for `validate_params(cache=...)`: results are cached under
+the normalized bound arguments the validators checked, so that a hit
+skips both the validation and the call.
+"""
+
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Final, Hashable, NamedTuple, Optional
+
+from ._instrumentation import FunctionStats
+
+__all__ = ["RESULT_CACHE_SIZE", "CacheInfo", "ResultCache"]
+
+#: Number of results cached per function with `cache=True`.
+RESULT_CACHE_SIZE: Final[int] = 128
+
+#: Returned by `ResultCache.get` on a miss.
+_MISSING: Final = object()
+
+#: Separates positional from keyword arguments in a raw key.
+_KWD_MARK: Final = object()
+
+
+def _raw_key(args: tuple, kwargs: dict) -> tuple:
+    """Builds a key from the arguments as passed, before they are bound,
+    like `functools.lru_cache(typed=True)` does.
+    """
+    if kwargs:
+        return (
+            *args,
+            _KWD_MARK,
+            *kwargs.items(),
+            *map(type, args),
+            *map(type, kwargs.values()),
+        )
+    return (*args, *map(type, args))
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the result cache of a function, returned by the
+    `cache_info()` method of functions decorated with
+    `validate_params(cache=...)`.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    maxsize: int
+    currsize: int
+
+
+class ResultCache:
+    """Bounded LRU cache of the results of a function, optionally
+    expiring entries `ttl` seconds after they were stored.
+
+    Keys are built by `validate_params` from the bound arguments (see
+    `_cache_key`), so calls that spell the same arguments differently
+    (positionally, by keyword, or relying on defaults) share an entry.
+    Only calls whose arguments passed validation and whose function
+    returned are cached.
+
+    Binding arguments costs more than the lookup itself, so the raw key
+    of the arguments as passed (see `_raw_key`) is also remembered as an
+    alias of the key: a call spelled like an earlier one is looked up
+    without binding.
+    """
+
+    __slots__ = (
+        "entries",
+        "aliases",
+        "maxsize",
+        "ttl",
+        "fn_stats",
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        fn_stats: FunctionStats,
+        maxsize: int = RESULT_CACHE_SIZE,
+        ttl: Optional[float] = None,
+    ) -> None:
+        #: Key maps to the result and the time it expires at, if any.
+        self.entries: OrderedDict[Hashable, tuple[object, Optional[float]]] = (
+            OrderedDict()
+        )
+        #: Raw key maps to the key it was bound to.
+        self.aliases: OrderedDict[Hashable, Hashable] = OrderedDict()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        #: Also counted in `fn_stats`, which may be shared with other
+        #: functions of the same name, and is reset by `reset_stats`.
+        self.fn_stats = fn_stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: Hashable) -> object:
+        # Called with the lock held.
+        entry = self.entries.get(key)
+        if entry is None:
+            return _MISSING
+        result, expires_at = entry
+        if expires_at is not None and monotonic() >= expires_at:
+            del self.entries[key]
+            self.expirations += 1
+            self.fn_stats.count("result_cache_expirations")
+            return _MISSING
+        self.entries.move_to_end(key)
+        self.hits += 1
+        self.fn_stats.count("result_cache_hits")
+        return result
+
+    def get_unbound(self, raw_key: Hashable) -> object:
+        """Returns the result cached for the arguments as passed, or
+        `_MISSING` (which is not counted as a miss: `get` follows).
+        """
+        with self._lock:
+            try:
+                key = self.aliases.get(raw_key)
+            except TypeError:
+                return _MISSING
+            if key is None:
+                return _MISSING
+            return self._lookup(key)
+
+    def get(self, key: Hashable, raw_key: Hashable) -> object:
+        """Returns the result cached under `key`, or `_MISSING`. Keys that
+        can not be hashed are never cached.
+        """
+        with self._lock:
+            try:
+                result = self._lookup(key)
+            except TypeError:
+                return _MISSING
+            if result is not _MISSING:
+                self._alias(raw_key, key)
+                return result
+            self.misses += 1
+        self.fn_stats.count("result_cache_misses")
+        return _MISSING
+
+    def put(self, key: Hashable, raw_key: Hashable, result: object) -> None:
+        expires_at = None if self.ttl is None else monotonic() + self.ttl
+        with self._lock:
+            try:
+                self.entries[key] = (result, expires_at)
+            except TypeError:
+                return
+            self.entries.move_to_end(key)
+            self._alias(raw_key, key)
+            evicted = 0
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                evicted += 1
+            self.evictions += evicted
+        if evicted:
+            self.fn_stats.count("result_cache_evictions", evicted)
+
+    def _alias(self, raw_key: Hashable, key: Hashable) -> None:
+        # Called with the lock held. Aliases of evicted entries are left
+        # to age out: looking them up is merely a miss.
+        try:
+            self.aliases[raw_key] = key
+        except TypeError:
+            return
+        self.aliases.move_to_end(raw_key)
+        if len(self.aliases) > self.maxsize:
+            self.aliases.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.entries.clear()
+            self.aliases.clear()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.expirations,
+                self.maxsize,
+                len(self.entries),
+            )
@@ -0,0 +1,193 @@
+"""Validation of rows of data (e.g. the records of a CSV or JSON Lines
+file) against the annotated parameters of a function decorated with
+`validate_params`, without calling the function.
+"""
+
+import inspect
+from importlib import import_module
+from typing import (
+    Annotated,
+    Callable,
+    Mapping,
+    Optional,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from ._func_arg_validator import (
+    _is_arg_type_optional,
+    _iter_arg_validators,
+    _owner_namespace,
+)
+from .validators import ValidationError
+
+__all__ = ["RowChecker", "load_function"]
+
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "y", "on"})
+_FALSE_STRINGS = frozenset({"0", "false", "no", "n", "off"})
+
+#: Error of a row: the argument and the validator it concerns (if any),
+#: and a message.
+RowError = dict[str, Optional[str]]
+
+
+def load_function(target: str) -> Callable:
+    """Imports the function `module:qualname`.
+
+    :raises ValueError: If `target` is not of the form `module:name`.
+    :raises ImportError: If the module can not be imported.
+    :raises AttributeError: If the module has no such function.
+    """
+    module_name, sep, qualname = target.partition(":")
+    if not sep or not module_name or not qualname:
+        raise ValueError(f"Expected module:function, got {target!r}.")
+    obj = import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _parse_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in _TRUE_STRINGS:
+        return True
+    if lowered in _FALSE_STRINGS:
+        return False
+    raise ValueError(f"{value!r} is not a boolean.")
+
+
+#: Parsers of text values, by annotated type.
+_PARSERS: dict[type, Callable[[str], object]] = {
+    bool: _parse_bool,
+    float: float,
+    int: int,
+}
+
+
+def _text_parser(annotation) -> Optional[Callable[[str], object]]:
+    """Returns the parser of the text form of a value of `annotation`,
+    or None if text is to be passed as is.
+    """
+    if get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+    optional = _is_arg_type_optional(annotation)
+    if optional:
+        annotation = get_args(annotation)[0]
+    parser = _PARSERS.get(annotation)
+    if not optional:
+        return parser
+
+    def convert(value: str):
+        if value == "":
+            return None
+        return value if parser is None else parser(value)
+
+    return convert
+
+
+class RowChecker:
+    """Checks rows, i.e. mappings of parameter names to values, against
+    the validators of the parameters of `fn`.
+
+    :param fn: A function decorated with `validate_params`.
+    :param parse_text: If True, text values are parsed according to the
+                       annotated type of their parameter (`int`,
+                       `float`, `bool`, or `Optional` of one of these,
+                       where an empty string is None), as needed for
+                       CSV files. Default is False.
+
+    :raises TypeError: If `fn` is not decorated with `validate_params`.
+    """
+
+    def __init__(self, fn: Callable, *, parse_text: bool = False) -> None:
+        plan = getattr(fn, "__validation_plan__", None)
+        if plan is None:
+            raise TypeError(
+                f"{getattr(fn, '__qualname__', fn)!r} is not decorated "
+                "with validate_params."
+            )
+        self.plan = plan.compile()
+        params = plan.signature.parameters.values()
+        kinds = (
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        )
+        self.names = frozenset(p.name for p in params if p.kind not in kinds)
+        self.defaults = {
+            p.name: p.default
+            for p in params
+            if p.kind not in kinds and p.default is not p.empty
+        }
+        for p in params:
+            if p.kind is inspect.Parameter.VAR_POSITIONAL:
+                self.defaults[p.name] = ()
+        self.required = self.names - self.defaults.keys()
+
+        self.parsers: dict[str, Callable[[str], object]] = {}
+        if parse_text:
+            hints = get_type_hints(
+                plan.fn,
+                localns=_owner_namespace(plan.owner),
+                include_extras=True,
+            )
+            for name in self.names:
+                parser = _text_parser(hints.get(name, str))
+                if parser is not None:
+                    self.parsers[name] = parser
+
+    def _bind(self, row: Mapping, errors: list[RowError]) -> dict:
+        arguments = dict(self.defaults)
+        extra = {}
+        for name, value in row.items():
+            if name not in self.names:
+                extra[name] = value
+                continue
+            parser = self.parsers.get(name)
+            if parser is not None and isinstance(value, str):
+                try:
+                    value = parser(value)
+                except ValueError as exc:
+                    errors.append(_error(name, None, str(exc)))
+                    continue
+            arguments[name] = value
+
+        for name in sorted(self.required - row.keys()):
+            errors.append(_error(name, None, "Missing value."))
+        if self.plan.var_keyword is not None:
+            arguments[self.plan.var_keyword] = extra
+        else:
+            for name in extra:
+                errors.append(_error(str(name), None, "Unexpected value."))
+        return arguments
+
+    def check(self, row: Mapping) -> list[RowError]:
+        """Returns the errors of `row`: every argument that can not be
+        bound or parsed, and the first failing validator of every other
+        argument. An empty list means the row is valid.
+        """
+        errors = []
+        arguments = self._bind(row, errors)
+        if errors:
+            return errors
+
+        failed = set()
+        for arg_name, arg_value, validator in _iter_arg_validators(
+            self.plan, arguments
+        ):
+            if arg_name in failed:
+                continue
+            try:
+                validator(arg_value, arg_name)
+            except (ValidationError, TypeError) as exc:
+                failed.add(arg_name)
+                errors.append(
+                    _error(arg_name, type(validator).__name__, str(exc))
+                )
+        return errors
+
+
+def _error(
+    argument: Optional[str], validator: Optional[str], message: str
+) -> RowError:
+    return {"argument": argument, "validator": validator, "message": message}
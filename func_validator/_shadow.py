@@ -0,0 +1,193 @@
+"""Shadow validation for `validate_params(mode="shadow")`: the arguments
+of a call are queued for a background worker thread to validate, and the
+function is called right away, whatever the outcome.
+
+All shadowed functions share one bounded queue and one worker. When the
+queue is full, new checks are dropped (and counted) rather than making
+callers wait: shadow mode measures how often validation would fail, it
+must not add latency when the worker falls behind. Its size is set with
+`set_shadow_queue_size`.
+
+Arguments are queued as passed, not copied: an argument mutated by the
+function (or by its caller) before the worker gets to it is checked as
+it is then.
+"""
+
+import logging
+import os
+import queue
+import threading
+from typing import Callable, Final, NamedTuple, Optional
+
+from ._instrumentation import FunctionStats
+
+__all__ = [
+    "SHADOW_QUEUE_SIZE",
+    "ShadowFailureHandler",
+    "ShadowInfo",
+    "ShadowQueue",
+    "ShadowStats",
+    "flush_shadow_queue",
+    "set_shadow_queue_size",
+]
+
+#: Number of checks the shadow queue holds by default before new ones
+#: are dropped, see `set_shadow_queue_size`.
+SHADOW_QUEUE_SIZE: Final[int] = 1024
+
+#: Called by the worker thread with the qualified name of the function
+#: and the error its arguments raised.
+ShadowFailureHandler = Callable[[str, Exception], None]
+
+_LOGGER: Final = logging.getLogger("func_validator")
+
+
+def _log_failure(fn_name: str, error: Exception) -> None:
+    _LOGGER.warning("Shadow validation of %s failed: %s", fn_name, error)
+
+
+class ShadowInfo(NamedTuple):
+    """Statistics of the shadow validation of a function, returned by
+    the `shadow_info()` method of functions decorated with
+    `validate_params(mode="shadow")`.
+    """
+
+    #: Calls whose arguments were validated.
+    checks: int
+    #: Calls whose arguments failed validation.
+    failures: int
+    #: Calls not validated because the queue was full.
+    drops: int
+    #: Checks waiting in the queue, of all shadowed functions.
+    depth: int
+    maxsize: int
+
+
+class ShadowQueue:
+    """Bounded queue of checks, run in order by a daemon worker thread
+    started on the first submission (and again in a forked child).
+    """
+
+    __slots__ = ("maxsize", "_queue", "_worker", "_lock")
+
+    def __init__(self, maxsize: int = SHADOW_QUEUE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, check: Callable[[], None]) -> bool:
+        """Queues `check` without blocking. Returns False if the queue
+        is full and `check` was dropped.
+        """
+        if self._worker is None:
+            self._start()
+        try:
+            self._queue.put_nowait(check)
+        except queue.Full:
+            return False
+        return True
+
+    def resize(self, maxsize: int) -> None:
+        """Sets the number of checks the queue holds. Checks already
+        queued are kept, even if they exceed `maxsize`.
+        """
+        checks = self._queue
+        with checks.mutex:
+            self.maxsize = checks.maxsize = maxsize
+            checks.not_full.notify_all()
+
+    def join(self) -> None:
+        """Blocks until every queued check has run."""
+        self._queue.join()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name="func_validator-shadow",
+                    daemon=True,
+                )
+                self._worker.start()
+
+    def _after_fork(self) -> None:
+        # The worker did not survive the fork, nor did the checks it
+        # had yet to run.
+        self._queue = queue.Queue(self.maxsize)
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def _run(self) -> None:
+        checks = self._queue
+        while True:
+            check = checks.get()
+            try:
+                check()
+            except Exception:
+                _LOGGER.exception("Shadow validation check raised.")
+            finally:
+                checks.task_done()
+
+
+_QUEUE: Final[ShadowQueue] = ShadowQueue()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_QUEUE._after_fork)
+
+
+def shadow_queue() -> ShadowQueue:
+    return _QUEUE
+
+
+class ShadowStats:
+    """Shadow validation counters of a single decorated function, also
+    counted (as `shadow_<counter>`) in `fn_stats`, which may be shared
+    with other functions of the same name, and is reset by
+    `reset_stats`.
+    """
+
+    __slots__ = ("fn_stats", "checks", "failures", "drops", "_lock")
+
+    def __init__(self, fn_stats: FunctionStats) -> None:
+        self.fn_stats = fn_stats
+        self.checks = 0
+        self.failures = 0
+        self.drops = 0
+        self._lock = threading.Lock()
+
+    def count(self, counter: str) -> None:
+        """Adds 1 to `counter`: "checks", "failures" or "drops"."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+        self.fn_stats.count(f"shadow_{counter}")
+
+    def info(self) -> ShadowInfo:
+        with self._lock:
+            checks, failures, drops = self.checks, self.failures, self.drops
+        return ShadowInfo(
+            checks, failures, drops, _QUEUE.depth, _QUEUE.maxsize
+        )
+
+
+def set_shadow_queue_size(maxsize: int) -> None:
+    """Sets the number of checks the shadow queue (shared by every
+    shadowed function) holds before new ones are dropped. Default is
+    `SHADOW_QUEUE_SIZE`.
+
+    :raises ValueError: If `maxsize` is less than 1.
+    """
+    if maxsize < 1:
+        raise ValueError(f"maxsize must be positive, got {maxsize!r}.")
+    _QUEUE.resize(maxsize)
+
+
+def flush_shadow_queue() -> None:
+    """Blocks until the shadow validation of every call made so far has
+    run, e.g. before reading `shadow_info()` in tests or at shutdown.
+    """
+    _QUEUE.join()
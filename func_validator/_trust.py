@@ -0,0 +1,52 @@
+"""Call-chain trust: nested validated calls skip checks that already
+passed, earlier in the same call chain, for the very same object.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Final, Hashable, Iterator, Optional
+
+__all__ = ["IMMUTABLE_TYPES", "trusted_context"]
+
+#: Types whose instances are trusted not to change once validated. Only
+#: exact types are trusted, as subclasses may add mutable state. Tuples
+#: and frozensets are trusted shallowly: their items are assumed to be
+#: immutable as well.
+IMMUTABLE_TYPES: Final[frozenset[type]] = frozenset(
+    {
+        bool,
+        bytes,
+        complex,
+        float,
+        frozenset,
+        int,
+        range,
+        str,
+        tuple,
+        type(None),
+    }
+)
+
+#: Validated objects of the current call chain: `id(obj)` maps to the
+#: object (kept alive so that its id cannot be reused) and the keys of
+#: the validators it passed.
+_PassedChecks = dict[int, tuple[object, set[Hashable]]]
+_TRUSTED: ContextVar[Optional[_PassedChecks]] = ContextVar(
+    "func_validator_trusted", default=None
+)
+
+
+@contextmanager
+def trusted_context() -> Iterator[None]:
+    """Shares one trusted context between all the functions decorated with
+    `validate_params(trust_chain=True)` that run inside the block, e.g.
+    all the calls made while handling one request.
+
+    Without it, the outermost `trust_chain` function of a call chain
+    opens a context that lasts for that call.
+    """
+    token = _TRUSTED.set({})
+    try:
+        yield
+    finally:
+        _TRUSTED.reset(token)
@@ -0,0 +1,436 @@
+"""Collections that keep themselves valid: values are checked as they are
+inserted and length constraints as the length changes, so a decorated
+function receiving one does not have to scan it again.
+"""
+
+from itertools import chain
+from typing import Hashable, Iterable, TypeVar
+
+from ._proof import _PROOF_CARRIERS, _validator_key
+from .validators import (
+    MustBeEmpty,
+    MustBeNonEmpty,
+    MustHaveLengthBetween,
+    MustHaveLengthEqual,
+    MustHaveLengthGreaterThan,
+    MustHaveLengthGreaterThanOrEqual,
+    MustHaveLengthLessThan,
+    MustHaveLengthLessThanOrEqual,
+    Validator,
+)
+
+__all__ = ["ValidatedDict", "ValidatedList", "ValidatedSet"]
+
+K = TypeVar("K")
+V = TypeVar("V")
+T = TypeVar("T")
+
+_MISSING = object()
+
+#: Validators that only look at the length of their argument.
+LENGTH_VALIDATORS = (
+    MustBeEmpty,
+    MustBeNonEmpty,
+    MustHaveLengthBetween,
+    MustHaveLengthEqual,
+    MustHaveLengthGreaterThan,
+    MustHaveLengthGreaterThanOrEqual,
+    MustHaveLengthLessThan,
+    MustHaveLengthLessThanOrEqual,
+)
+
+
+class _Length:
+    """Stands in for a collection of the given length, so that length
+    validators can check a mutation before it is made.
+    """
+
+    __slots__ = ("length",)
+
+    def __init__(self, length: int) -> None:
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+
+class _Constraints:
+    """The validators of a validated collection, split by how they are
+    maintained.
+    """
+
+    __slots__ = ("name", "each_value", "length", "keys")
+
+    def __init__(self, validators: Iterable[Validator], name: str) -> None:
+        self.name = name
+        each_value = []
+        length = []
+        for validator in validators:
+            if getattr(validator, "CHECKS_EACH_VALUE", False):
+                each_value.append(validator)
+            elif isinstance(validator, LENGTH_VALIDATORS):
+                length.append(validator)
+            else:
+                raise TypeError(
+                    f"{type(validator).__name__} can not be maintained "
+                    "incrementally; validated collections accept "
+                    "validators of each value and length validators."
+                )
+        self.each_value: tuple[Validator, ...] = tuple(each_value)
+        self.length: tuple[Validator, ...] = tuple(length)
+        # Sampled validators only check some of the values inserted, so
+        # they are not proven to hold for every value.
+        self.keys: frozenset[Hashable] = frozenset(
+            _validator_key(validator)
+            for validator in chain(each_value, length)
+            if getattr(validator, "sampler", None) is None
+        )
+
+    def check_values(self, values: Iterable) -> None:
+        for validator in self.each_value:
+            validator(values, self.name)
+
+    def check_length(self, length: int) -> None:
+        if self.length:
+            sized = _Length(length)
+            for validator in self.length:
+                validator(sized, self.name)
+
+
+def _rebuild(cls: type, data, validators: tuple, kwargs: dict):
+    return cls(data, *validators, **kwargs)
+
+
+class _ValidatedCollection:
+    """Registers subclasses as proof carriers: decorated functions skip
+    the validators of their arguments that `validated_keys` covers.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        _PROOF_CARRIERS.add(cls)
+
+    @property
+    def validators(self) -> tuple[Validator, ...]:
+        return self._constraints.each_value + self._constraints.length
+
+    @property
+    def validated_keys(self) -> frozenset[Hashable]:
+        return self._constraints.keys
+
+    def _init_kwargs(self) -> dict:
+        return {"name": self._constraints.name}
+
+    def __reduce__(self):
+        # The default reduction restores the items through the checked
+        # mutators before the validators are restored.
+        data = dict(self) if isinstance(self, dict) else list(self)
+        return (
+            _rebuild,
+            (type(self), data, self.validators, self._init_kwargs()),
+        )
+
+
+class ValidatedList(_ValidatedCollection, list[T]):
+    """A list that checks every value it receives and its length on every
+    mutation, and rejects (before applying it) any mutation that would
+    make it invalid.
+
+    ```python
+    readings = ValidatedList([], MustHaveValuesGreaterThanOrEqual(0))
+    readings.append(3.2)   # checks 3.2 only
+
+    @validate_params
+    def mean(values: Annotated[list, MustHaveValuesGreaterThanOrEqual(0)]):
+        ...
+
+    mean(readings)   # no scan: readings is known to be valid
+    ```
+
+    Accepted validators are those that check each value on its own
+    (`MustHaveValues*`) and length validators (`MustHaveLength*`,
+    `MustBeEmpty`, `MustBeNonEmpty`). Operations that return a new list
+    (`+`, slicing, `copy`) return a plain `list`. Mutations made through
+    `list` methods called on the class directly bypass the checks.
+    """
+
+    __slots__ = ("_constraints",)
+
+    def __init__(
+        self,
+        iterable: Iterable[T] = (),
+        /,
+        *validators: Validator,
+        name: str = "value",
+    ) -> None:
+        """
+        :param iterable: The initial values, checked in full.
+        :param validators: The validators the list must always pass.
+        :param name: Name used in error messages.
+
+        :raises TypeError: If a validator can not be maintained
+                           incrementally.
+        :raises ValidationError: If the initial values are invalid.
+        """
+        self._constraints = _Constraints(validators, name)
+        values = list(iterable)
+        self._constraints.check_values(values)
+        self._constraints.check_length(len(values))
+        super().__init__(values)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list.__repr__(self)})"
+
+    def append(self, value: T) -> None:
+        self._constraints.check_values((value,))
+        self._constraints.check_length(len(self) + 1)
+        super().append(value)
+
+    def insert(self, index: int, value: T) -> None:
+        self._constraints.check_values((value,))
+        self._constraints.check_length(len(self) + 1)
+        super().insert(index, value)
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        values = list(iterable)
+        self._constraints.check_values(values)
+        self._constraints.check_length(len(self) + len(values))
+        super().extend(values)
+
+    def __iadd__(self, iterable: Iterable[T]) -> "ValidatedList[T]":
+        self.extend(iterable)
+        return self
+
+    def __imul__(self, n: int) -> "ValidatedList[T]":
+        self._constraints.check_length(len(self) * max(n, 0))
+        return super().__imul__(n)
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            values = list(value)
+            self._constraints.check_values(values)
+            removed = len(range(*index.indices(len(self))))
+            self._constraints.check_length(len(self) - removed + len(values))
+            super().__setitem__(index, values)
+        else:
+            self._constraints.check_values((value,))
+            super().__setitem__(index, value)
+
+    def __delitem__(self, index) -> None:
+        if isinstance(index, slice):
+            removed = len(range(*index.indices(len(self))))
+        else:
+            self[index]  # raises IndexError before any check
+            removed = 1
+        self._constraints.check_length(len(self) - removed)
+        super().__delitem__(index)
+
+    def pop(self, index: int = -1) -> T:
+        if self:
+            self._constraints.check_length(len(self) - 1)
+        return super().pop(index)
+
+    def remove(self, value: T) -> None:
+        index = self.index(value)
+        self._constraints.check_length(len(self) - 1)
+        super().__delitem__(index)
+
+    def clear(self) -> None:
+        self._constraints.check_length(0)
+        super().clear()
+
+
+class ValidatedSet(_ValidatedCollection, set[T]):
+    """A set that checks every value added to it and its length on every
+    mutation, see `ValidatedList`.
+
+    Operations that return a new set (`|`, `&`, `copy`, ...) return a
+    plain `set`.
+    """
+
+    __slots__ = ("_constraints",)
+
+    def __init__(
+        self,
+        iterable: Iterable[T] = (),
+        /,
+        *validators: Validator,
+        name: str = "value",
+    ) -> None:
+        """
+        :param iterable: The initial values, checked in full.
+        :param validators: The validators the set must always pass.
+        :param name: Name used in error messages.
+
+        :raises TypeError: If a validator can not be maintained
+                           incrementally.
+        :raises ValidationError: If the initial values are invalid.
+        """
+        self._constraints = _Constraints(validators, name)
+        values = set(iterable)
+        self._constraints.check_values(values)
+        self._constraints.check_length(len(values))
+        super().__init__(values)
+
+    def _check_result(self, added: set, length: int) -> None:
+        self._constraints.check_values(added)
+        self._constraints.check_length(length)
+
+    def add(self, value: T) -> None:
+        if value not in self:
+            self._check_result({value}, len(self) + 1)
+            super().add(value)
+
+    def update(self, *iterables: Iterable[T]) -> None:
+        added = set().union(*iterables) - self
+        self._check_result(added, len(self) + len(added))
+        super().update(added)
+
+    def __ior__(self, other: Iterable[T]) -> "ValidatedSet[T]":
+        self.update(other)
+        return self
+
+    def symmetric_difference_update(self, other: Iterable[T]) -> None:
+        other = set(other)
+        added = other - self
+        removed = len(other) - len(added)
+        self._check_result(added, len(self) - removed + len(added))
+        super().symmetric_difference_update(other)
+
+    def __ixor__(self, other: Iterable[T]) -> "ValidatedSet[T]":
+        self.symmetric_difference_update(other)
+        return self
+
+    def intersection_update(self, *iterables: Iterable[T]) -> None:
+        kept = set.intersection(self, *iterables)
+        self._check_result(set(), len(kept))
+        super().intersection_update(kept)
+
+    def __iand__(self, other: Iterable[T]) -> "ValidatedSet[T]":
+        self.intersection_update(other)
+        return self
+
+    def difference_update(self, *iterables: Iterable[T]) -> None:
+        removed = set().union(*iterables) & self
+        self._check_result(set(), len(self) - len(removed))
+        super().difference_update(removed)
+
+    def __isub__(self, other: Iterable[T]) -> "ValidatedSet[T]":
+        self.difference_update(other)
+        return self
+
+    def discard(self, value: T) -> None:
+        if value in self:
+            self.remove(value)
+
+    def remove(self, value: T) -> None:
+        if value in self:
+            self._check_result(set(), len(self) - 1)
+        super().remove(value)
+
+    def pop(self) -> T:
+        if self:
+            self._check_result(set(), len(self) - 1)
+        return super().pop()
+
+    def clear(self) -> None:
+        self._check_result(set(), 0)
+        super().clear()
+
+
+class ValidatedDict(_ValidatedCollection, dict[K, V]):
+    """A dict that checks every key (and, with `value_validators`, every
+    value) it receives and its length on every mutation, see
+    `ValidatedList`.
+
+    Like the validators themselves, which iterate over the keys of a dict
+    argument, `validators` apply to the keys. Only they are recognised by
+    decorated functions.
+    """
+
+    __slots__ = ("_constraints", "_value_constraints")
+
+    def __init__(
+        self,
+        mapping=(),
+        /,
+        *validators: Validator,
+        value_validators: Iterable[Validator] = (),
+        name: str = "value",
+        **kwargs: V,
+    ) -> None:
+        """
+        :param mapping: The initial items, checked in full.
+        :param validators: The validators the keys (and length) of the
+                           dict must always pass.
+        :param value_validators: Validators of each value of the dict.
+        :param name: Name used in error messages.
+        :param kwargs: More initial items.
+
+        :raises TypeError: If a validator can not be maintained
+                           incrementally.
+        :raises ValidationError: If the initial items are invalid.
+        """
+        self._constraints = _Constraints(validators, name)
+        self._value_constraints = _Constraints(value_validators, name)
+        if self._value_constraints.length:
+            raise TypeError("Length validators apply to `validators`.")
+        items = dict(mapping, **kwargs)
+        self._check_items(items, len(items))
+        super().__init__(items)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict.__repr__(self)})"
+
+    def _init_kwargs(self) -> dict:
+        return {
+            "name": self._constraints.name,
+            "value_validators": self._value_constraints.each_value,
+        }
+
+    def _check_items(self, items: dict, length: int) -> None:
+        self._constraints.check_values(items.keys())
+        self._value_constraints.check_values(items.values())
+        self._constraints.check_length(length)
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._check_items({key: value}, len(self) + (key not in self))
+        super().__setitem__(key, value)
+
+    def setdefault(self, key: K, default: V = None) -> V:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, other=(), /, **kwargs: V) -> None:
+        items = dict(other, **kwargs)
+        added = sum(1 for key in items if key not in self)
+        self._check_items(items, len(self) + added)
+        super().update(items)
+
+    def __ior__(self, other) -> "ValidatedDict[K, V]":
+        self.update(other)
+        return self
+
+    def __delitem__(self, key: K) -> None:
+        if key in self:
+            self._constraints.check_length(len(self) - 1)
+        super().__delitem__(key)
+
+    def pop(self, key: K, default=_MISSING) -> V:
+        if key in self:
+            self._constraints.check_length(len(self) - 1)
+        elif default is not _MISSING:
+            return default
+        return super().pop(key)
+
+    def popitem(self) -> tuple[K, V]:
+        if self:
+            self._constraints.check_length(len(self) - 1)
+        return super().popitem()
+
+    def clear(self) -> None:
+        self._constraints.check_length(0)
+        super().clear()
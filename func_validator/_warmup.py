@@ -0,0 +1,87 @@
+import gc
+from importlib import import_module
+from types import ModuleType
+from typing import Iterable, Optional, Union
+
+from ._func_arg_validator import _ValidationPlan, compile_all
+
+__all__ = ["warmup"]
+
+
+def _unwrap_member(member: object) -> object:
+    if isinstance(member, (staticmethod, classmethod)):
+        return member.__func__
+    return member
+
+
+def _iter_plans(namespace: dict, seen: set[int]) -> Iterable[_ValidationPlan]:
+    for member in list(namespace.values()):
+        member = _unwrap_member(member)
+        if id(member) in seen:
+            continue
+        seen.add(id(member))
+
+        if isinstance(member, property):
+            for accessor in (member.fget, member.fset, member.fdel):
+                plan = getattr(accessor, "__validation_plan__", None)
+                if isinstance(plan, _ValidationPlan):
+                    yield plan
+        elif isinstance(member, type):
+            yield from _iter_plans(dict(vars(member)), seen)
+        else:
+            plan = getattr(member, "__validation_plan__", None)
+            if isinstance(plan, _ValidationPlan):
+                yield plan
+
+
+def warmup(
+    modules: Optional[Iterable[Union[str, ModuleType]]] = None,
+    *,
+    freeze: bool = True,
+) -> int:
+    """Builds the validation plans of the functions decorated in `modules`
+    ahead of time, typically in a pre-fork server before workers are
+    forked (e.g. gunicorn with `preload_app = True`).
+
+    Functions, methods (including static and class methods and property
+    accessors) and nested classes found in each module are visited. Once
+    built, a plan is not rebuilt, so after a fork workers share it with
+    the parent instead of each building their own copy. Calls do still
+    write to some of it: `DependsOn` validators are handed the arguments
+    of every call, and identity caches record the values that passed, so
+    the pages holding those are copied by the first call of a worker
+    that uses them.
+
+    With `freeze`, a full collection is run and `gc.freeze()` moves every
+    surviving object to the permanent generation, so the cyclic garbage
+    collector of a worker does not touch (and thereby copy) the pages
+    holding the plans.
+
+    :param modules: Modules, or names of modules to import, to walk. If
+                    None, every decorated function is compiled, see
+                    `func_validator.compile_all`.
+    :param freeze: If True, calls `gc.freeze()` once plans are built.
+                   Default is True.
+
+    :raises NameError: If an annotation refers to an undefined name.
+
+    :return: The number of plans that were built.
+    """
+    if modules is None:
+        compiled = compile_all()
+    else:
+        compiled = 0
+        seen: set[int] = set()
+        for module in modules:
+            if isinstance(module, str):
+                module = import_module(module)
+            for plan in _iter_plans(dict(vars(module)), seen):
+                if not plan.is_compiled:
+                    plan.compile()
+                    compiled += 1
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+
+    return compiled
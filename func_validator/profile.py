@@ -0,0 +1,191 @@
+"""Attributes the runtime of a workload to argument validation and to the
+bodies of the functions decorated with `validate_params`.
+
+Usage::
+
+    python -m func_validator.profile [options] script.py [script args]
+    python -m func_validator.profile [options] -m module [module args]
+
+Instrumentation is switched on before the workload is imported, so every
+function it decorates reports how much time went to argument binding,
+type checks, each validator and the function body. Functions are listed
+by total validation cost. Validators that scan every value of a
+collection are flagged when they run on frequently called functions;
+those are the best candidates for sampled or batched validation.
+"""
+
+import argparse
+import os
+import runpy
+import sys
+from typing import Optional, TextIO
+
+from ._instrumentation import (
+    disable_instrumentation,
+    enable_instrumentation,
+    is_instrumentation_enabled,
+    reset_stats,
+    stats,
+)
+
+__all__ = ["format_report", "main"]
+
+#: Name under which type checks enabled by `check_arg_types` are recorded.
+TYPE_CHECK_VALIDATOR = "MustBeA"
+
+
+def _fmt_seconds(seconds: float) -> str:
+    if seconds >= 1.0:
+        return f"{seconds:.2f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.1f}us"
+
+
+def format_report(
+    functions: dict[str, dict],
+    *,
+    hot_calls: int = 10_000,
+    top: Optional[int] = None,
+) -> str:
+    """Formats the statistics of `func_validator.stats()` as a report.
+
+    :param functions: The `functions` of a `StatsSnapshot`.
+    :param hot_calls: Number of calls from which a function counts as
+                      frequently called.
+    :param top: Only report the `top` most expensive functions.
+    """
+    ranked = sorted(
+        ((name, data) for name, data in functions.items() if data["calls"]),
+        key=lambda item: item[1]["validation_seconds"],
+        reverse=True,
+    )[:top]
+
+    lines = []
+    header = (
+        f"{'function':<40}{'calls':>10}{'bind':>11}{'types':>11}"
+        f"{'validators':>12}{'body':>11}{'validation':>12}{'share':>8}"
+    )
+    lines.append(header)
+    lines.append("-" * len(header))
+
+    warnings = []
+    for name, data in ranked:
+        type_seconds = sum(
+            v["seconds"]
+            for v in data["validators"]
+            if v["validator"] == TYPE_CHECK_VALIDATOR
+        )
+        validator_seconds = sum(
+            v["seconds"]
+            for v in data["validators"]
+            if v["validator"] != TYPE_CHECK_VALIDATOR
+        )
+        total = data["validation_seconds"] + data["body_seconds"]
+        share = data["validation_seconds"] / total if total else 0.0
+        lines.append(
+            f"{name[-40:]:<40}{data['calls']:>10}"
+            f"{_fmt_seconds(data['bind_seconds']):>11}"
+            f"{_fmt_seconds(type_seconds):>11}"
+            f"{_fmt_seconds(validator_seconds):>12}"
+            f"{_fmt_seconds(data['body_seconds']):>11}"
+            f"{_fmt_seconds(data['validation_seconds']):>12}"
+            f"{share:>8.0%}"
+        )
+        for v in sorted(
+            data["validators"], key=lambda v: v["seconds"], reverse=True
+        ):
+            label = f"  {v['argument']}: {v['validator']}"
+            lines.append(
+                f"{label[:52]:<52}{v['calls']:>10}"
+                f"{_fmt_seconds(v['seconds']):>12}"
+                f"{v['failures']:>10} failed"
+            )
+            if v["scans_values"] and data["calls"] >= hot_calls:
+                warnings.append(
+                    f"{name}: {v['validator']} scans every value of "
+                    f"'{v['argument']}' on each of {data['calls']} calls "
+                    f"({_fmt_seconds(v['seconds'])}); consider sampled or "
+                    f"batched validation."
+                )
+
+    if warnings:
+        lines.append("")
+        lines.append("Collection scans on frequently called functions:")
+        lines.extend(f"  ! {w}" for w in warnings)
+
+    return "\n".join(lines)
+
+
+def _run(target: str, args: list[str], as_module: bool):
+    saved_argv, saved_path = sys.argv, sys.path[:]
+    sys.argv = [target, *args]
+    try:
+        if as_module:
+            runpy.run_module(target, run_name="__main__", alter_sys=True)
+        else:
+            sys.path.insert(0, os.path.dirname(os.path.abspath(target)))
+            runpy.run_path(target, run_name="__main__")
+    except SystemExit as exc:
+        if exc.code not in (None, 0):
+            raise
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+
+
+def main(argv: Optional[list[str]] = None, out: TextIO = sys.stdout):
+    parser = argparse.ArgumentParser(
+        prog="python -m func_validator.profile",
+        description=__doc__.split("\n\n")[0],
+    )
+    parser.add_argument(
+        "-m",
+        dest="as_module",
+        action="store_true",
+        help="Run the target as a module rather than a script.",
+    )
+    parser.add_argument(
+        "--hot-calls",
+        type=int,
+        default=10_000,
+        help="Calls from which a function counts as frequently called.",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=None,
+        help="Only report the most expensive functions.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the raw statistics as JSON instead of a report.",
+    )
+    parser.add_argument("target", help="Script path or module name.")
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    opts = parser.parse_args(argv)
+
+    was_enabled = is_instrumentation_enabled()
+    enable_instrumentation()
+    reset_stats()
+    try:
+        _run(opts.target, opts.args, opts.as_module)
+    finally:
+        snapshot = stats()
+        if not was_enabled:
+            disable_instrumentation()
+
+        if opts.json:
+            print(snapshot.to_json(indent=2), file=out)
+        else:
+            print(
+                format_report(
+                    snapshot.functions, hot_calls=opts.hot_calls, top=opts.top
+                ),
+                file=out,
+            )
+
+
+if __name__ == "__main__":
+    main()
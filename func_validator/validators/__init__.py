@@ -1,43 +1,127 @@
-from ._core import ValidationError, Validator
-from .collection_arg_validators import (
-    MustBeEmpty,
-    MustBeMemberOf,
-    MustBeNonEmpty,
-    MustHaveLengthBetween,
-    MustHaveLengthEqual,
-    MustHaveLengthGreaterThan,
-    MustHaveLengthGreaterThanOrEqual,
-    MustHaveLengthLessThan,
-    MustHaveLengthLessThanOrEqual,
-    MustHaveValuesBetween,
-    MustHaveValuesGreaterThan,
-    MustHaveValuesGreaterThanOrEqual,
-    MustHaveValuesLessThan,
-    MustHaveValuesLessThanOrEqual,
-)
-from .datatype_arg_validators import MustBeA
-from .dependent_arg_validator import DependsOn, MustBeProvided
-from .numeric_arg_validators import (
-    MustBeAlmostEqual,
-    MustBeBetween,
-    MustBeEqual,
-    MustBeGreaterThan,
-    MustBeGreaterThanOrEqual,
-    MustBeLessThan,
-    MustBeLessThanOrEqual,
-    MustBeNegative,
-    MustBeNonNegative,
-    MustBeNonPositive,
-    MustBePositive,
-    MustNotBeEqual,
+"""Validators are loaded lazily (PEP 562): importing this package only
+builds the name table below, and each submodule is imported the first
+time one of its names is accessed.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._core import ValidationError, Validator
+    from .collection_arg_validators import (
+        MustBeEmpty,
+        MustBeMemberOf,
+        MustBeMonotonic,
+        MustBeNonEmpty,
+        MustBeSorted,
+        MustBeStrictlyIncreasing,
+        MustHaveLengthBetween,
+        MustHaveLengthEqual,
+        MustHaveLengthGreaterThan,
+        MustHaveLengthGreaterThanOrEqual,
+        MustHaveLengthLessThan,
+        MustHaveLengthLessThanOrEqual,
+        MustHaveUniqueValues,
+        MustHaveValuesBetween,
+        MustHaveValuesGreaterThan,
+        MustHaveValuesGreaterThanOrEqual,
+        MustHaveValuesLessThan,
+        MustHaveValuesLessThanOrEqual,
+        MustHaveValuesMemberOf,
+    )
+    from .combinators import AllOf, AnyOf, Each, Not
+    from .datatype_arg_validators import MustBeA
+    from .dependent_arg_validator import DependsOn, MustBeProvided
+    from .mapping_arg_validators import MustHaveKeys, MustHaveValuesFor
+    from .numeric_arg_validators import (
+        MustBeAlmostEqual,
+        MustBeBetween,
+        MustBeEqual,
+        MustBeGreaterThan,
+        MustBeGreaterThanOrEqual,
+        MustBeLessThan,
+        MustBeLessThanOrEqual,
+        MustBeNegative,
+        MustBeNonNegative,
+        MustBeNonPositive,
+        MustBePositive,
+        MustNotBeEqual,
+    )
+    from .text_arg_validators import MustMatchRegex
+
+#: `array` requires NumPy, so its names are not re-exported: it is only
+#: imported when accessed, as `func_validator.validators.array`.
+_SUBMODULES = (
+    "_core",
+    "array",
+    "collection_arg_validators",
+    "combinators",
+    "datatype_arg_validators",
+    "dependent_arg_validator",
+    "mapping_arg_validators",
+    "numeric_arg_validators",
+    "text_arg_validators",
 )
-from .text_arg_validators import MustMatchRegex
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "ValidationError": "_core",
+    "Validator": "_core",
+    # Collection Validators
+    "MustBeMemberOf": "collection_arg_validators",
+    "MustHaveValuesMemberOf": "collection_arg_validators",
+    "MustBeEmpty": "collection_arg_validators",
+    "MustBeNonEmpty": "collection_arg_validators",
+    "MustHaveLengthEqual": "collection_arg_validators",
+    "MustHaveLengthGreaterThan": "collection_arg_validators",
+    "MustHaveLengthGreaterThanOrEqual": "collection_arg_validators",
+    "MustHaveLengthLessThan": "collection_arg_validators",
+    "MustHaveLengthLessThanOrEqual": "collection_arg_validators",
+    "MustHaveLengthBetween": "collection_arg_validators",
+    "MustHaveValuesGreaterThan": "collection_arg_validators",
+    "MustHaveValuesGreaterThanOrEqual": "collection_arg_validators",
+    "MustHaveValuesLessThan": "collection_arg_validators",
+    "MustHaveValuesLessThanOrEqual": "collection_arg_validators",
+    "MustHaveValuesBetween": "collection_arg_validators",
+    "MustHaveUniqueValues": "collection_arg_validators",
+    "MustBeSorted": "collection_arg_validators",
+    "MustBeStrictlyIncreasing": "collection_arg_validators",
+    "MustBeMonotonic": "collection_arg_validators",
+    # Mapping Validators
+    "MustHaveKeys": "mapping_arg_validators",
+    "MustHaveValuesFor": "mapping_arg_validators",
+    # Combinators
+    "AllOf": "combinators",
+    "AnyOf": "combinators",
+    "Each": "combinators",
+    "Not": "combinators",
+    # DataType Validators
+    "MustBeA": "datatype_arg_validators",
+    # Numeric Validators
+    "MustBeBetween": "numeric_arg_validators",
+    "MustBeEqual": "numeric_arg_validators",
+    "MustNotBeEqual": "numeric_arg_validators",
+    "MustBeAlmostEqual": "numeric_arg_validators",
+    "MustBeGreaterThan": "numeric_arg_validators",
+    "MustBeGreaterThanOrEqual": "numeric_arg_validators",
+    "MustBeLessThan": "numeric_arg_validators",
+    "MustBeLessThanOrEqual": "numeric_arg_validators",
+    "MustBeNegative": "numeric_arg_validators",
+    "MustBeNonNegative": "numeric_arg_validators",
+    "MustBeNonPositive": "numeric_arg_validators",
+    "MustBePositive": "numeric_arg_validators",
+    # Text Validators
+    "MustMatchRegex": "text_arg_validators",
+    # Core
+    "DependsOn": "dependent_arg_validator",
+    "MustBeProvided": "dependent_arg_validator",
+}
 
 __all__ = [
     # Error
     "ValidationError",
     # Collection Validators
     "MustBeMemberOf",
+    "MustHaveValuesMemberOf",
     "MustBeEmpty",
     "MustBeNonEmpty",
     "MustHaveLengthEqual",
@@ -51,6 +135,18 @@ __all__ = [
     "MustHaveValuesLessThan",
     "MustHaveValuesLessThanOrEqual",
     "MustHaveValuesBetween",
+    "MustHaveUniqueValues",
+    "MustBeSorted",
+    "MustBeStrictlyIncreasing",
+    "MustBeMonotonic",
+    # Mapping Validators
+    "MustHaveKeys",
+    "MustHaveValuesFor",
+    # Combinators
+    "AllOf",
+    "AnyOf",
+    "Each",
+    "Not",
     # DataType Validators
     "MustBeA",
     # Numeric Validators
@@ -73,3 +169,19 @@ __all__ = [
     "MustBeProvided",
     "Validator",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        module = import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+    elif name in _SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_SUBMODULES})
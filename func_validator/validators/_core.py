@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from string import Template
 from typing import Optional, TypeAlias, TypeVar
 
 __all__ = [
@@ -29,7 +28,41 @@ class ValidationError(Exception):
     pass
 
 
-class ErrorMsg(Template):
+#: Subclasses of both an `ErrorMsg` class and `string.Template`, by
+#: `ErrorMsg` class, see `ErrorMsg.__new__`.
+_TEMPLATE_CLASSES: dict[type, type] = {}
+
+
+class ErrorMsg:
+    """`string.Template` style error message.
+
+    `string` (and `re` with it) is only imported once a message is
+    created, which keeps it off the import path: instances are those of
+    a subclass of their class and of `string.Template`, created then.
+    """
+
+    def __new__(cls, *args, **kwargs):
+        template_cls = _TEMPLATE_CLASSES.get(cls)
+        if template_cls is None:
+            from string import Template
+
+            template_cls = type(
+                cls.__name__,
+                (cls, Template),
+                {
+                    "__module__": cls.__module__,
+                    "__qualname__": cls.__qualname__,
+                    "_base": cls,
+                },
+            )
+            _TEMPLATE_CLASSES[cls] = _TEMPLATE_CLASSES[template_cls] = (
+                template_cls
+            )
+        return super().__new__(template_cls)
+
+    def __reduce__(self):
+        return self._base, (self.template,)
+
     def transform(self, **kwargs) -> str:
         return self.safe_substitute(kwargs)
 
@@ -37,6 +70,15 @@ class ErrorMsg(Template):
 class Validator(ABC):
     DEFAULT_ERROR_MSG: str
 
+    #: Whether the validator visits every value of its argument, i.e.
+    #: whether its cost grows with the size of a collection argument.
+    SCANS_VALUES: bool = False
+
+    #: Whether the validator checks every value of its argument on its
+    #: own, so that checking a collection one value at a time (e.g. as
+    #: values are inserted) is equivalent to checking it whole.
+    CHECKS_EACH_VALUE: bool = False
+
     def __init__(
         self,
         *,
@@ -49,3 +91,24 @@ class Validator(ABC):
 
     @abstractmethod
     def __call__(self, *args, **kwargs) -> T: ...
+
+    # Combinators live in their own module, which imports this one.
+
+    def __and__(self, other: "Validator") -> "Validator":
+        if not isinstance(other, Validator):
+            return NotImplemented
+        from .combinators import AllOf
+
+        return AllOf(self, other)
+
+    def __or__(self, other: "Validator") -> "Validator":
+        if not isinstance(other, Validator):
+            return NotImplemented
+        from .combinators import AnyOf
+
+        return AnyOf(self, other)
+
+    def __invert__(self) -> "Validator":
+        from .combinators import Not
+
+        return Not(self)
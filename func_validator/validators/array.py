@@ -0,0 +1,417 @@
+"""Validators of NumPy arrays.
+
+This module requires NumPy and is not imported with the other
+validators: import it explicitly, as `func_validator.validators.array`.
+
+Each check runs as a single vectorized reduction over the array (e.g.
+`min`, `max` or `isfinite(...).all()`) rather than as a Python loop over
+its values; the offending value is only located once a check fails.
+Array-likes (lists, tuples) are accepted and converted with
+`numpy.asarray`.
+"""
+
+import cmath
+from operator import ge, gt, le, lt
+from typing import Callable, Final, Optional, Sequence, Union
+
+import numpy as np
+
+from ._core import (
+    OPERATOR_SYMBOLS,
+    ErrorMsg,
+    Number,
+    ValidationError,
+    Validator,
+)
+
+__all__ = [
+    "MustBeFinite",
+    "MustHaveDtype",
+    "MustHaveShape",
+    "MustHaveValuesBetween",
+    "MustHaveValuesGreaterThan",
+    "MustHaveValuesGreaterThanOrEqual",
+    "MustHaveValuesLessThan",
+    "MustHaveValuesLessThanOrEqual",
+]
+
+ARRAY_VALUES_VALIDATOR_ERR_MSG = (
+    "Values of ${arg_name} must be ${fn_symbol} ${to}, got ${value} at "
+    "index ${index}."
+)
+
+#: Length of a dimension of `MustHaveShape` that matches any length.
+ANY: Final = None
+
+
+def _index(array: np.ndarray, flat_index: int) -> Union[int, tuple]:
+    """Returns the index of the value at `flat_index` of `array`, as an
+    int for 1-D arrays.
+    """
+    if array.ndim == 1:
+        return int(flat_index)
+    return tuple(int(i) for i in np.unravel_index(flat_index, array.shape))
+
+
+def _fail(
+    validator: Validator,
+    arg_name: str,
+    array: np.ndarray,
+    failing: np.ndarray,
+    **msg_args,
+):
+    """Raises the error of `validator` for the first value of `array`
+    where the boolean array `failing` is set.
+    """
+    flat_index = int(np.argmax(failing.ravel()))
+    raise ValidationError(
+        ErrorMsg(validator.err_msg).transform(
+            arg_name=arg_name,
+            value=array.ravel()[flat_index],
+            index=_index(array, flat_index),
+            **msg_args,
+            **validator.extra_msg_args,
+        )
+    )
+
+
+def _is_finite_number(value) -> bool:
+    try:
+        return cmath.isfinite(value)
+    except TypeError:
+        return False
+
+
+class MustHaveShape(Validator):
+    """Validates the shape of an array."""
+
+    DEFAULT_ERROR_MSG: Final[str] = (
+        "${arg_name} must have shape ${shape}, got ${actual}."
+    )
+
+    def __init__(
+        self,
+        shape: Sequence[Optional[int]],
+        *,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param shape: The expected shape. A dimension of `ANY` (None)
+                      matches any length.
+        :param err_msg: Error message.
+        """
+        super().__init__(
+            err_msg=err_msg,
+            extra_msg_args=extra_msg_args,
+            default_err_msg=self.DEFAULT_ERROR_MSG,
+        )
+        self.shape = tuple(shape)
+
+    def __call__(self, arg_value, arg_name: str):
+        actual = np.shape(arg_value)
+        if len(actual) != len(self.shape) or any(
+            expected is not ANY and expected != length
+            for expected, length in zip(self.shape, actual)
+        ):
+            shape = tuple("*" if n is ANY else n for n in self.shape)
+            raise ValidationError(
+                ErrorMsg(self.err_msg).transform(
+                    arg_name=arg_name,
+                    shape=shape,
+                    actual=actual,
+                    **self.extra_msg_args,
+                )
+            )
+
+
+class MustHaveDtype(Validator):
+    """Validates the data type of an array."""
+
+    DEFAULT_ERROR_MSG: Final[str] = (
+        "${arg_name} must have a dtype of ${dtype}, got ${actual}."
+    )
+
+    def __init__(
+        self,
+        *dtypes,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param dtypes: The accepted data types. Abstract types such as
+                       `numpy.floating` or `numpy.integer` accept all of
+                       their subtypes.
+        :param err_msg: Error message.
+
+        :raises ValueError: If no data type is given.
+        """
+        super().__init__(
+            err_msg=err_msg,
+            extra_msg_args=extra_msg_args,
+            default_err_msg=self.DEFAULT_ERROR_MSG,
+        )
+        if not dtypes:
+            raise ValueError("MustHaveDtype needs at least one dtype.")
+        self.dtypes = dtypes
+
+    def __call__(self, arg_value, arg_name: str):
+        actual = np.asarray(arg_value).dtype
+        if not any(np.issubdtype(actual, dtype) for dtype in self.dtypes):
+            names = [getattr(d, "__name__", str(d)) for d in self.dtypes]
+            raise ValidationError(
+                ErrorMsg(self.err_msg).transform(
+                    arg_name=arg_name,
+                    dtype=" or ".join(names),
+                    actual=actual,
+                    **self.extra_msg_args,
+                )
+            )
+
+
+class MustBeFinite(Validator):
+    """Validates that no value of an array is NaN or infinite."""
+
+    DEFAULT_ERROR_MSG: Final[str] = (
+        "Values of ${arg_name} must be finite, got ${value} at index "
+        "${index}."
+    )
+    SCANS_VALUES: Final[bool] = True
+    CHECKS_EACH_VALUE: Final[bool] = True
+
+    def __init__(
+        self,
+        *,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param err_msg: Error message.
+        """
+        super().__init__(
+            err_msg=err_msg,
+            extra_msg_args=extra_msg_args,
+            default_err_msg=self.DEFAULT_ERROR_MSG,
+        )
+
+    def __call__(self, arg_value, arg_name: str):
+        array = np.asarray(arg_value)
+        if array.dtype.kind == "O":
+            # Python numbers, Decimals, ... are checked one by one, and
+            # a value that is not a number is not finite either.
+            finite = np.vectorize(_is_finite_number, otypes=[bool])(array)
+        elif array.dtype.kind in "fc":
+            finite = np.isfinite(array)
+        else:
+            # Integers, booleans, ... are always finite.
+            return
+        if not finite.all():
+            _fail(self, arg_name, array, ~finite)
+
+
+class _ArrayBound(Validator):
+    """Base of the validators of a bound on the values of an array,
+    checked with a single `min` or `max` reduction.
+    """
+
+    DEFAULT_ERROR_MSG: Final[str] = ARRAY_VALUES_VALIDATOR_ERR_MSG
+    SCANS_VALUES: Final[bool] = True
+    CHECKS_EACH_VALUE: Final[bool] = True
+
+    #: Comparison every value must pass against the bound.
+    _FN: Callable
+    #: Reduction of the array compared with the bound.
+    _REDUCE: Callable
+
+    def __init__(
+        self,
+        bound: Number,
+        *,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        super().__init__(
+            err_msg=err_msg,
+            extra_msg_args=extra_msg_args,
+            default_err_msg=self.DEFAULT_ERROR_MSG,
+        )
+        self.bound = bound
+
+    def __call__(self, arg_value, arg_name: str):
+        array = np.asarray(arg_value)
+        if array.size == 0:
+            return
+        fn = type(self)._FN
+        # A NaN reduction fails the comparison too.
+        if not fn(type(self)._REDUCE(array), self.bound):
+            failing = ~fn(array, self.bound)
+            _fail(
+                self,
+                arg_name,
+                array,
+                failing,
+                fn_symbol=OPERATOR_SYMBOLS[fn.__name__],
+                to=self.bound,
+            )
+
+
+class MustHaveValuesGreaterThan(_ArrayBound):
+    """Validates that all values of an array are greater than
+    `min_value`.
+    """
+
+    _FN = gt
+    _REDUCE = np.min
+
+    def __init__(
+        self,
+        min_value: Number,
+        *,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param min_value: The bound the values must be greater than.
+        :param err_msg: Error message.
+        """
+        super().__init__(
+            min_value, err_msg=err_msg, extra_msg_args=extra_msg_args
+        )
+
+
+class MustHaveValuesGreaterThanOrEqual(_ArrayBound):
+    """Validates that all values of an array are greater than or equal
+    to `min_value`.
+    """
+
+    _FN = ge
+    _REDUCE = np.min
+
+    def __init__(
+        self,
+        min_value: Number,
+        *,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param min_value: The bound the values must be greater than or
+                          equal to.
+        :param err_msg: Error message.
+        """
+        super().__init__(
+            min_value, err_msg=err_msg, extra_msg_args=extra_msg_args
+        )
+
+
+class MustHaveValuesLessThan(_ArrayBound):
+    """Validates that all values of an array are less than `max_value`."""
+
+    _FN = lt
+    _REDUCE = np.max
+
+    def __init__(
+        self,
+        max_value: Number,
+        *,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param max_value: The bound the values must be less than.
+        :param err_msg: Error message.
+        """
+        super().__init__(
+            max_value, err_msg=err_msg, extra_msg_args=extra_msg_args
+        )
+
+
+class MustHaveValuesLessThanOrEqual(_ArrayBound):
+    """Validates that all values of an array are less than or equal to
+    `max_value`.
+    """
+
+    _FN = le
+    _REDUCE = np.max
+
+    def __init__(
+        self,
+        max_value: Number,
+        *,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param max_value: The bound the values must be less than or equal
+                          to.
+        :param err_msg: Error message.
+        """
+        super().__init__(
+            max_value, err_msg=err_msg, extra_msg_args=extra_msg_args
+        )
+
+
+class MustHaveValuesBetween(Validator):
+    """Validates that all values of an array are between `min_value` and
+    `max_value`, with one `min` and one `max` reduction.
+    """
+
+    DEFAULT_ERROR_MSG: Final[str] = (
+        "Values of ${arg_name} must be ${min_fn_symbol} ${min_value} and "
+        "${max_fn_symbol} ${max_value}, got ${value} at index ${index}."
+    )
+    SCANS_VALUES: Final[bool] = True
+    CHECKS_EACH_VALUE: Final[bool] = True
+
+    def __init__(
+        self,
+        *,
+        min_value: Number,
+        max_value: Number,
+        min_inclusive: bool = True,
+        max_inclusive: bool = True,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param min_value: The minimum value (inclusive or exclusive based
+                          on min_inclusive).
+        :param max_value: The maximum value (inclusive or exclusive based
+                          on max_inclusive).
+        :param min_inclusive: If True, min_value is inclusive.
+        :param max_inclusive: If True, max_value is inclusive.
+        :param err_msg: error message.
+        """
+        super().__init__(
+            err_msg=err_msg,
+            extra_msg_args=extra_msg_args,
+            default_err_msg=self.DEFAULT_ERROR_MSG,
+        )
+        self.min_value = min_value
+        self.max_value = max_value
+        self.min_inclusive = min_inclusive
+        self.max_inclusive = max_inclusive
+
+    def __call__(self, arg_value, arg_name: str):
+        array = np.asarray(arg_value)
+        if array.size == 0:
+            return
+        min_fn = ge if self.min_inclusive else gt
+        max_fn = le if self.max_inclusive else lt
+        if not (
+            min_fn(array.min(), self.min_value)
+            and max_fn(array.max(), self.max_value)
+        ):
+            failing = ~(
+                min_fn(array, self.min_value) & max_fn(array, self.max_value)
+            )
+            _fail(
+                self,
+                arg_name,
+                array,
+                failing,
+                min_fn_symbol=OPERATOR_SYMBOLS[min_fn.__name__],
+                min_value=self.min_value,
+                max_fn_symbol=OPERATOR_SYMBOLS[max_fn.__name__],
+                max_value=self.max_value,
+            )
@@ -1,6 +1,21 @@
+import math
+import sys
+from array import array as array_type
+from collections.abc import Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from itertools import islice
 from operator import contains
-from typing import Callable, Container, Final, Iterable, Optional, Sized
+from typing import (
+    Callable,
+    Container,
+    Final,
+    Iterable,
+    Iterator,
+    Optional,
+    Sized,
+)
 
+from .. import _parallel
 from ._core import ErrorMsg, Number, T, ValidationError, Validator
 from .numeric_arg_validators import (
     MustBeBetween,
@@ -30,15 +45,121 @@ def _iterable_len_validator(
     func(len(arg_values), arg_name)
 
 
+class _Sampler:
+    """Draws the values a sampling `MustHaveValues*` validator checks.
+
+    From a sequence, `sample` (or `ceil(sample_fraction * len)`)
+    distinct indices are drawn and only those values are read, at O(k)
+    cost. A one-shot iterable is read once: `sample` values are kept by
+    reservoir sampling (Li's algorithm L, which skips values with
+    `islice`), and with `sample_fraction` each value is kept with that
+    probability.
+
+    If a fraction `q` of the values is invalid, a sample of `k` values
+    misses all of them with probability at most `(1 - q) ** k`, i.e.
+    below `exp(-q * k)`: checking `k >= ln(1 / p) / q` values catches
+    such values with probability at least `1 - p` (e.g. 300 values for
+    `q = 1%` and `p = 5%`), whatever the size of the input.
+    """
+
+    __slots__ = ("sample", "sample_fraction", "rng")
+
+    def __init__(
+        self,
+        sample: Optional[int],
+        sample_fraction: Optional[float],
+        seed: Optional[int],
+    ) -> None:
+        if sample is not None and sample_fraction is not None:
+            raise ValueError("Pass either sample or sample_fraction.")
+        if sample is not None and sample < 1:
+            raise ValueError("sample must be positive.")
+        if sample_fraction is not None and not 0 < sample_fraction <= 1:
+            raise ValueError("sample_fraction must be in (0, 1].")
+        import random
+
+        self.sample = sample
+        self.sample_fraction = sample_fraction
+        self.rng = random.Random(seed)
+
+    def values(self, values: Iterable) -> list:
+        """Returns the values of `values` to check."""
+        if isinstance(values, Sequence) or (
+            hasattr(values, "__len__")
+            and hasattr(values, "__getitem__")
+            and not isinstance(values, Mapping)
+        ):
+            size = len(values)
+            if self.sample is not None:
+                k = min(self.sample, size)
+            else:
+                k = math.ceil(self.sample_fraction * size)
+            # In index order, which is kinder to caches than a shuffle.
+            indices = sorted(self.rng.sample(range(size), k))
+            return [values[i] for i in indices]
+        if self.sample is not None:
+            return self._reservoir(iter(values))
+        return self._bernoulli(iter(values))
+
+    def _skip(self, values: Iterator, n: int):
+        """Returns the value after the next `n` values, or `_END`."""
+        return next(islice(values, n, None), _END)
+
+    def _reservoir(self, values: Iterator) -> list:
+        k = self.sample
+        reservoir = list(islice(values, k))
+        if len(reservoir) < k:
+            return reservoir
+        random = self.rng.random
+        w = math.exp(math.log(1.0 - random()) / k)
+        while True:
+            skip = int(math.log(1.0 - random()) / math.log(1.0 - w))
+            value = self._skip(values, skip)
+            if value is _END:
+                return reservoir
+            reservoir[self.rng.randrange(k)] = value
+            w *= math.exp(math.log(1.0 - random()) / k)
+
+    def _bernoulli(self, values: Iterator) -> list:
+        if self.sample_fraction == 1:
+            return list(values)
+        log_q = math.log(1.0 - self.sample_fraction)
+        random = self.rng.random
+        sample = []
+        while True:
+            # Geometric gap to the next kept value.
+            skip = int(math.log(1.0 - random()) / log_q)
+            value = self._skip(values, skip)
+            if value is _END:
+                return sample
+            sample.append(value)
+
+
+_END: Final = object()
+
+
 def _iterable_values_validator(
     values: Iterable,
     arg_name: str,
     /,
     *,
     func: Callable,
-):
+    sampler: Optional[_Sampler] = None,
+) -> Optional[int]:
+    """Checks the values of `values` with `func`. Returns the number of
+    values checked, or None if it is not known.
+    """
+    if sampler is not None:
+        values = sampler.values(values)
+        for value in values:
+            func(value, arg_name)
+        return len(values)
+    if _parallel.should_split(values):
+        _parallel.check_values(values, arg_name, func)
+        return len(values)
     for value in values:
         func(value, arg_name)
+    return len(values) if isinstance(values, Sized) else None
 
 
 # Membership and range validation functions
@@ -99,6 +220,82 @@ class MustBeMemberOf(Validator):
         )
 
 
+class MustHaveValuesMemberOf(Validator):
+    """Validates that every value of the iterable is a member of the
+    specified set.
+
+    The set is frozen once, and the values are checked with a single
+    `frozenset.issuperset` call, in C. Only if that check fails are the
+    values walked, in order, to report the first one that is not a
+    member. Unhashable values are reported as not members.
+    """
+
+    DEFAULT_ERROR_MSG: Final[str] = (
+        "Values of ${arg_name} must be in ${value_set}, got ${value} at "
+        "index ${index}."
+    )
+    SCANS_VALUES: Final[bool] = True
+    CHECKS_EACH_VALUE: Final[bool] = True
+
+    def __init__(
+        self,
+        value_set: Iterable,
+        *,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param value_set: The set of values to validate against. If its
+                          values are unhashable, it must support the
+                          `in` operator, and is then checked one value
+                          at a time.
+        :param err_msg: Error message.
+        """
+        super().__init__(
+            err_msg=err_msg,
+            extra_msg_args=extra_msg_args,
+            default_err_msg=self.DEFAULT_ERROR_MSG,
+        )
+        self.value_set = value_set
+        try:
+            self._members: Optional[frozenset] = frozenset(value_set)
+        except TypeError:
+            self._members = None
+
+    def __call__(self, values: Iterable, arg_name: str):
+        if not isinstance(values, Sized):
+            # Read once, to be walked again on failure.
+            values = list(values)
+        members = self._members
+        if members is not None:
+            try:
+                if members.issuperset(values):
+                    return len(values)
+            except TypeError:
+                # An unhashable value, which is not a member.
+                pass
+            container = members
+        else:
+            container = self.value_set
+
+        for index, value in enumerate(values):
+            try:
+                if contains(container, value):
+                    continue
+            except TypeError:
+                pass
+            raise ValidationError(
+                ErrorMsg(self.err_msg).transform(
+                    arg_name=arg_name,
+                    value=repr(value),
+                    index=index,
+                    value_set=repr(self.value_set),
+                    **self.extra_msg_args,
+                )
+            )
+        return len(values)
+
+
 # Size validation functions
 
 
@@ -384,17 +581,32 @@ class MustHaveValuesGreaterThan(Validator):
     """
 
     DEFAULT_ERROR_MSG: Final[str] = COLLECTION_VALUES_VALIDATOR_ERR_MSG
+    SCANS_VALUES: Final[bool] = True
+    CHECKS_EACH_VALUE: Final[bool] = True
 
     def __init__(
         self,
         min_value: Number,
         *,
+        sample: Optional[int] = None,
+        sample_fraction: Optional[float] = None,
+        seed: Optional[int] = None,
         err_msg: Optional[str] = None,
         extra_msg_args: Optional[dict] = None,
     ):
         """
         :param min_value: The minimum value the values in the iterable
                           should be greater than.
+        :param sample: If given, only this many values, drawn at random,
+                       are checked: if a fraction `q` of the values is
+                       invalid, all of them are missed with probability
+                       below `exp(-q * sample)`. Default is None: every
+                       value is checked.
+        :param sample_fraction: If given, only this fraction of the
+                                values, drawn at random, is checked.
+                                Default is None.
+        :param seed: Seed of the random draws of `sample` and
+                     `sample_fraction`. Default is None.
         :param err_msg: Error message.
         """
         super().__init__(
@@ -402,6 +614,11 @@ class MustHaveValuesGreaterThan(Validator):
             extra_msg_args=extra_msg_args,
             default_err_msg=self.DEFAULT_ERROR_MSG,
         )
+        self.sampler = (
+            None
+            if sample is None and sample_fraction is None
+            else _Sampler(sample, sample_fraction, seed)
+        )
         self.min_value = min_value
 
     def __call__(self, values: Iterable, arg_name: str):
@@ -410,7 +627,9 @@ class MustHaveValuesGreaterThan(Validator):
             err_msg=self.err_msg,
             extra_msg_args=self.extra_msg_args,
         )
-        _iterable_values_validator(values, arg_name, func=fn)
+        return _iterable_values_validator(
+            values, arg_name, func=fn, sampler=self.sampler
+        )
 
 
 class MustHaveValuesGreaterThanOrEqual(Validator):
@@ -419,17 +638,32 @@ class MustHaveValuesGreaterThanOrEqual(Validator):
     """
 
     DEFAULT_ERROR_MSG: Final[str] = COLLECTION_VALUES_VALIDATOR_ERR_MSG
+    SCANS_VALUES: Final[bool] = True
+    CHECKS_EACH_VALUE: Final[bool] = True
 
     def __init__(
         self,
         min_value: Number,
         *,
+        sample: Optional[int] = None,
+        sample_fraction: Optional[float] = None,
+        seed: Optional[int] = None,
         err_msg: Optional[str] = None,
         extra_msg_args: Optional[dict] = None,
     ):
         """
         :param min_value: The minimum value the values in the iterable
                           should be greater than or equal to.
+        :param sample: If given, only this many values, drawn at random,
+                       are checked: if a fraction `q` of the values is
+                       invalid, all of them are missed with probability
+                       below `exp(-q * sample)`. Default is None: every
+                       value is checked.
+        :param sample_fraction: If given, only this fraction of the
+                                values, drawn at random, is checked.
+                                Default is None.
+        :param seed: Seed of the random draws of `sample` and
+                     `sample_fraction`. Default is None.
         :param err_msg: Error message.
         """
         super().__init__(
@@ -437,6 +671,11 @@ class MustHaveValuesGreaterThanOrEqual(Validator):
             extra_msg_args=extra_msg_args,
             default_err_msg=self.DEFAULT_ERROR_MSG,
         )
+        self.sampler = (
+            None
+            if sample is None and sample_fraction is None
+            else _Sampler(sample, sample_fraction, seed)
+        )
         self.min_value = min_value
 
     def __call__(self, values: Iterable, arg_name: str):
@@ -445,7 +684,9 @@ class MustHaveValuesGreaterThanOrEqual(Validator):
             err_msg=self.err_msg,
             extra_msg_args=self.extra_msg_args,
         )
-        _iterable_values_validator(values, arg_name, func=fn)
+        return _iterable_values_validator(
+            values, arg_name, func=fn, sampler=self.sampler
+        )
 
 
 class MustHaveValuesLessThan(Validator):
@@ -454,17 +695,32 @@ class MustHaveValuesLessThan(Validator):
     """
 
     DEFAULT_ERROR_MSG: Final[str] = COLLECTION_VALUES_VALIDATOR_ERR_MSG
+    SCANS_VALUES: Final[bool] = True
+    CHECKS_EACH_VALUE: Final[bool] = True
 
     def __init__(
         self,
         max_value: Number,
         *,
+        sample: Optional[int] = None,
+        sample_fraction: Optional[float] = None,
+        seed: Optional[int] = None,
         err_msg: Optional[str] = None,
         extra_msg_args: Optional[dict] = None,
     ):
         """
         :param max_value: The maximum value the values in the iterable
                           should be less than.
+        :param sample: If given, only this many values, drawn at random,
+                       are checked: if a fraction `q` of the values is
+                       invalid, all of them are missed with probability
+                       below `exp(-q * sample)`. Default is None: every
+                       value is checked.
+        :param sample_fraction: If given, only this fraction of the
+                                values, drawn at random, is checked.
+                                Default is None.
+        :param seed: Seed of the random draws of `sample` and
+                     `sample_fraction`. Default is None.
         :param err_msg: Error message.
         """
         super().__init__(
@@ -472,6 +728,11 @@ class MustHaveValuesLessThan(Validator):
             extra_msg_args=extra_msg_args,
             default_err_msg=self.DEFAULT_ERROR_MSG,
         )
+        self.sampler = (
+            None
+            if sample is None and sample_fraction is None
+            else _Sampler(sample, sample_fraction, seed)
+        )
         self.max_value = max_value
 
     def __call__(self, values: Iterable, arg_name: str):
@@ -480,7 +741,9 @@ class MustHaveValuesLessThan(Validator):
             err_msg=self.err_msg,
             extra_msg_args=self.extra_msg_args,
         )
-        _iterable_values_validator(values, arg_name, func=fn)
+        return _iterable_values_validator(
+            values, arg_name, func=fn, sampler=self.sampler
+        )
 
 
 class MustHaveValuesLessThanOrEqual(Validator):
@@ -489,17 +752,32 @@ class MustHaveValuesLessThanOrEqual(Validator):
     """
 
     DEFAULT_ERROR_MSG: Final[str] = COLLECTION_VALUES_VALIDATOR_ERR_MSG
+    SCANS_VALUES: Final[bool] = True
+    CHECKS_EACH_VALUE: Final[bool] = True
 
     def __init__(
         self,
         max_value: Number,
         *,
+        sample: Optional[int] = None,
+        sample_fraction: Optional[float] = None,
+        seed: Optional[int] = None,
         err_msg: Optional[str] = None,
         extra_msg_args: Optional[dict] = None,
     ):
         """
         :param max_value: The maximum value the values in the iterable
                           should be less than or equal to.
+        :param sample: If given, only this many values, drawn at random,
+                       are checked: if a fraction `q` of the values is
+                       invalid, all of them are missed with probability
+                       below `exp(-q * sample)`. Default is None: every
+                       value is checked.
+        :param sample_fraction: If given, only this fraction of the
+                                values, drawn at random, is checked.
+                                Default is None.
+        :param seed: Seed of the random draws of `sample` and
+                     `sample_fraction`. Default is None.
         :param err_msg: Error message.
         """
         super().__init__(
@@ -507,6 +785,11 @@ class MustHaveValuesLessThanOrEqual(Validator):
             extra_msg_args=extra_msg_args,
             default_err_msg=self.DEFAULT_ERROR_MSG,
         )
+        self.sampler = (
+            None
+            if sample is None and sample_fraction is None
+            else _Sampler(sample, sample_fraction, seed)
+        )
         self.max_value = max_value
 
     def __call__(self, values: Iterable, arg_name: str):
@@ -515,7 +798,9 @@ class MustHaveValuesLessThanOrEqual(Validator):
             err_msg=self.err_msg,
             extra_msg_args=self.extra_msg_args,
         )
-        _iterable_values_validator(values, arg_name, func=fn)
+        return _iterable_values_validator(
+            values, arg_name, func=fn, sampler=self.sampler
+        )
 
 
 class MustHaveValuesBetween(Validator):
@@ -527,6 +812,8 @@ class MustHaveValuesBetween(Validator):
         "Values of ${arg_name}: ${arg_value} must be ${min_fn_symbol} ${min_value} "
         "and ${max_fn_symbol} ${max_value} "
     )
+    SCANS_VALUES: Final[bool] = True
+    CHECKS_EACH_VALUE: Final[bool] = True
 
     def __init__(
         self,
@@ -535,6 +822,9 @@ class MustHaveValuesBetween(Validator):
         max_value: Number,
         min_inclusive: bool = True,
         max_inclusive: bool = True,
+        sample: Optional[int] = None,
+        sample_fraction: Optional[float] = None,
+        seed: Optional[int] = None,
         err_msg: Optional[str] = None,
         extra_msg_args: Optional[dict] = None,
     ):
@@ -545,6 +835,16 @@ class MustHaveValuesBetween(Validator):
                           on max_inclusive).
         :param min_inclusive: If True, min_value is inclusive.
         :param max_inclusive: If True, max_value is inclusive.
+        :param sample: If given, only this many values, drawn at random,
+                       are checked: if a fraction `q` of the values is
+                       invalid, all of them are missed with probability
+                       below `exp(-q * sample)`. Default is None: every
+                       value is checked.
+        :param sample_fraction: If given, only this fraction of the
+                                values, drawn at random, is checked.
+                                Default is None.
+        :param seed: Seed of the random draws of `sample` and
+                     `sample_fraction`. Default is None.
         :param err_msg: error message.
         """
         super().__init__(
@@ -552,6 +852,11 @@ class MustHaveValuesBetween(Validator):
             extra_msg_args=extra_msg_args,
             default_err_msg=self.DEFAULT_ERROR_MSG,
         )
+        self.sampler = (
+            None
+            if sample is None and sample_fraction is None
+            else _Sampler(sample, sample_fraction, seed)
+        )
         self.min_value = min_value
         self.max_value = max_value
         self.min_inclusive = min_inclusive
@@ -566,4 +871,426 @@ class MustHaveValuesBetween(Validator):
             err_msg=self.err_msg,
             extra_msg_args=self.extra_msg_args,
         )
-        _iterable_values_validator(values, arg_name, func=fn)
+        return _iterable_values_validator(
+            values, arg_name, func=fn, sampler=self.sampler
+        )
+
+
+# Uniqueness validation functions
+
+#: Number of values added to the set of seen values at a time, so that a
+#: duplicate stops the scan early while the set is built at C speed.
+_UNIQUE_BLOCK: Final[int] = 8192
+
+#: `(first, second, value)`: indices of the first pair of equal values.
+_Duplicate = tuple[int, int, object]
+
+
+def _first_duplicate_hashable(values: Sequence) -> Optional[_Duplicate]:
+    """Returns the first duplicate of hashable `values`, or None if they
+    are unique, in O(n).
+
+    :raises TypeError: If a value is unhashable.
+    """
+    seen = set()
+    for start in range(0, len(values), _UNIQUE_BLOCK):
+        block = values[start : start + _UNIQUE_BLOCK]
+        size = len(seen)
+        seen.update(block)
+        if len(seen) - size == len(block):
+            continue
+        # Duplicates are rare: only then are the values indexed one by
+        # one, up to the end of this block.
+        first_index = {}
+        for index, value in enumerate(values[: start + len(block)]):
+            first = first_index.setdefault(value, index)
+            if first != index:
+                return first, index, value
+    return None
+
+
+def _first_duplicate_sorted(values: Sequence) -> Optional[_Duplicate]:
+    """Returns the first duplicate of totally ordered `values`, or None
+    if they are unique, in O(n log n).
+
+    :raises TypeError: If values can not be ordered, or are only
+                       partially ordered (e.g. sets), so that equal
+                       values may not be next to each other once sorted.
+    """
+    # The sort is stable, so each run of equal values is in the order of
+    # their indices and starts with the first occurrence.
+    order = sorted(range(len(values)), key=values.__getitem__)
+    duplicate = None
+    run_start = order[0] if order else None
+    for left, right in zip(order, order[1:]):
+        if values[left] < values[right]:
+            run_start = right
+        elif values[left] != values[right]:
+            raise TypeError("Values are not totally ordered.")
+        elif duplicate is None or right < duplicate[1]:
+            duplicate = run_start, right, values[right]
+    return duplicate
+
+
+def _first_duplicate_pairwise(values: Sequence) -> Optional[_Duplicate]:
+    """Returns the first duplicate of `values`, or None if they are
+    unique, in O(n²): the last resort for values that can neither be
+    hashed nor ordered.
+    """
+    for index in range(1, len(values)):
+        value = values[index]
+        for first in range(index):
+            if values[first] == value:
+                return first, index, value
+    return None
+
+
+def _first_duplicate_array(values) -> Optional[_Duplicate]:
+    """Returns the first duplicate of the values of a 1-D NumPy array,
+    or None if they are unique, with vectorized sorts.
+    """
+    import numpy as np
+
+    ordered = np.sort(values)
+    if not (ordered[1:] == ordered[:-1]).any():
+        return None
+    order = np.argsort(values, kind="stable")
+    ordered = values[order]
+    equal = np.flatnonzero(ordered[1:] == ordered[:-1])
+    # The equal neighbours with the smallest second index.
+    k = equal[np.argmin(order[equal + 1])]
+    value = ordered[k]
+    first = int(np.argmax(values == value))
+    return first, int(order[k + 1]), value.item()
+
+
+def _first_duplicate(values: Iterable) -> Optional[_Duplicate]:
+    if isinstance(values, (AbstractSet, Mapping)):
+        return None
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        if values.ndim == 1 and values.dtype.kind in "biufcmMSU":
+            return _first_duplicate_array(values)
+        values = values.tolist()
+    elif not isinstance(values, Sequence):
+        values = list(values)
+    try:
+        return _first_duplicate_hashable(values)
+    except TypeError:
+        pass
+    try:
+        return _first_duplicate_sorted(values)
+    except TypeError:
+        return _first_duplicate_pairwise(values)
+
+
+class MustHaveUniqueValues(Validator):
+    """Validates that no two values of the iterable are equal.
+
+    Hashable values are added to a set block by block, so the check is
+    O(n) and stops at the block holding the first duplicate. Unhashable
+    values that can be ordered are sorted and compared with their
+    neighbour, in O(n log n), and 1-D NumPy arrays are sorted with
+    NumPy. Only values that can neither be hashed nor ordered are
+    compared pairwise.
+    """
+
+    DEFAULT_ERROR_MSG: Final[str] = (
+        "Values of ${arg_name} must be unique, got ${value} at indices "
+        "${first} and ${second}."
+    )
+    SCANS_VALUES: Final[bool] = True
+
+    def __init__(
+        self,
+        *,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param err_msg: Error message.
+        """
+        super().__init__(
+            err_msg=err_msg,
+            extra_msg_args=extra_msg_args,
+            default_err_msg=self.DEFAULT_ERROR_MSG,
+        )
+
+    def __call__(self, values: Iterable, arg_name: str):
+        duplicate = _first_duplicate(values)
+        if duplicate is not None:
+            first, second, value = duplicate
+            raise ValidationError(
+                ErrorMsg(self.err_msg).transform(
+                    arg_name=arg_name,
+                    value=repr(value),
+                    first=first,
+                    second=second,
+                    **self.extra_msg_args,
+                )
+            )
+
+
+# Ordering validation functions
+
+#: `(index, previous, value)`: the first value out of order, at `index`,
+#: and the value before it.
+_Unordered = tuple[int, object, object]
+
+
+def _first_unordered(
+    values: Iterator, previous, start: int, descending: bool, strict: bool
+) -> Optional[_Unordered]:
+    """Returns the first of `values` out of order with the value before
+    it, `previous` being the value before the first one, at index
+    `start - 1`. A single pass, with no copy: each comparison is inlined
+    in its own loop.
+    """
+    if descending and strict:
+        for index, value in enumerate(values, start):
+            if not value < previous:
+                return index, previous, value
+            previous = value
+    elif descending:
+        for index, value in enumerate(values, start):
+            if previous < value:
+                return index, previous, value
+            previous = value
+    elif strict:
+        for index, value in enumerate(values, start):
+            if not previous < value:
+                return index, previous, value
+            previous = value
+    else:
+        for index, value in enumerate(values, start):
+            if value < previous:
+                return index, previous, value
+            previous = value
+    return None
+
+
+def _first_unordered_array(
+    array, descending: bool, strict: bool
+) -> Optional[_Unordered]:
+    """`_first_unordered` of a 1-D NumPy array, as one vectorized
+    comparison of the array with itself shifted by one.
+    """
+    previous, values = array[:-1], array[1:]
+    if descending:
+        failing = ~(values < previous) if strict else previous < values
+    else:
+        failing = ~(previous < values) if strict else values < previous
+    if not failing.any():
+        return None
+    index = int(failing.argmax())
+    return index + 1, previous[index].item(), values[index].item()
+
+
+def _as_array(values):
+    """Returns `values` as a 1-D NumPy array if it is an array or a
+    buffer and NumPy is already imported, else None.
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is None:
+        return None
+    if isinstance(values, numpy.ndarray):
+        array = values
+    elif isinstance(values, (array_type, memoryview, bytes, bytearray)):
+        array = numpy.asarray(memoryview(values))
+    else:
+        return None
+    return array if array.ndim == 1 else None
+
+
+def _check_order(
+    values: Iterable,
+    *,
+    key: Optional[Callable],
+    descending: bool,
+    strict: bool,
+    either: bool = False,
+) -> Optional[_Unordered]:
+    """Returns the first value of `values` (or its key) out of order, or
+    None if they are ordered. With `either`, values may be ordered in
+    either direction, set by the first two values that differ.
+    """
+    array = _as_array(values) if key is None else None
+    if array is not None:
+        found = _first_unordered_array(array, descending, strict)
+        if found is None or not either:
+            return found
+        if strict:
+            if found[0] == 1 and found[2] < found[1]:
+                return _first_unordered_array(array, True, strict)
+            return found
+        differ = (array[1:] != array[:-1]).argmax()
+        if array[differ + 1] < array[differ]:
+            return _first_unordered_array(array, True, strict)
+        return found
+
+    values = iter(values if key is None else map(key, values))
+    for first in values:
+        break
+    else:
+        return None
+    found = _first_unordered(values, first, 1, descending, strict)
+    if found is None or not either:
+        return found
+    # Values went up so far (or stayed equal) and now go down: they
+    # may only go down from here on, if they had not gone up before.
+    index, previous, value = found
+    if (index == 1 and value < previous) or (
+        not strict and not first < previous
+    ):
+        return _first_unordered(values, value, index + 1, True, strict)
+    return found
+
+
+def _raise_unordered(
+    validator: Validator, arg_name: str, found: _Unordered, order: str
+):
+    index, previous, value = found
+    raise ValidationError(
+        ErrorMsg(validator.err_msg).transform(
+            arg_name=arg_name,
+            order=order,
+            index=index,
+            previous=repr(previous),
+            value=repr(value),
+            **validator.extra_msg_args,
+        )
+    )
+
+
+ORDER_VALIDATOR_ERR_MSG = (
+    "Values of ${arg_name} must be ${order}, got ${value} after "
+    "${previous} at index ${index}."
+)
+
+
+class MustBeSorted(Validator):
+    """Validates that the values of the iterable are sorted, i.e. that
+    no value is less than the one before it (as `sorted` orders them).
+    """
+
+    DEFAULT_ERROR_MSG: Final[str] = ORDER_VALIDATOR_ERR_MSG
+    SCANS_VALUES: Final[bool] = True
+
+    def __init__(
+        self,
+        *,
+        key: Optional[Callable] = None,
+        reverse: bool = False,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param key: Function of a value that values are compared by, as
+                    in `sorted`. The keys are reported on failure.
+                    Default is None.
+        :param reverse: If True, values must be sorted in reverse order.
+                        Default is False.
+        :param err_msg: Error message.
+        """
+        super().__init__(
+            err_msg=err_msg,
+            extra_msg_args=extra_msg_args,
+            default_err_msg=self.DEFAULT_ERROR_MSG,
+        )
+        self.key = key
+        self.reverse = reverse
+
+    def __call__(self, values: Iterable, arg_name: str):
+        found = _check_order(
+            values, key=self.key, descending=self.reverse, strict=False
+        )
+        if found is not None:
+            order = "sorted in reverse" if self.reverse else "sorted"
+            _raise_unordered(self, arg_name, found, order)
+
+
+class MustBeStrictlyIncreasing(Validator):
+    """Validates that every value of the iterable is greater than the
+    one before it.
+    """
+
+    DEFAULT_ERROR_MSG: Final[str] = ORDER_VALIDATOR_ERR_MSG
+    SCANS_VALUES: Final[bool] = True
+
+    def __init__(
+        self,
+        *,
+        key: Optional[Callable] = None,
+        reverse: bool = False,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param key: Function of a value that values are compared by. The
+                    keys are reported on failure. Default is None.
+        :param reverse: If True, values must be strictly decreasing
+                        instead. Default is False.
+        :param err_msg: Error message.
+        """
+        super().__init__(
+            err_msg=err_msg,
+            extra_msg_args=extra_msg_args,
+            default_err_msg=self.DEFAULT_ERROR_MSG,
+        )
+        self.key = key
+        self.reverse = reverse
+
+    def __call__(self, values: Iterable, arg_name: str):
+        found = _check_order(
+            values, key=self.key, descending=self.reverse, strict=True
+        )
+        if found is not None:
+            order = "strictly " + (
+                "decreasing" if self.reverse else "increasing"
+            )
+            _raise_unordered(self, arg_name, found, order)
+
+
+class MustBeMonotonic(Validator):
+    """Validates that the values of the iterable are either all
+    non-decreasing or all non-increasing (or, if `strict`, strictly),
+    the direction being set by the first two values that differ.
+    """
+
+    DEFAULT_ERROR_MSG: Final[str] = ORDER_VALIDATOR_ERR_MSG
+    SCANS_VALUES: Final[bool] = True
+
+    def __init__(
+        self,
+        *,
+        key: Optional[Callable] = None,
+        strict: bool = False,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param key: Function of a value that values are compared by. The
+                    keys are reported on failure. Default is None.
+        :param strict: If True, consecutive values must not be equal.
+                       Default is False.
+        :param err_msg: Error message.
+        """
+        super().__init__(
+            err_msg=err_msg,
+            extra_msg_args=extra_msg_args,
+            default_err_msg=self.DEFAULT_ERROR_MSG,
+        )
+        self.key = key
+        self.strict = strict
+
+    def __call__(self, values: Iterable, arg_name: str):
+        found = _check_order(
+            values,
+            key=self.key,
+            descending=False,
+            strict=self.strict,
+            either=True,
+        )
+        if found is not None:
+            order = "strictly monotonic" if self.strict else "monotonic"
+            _raise_unordered(self, arg_name, found, order)
@@ -0,0 +1,391 @@
+"""Combinators: validators built from other validators, through `&`
+(`AllOf`), `|` (`AnyOf`) and `~` (`Not`) or explicitly, and `Each`, which
+applies a validator to every value of a collection.
+
+Contiguous numeric (or length) bound validators combined with `&`, or
+stacked in an annotation, are intersected into a single `IntervalCheck`
+once, when they are combined, and contradictory bounds are reported
+then.
+"""
+
+from math import ceil, floor
+from typing import Callable, Final, Iterable, NamedTuple, Optional
+
+from ._core import ErrorMsg, T, ValidationError, Validator
+from .collection_arg_validators import (
+    MustBeEmpty,
+    MustBeNonEmpty,
+    MustHaveLengthBetween,
+    MustHaveLengthEqual,
+    MustHaveLengthGreaterThan,
+    MustHaveLengthGreaterThanOrEqual,
+    MustHaveLengthLessThan,
+    MustHaveLengthLessThanOrEqual,
+)
+from .dependent_arg_validator import DependsOn
+from .numeric_arg_validators import (
+    MustBeBetween,
+    MustBeGreaterThan,
+    MustBeGreaterThanOrEqual,
+    MustBeLessThan,
+    MustBeLessThanOrEqual,
+    MustBeNegative,
+    MustBeNonNegative,
+    MustBeNonPositive,
+    MustBePositive,
+)
+
+__all__ = ["AllOf", "AnyOf", "Each", "IntervalCheck", "Not"]
+
+
+class _Interval(NamedTuple):
+    lower: Optional[T] = None
+    lower_inclusive: bool = False
+    upper: Optional[T] = None
+    upper_inclusive: bool = False
+
+
+# Bounds of the validators that compare their argument (or its length)
+# with constants. Only exact types are listed: a subclass may override
+# `__call__`.
+_VALUE_BOUNDS: Final[dict[type, Callable[[Validator], _Interval]]] = {
+    MustBePositive: lambda v: _Interval(lower=0.0),
+    MustBeNonNegative: lambda v: _Interval(lower=0.0, lower_inclusive=True),
+    MustBeNegative: lambda v: _Interval(upper=0.0),
+    MustBeNonPositive: lambda v: _Interval(upper=0.0, upper_inclusive=True),
+    MustBeGreaterThan: lambda v: _Interval(lower=v.value),
+    MustBeGreaterThanOrEqual: lambda v: _Interval(v.value, True),
+    MustBeLessThan: lambda v: _Interval(upper=v.value),
+    MustBeLessThanOrEqual: lambda v: _Interval(
+        upper=v.value, upper_inclusive=True
+    ),
+    MustBeBetween: lambda v: _Interval(
+        v.min_value, v.min_inclusive, v.max_value, v.max_inclusive
+    ),
+}
+_LENGTH_BOUNDS: Final[dict[type, Callable[[Validator], _Interval]]] = {
+    MustBeEmpty: lambda v: _Interval(0, True, 0, True),
+    MustBeNonEmpty: lambda v: _Interval(lower=0),
+    MustHaveLengthEqual: lambda v: _Interval(v.value, True, v.value, True),
+    MustHaveLengthGreaterThan: lambda v: _Interval(lower=v.value),
+    MustHaveLengthGreaterThanOrEqual: lambda v: _Interval(v.value, True),
+    MustHaveLengthLessThan: lambda v: _Interval(upper=v.value),
+    MustHaveLengthLessThanOrEqual: lambda v: _Interval(
+        upper=v.value, upper_inclusive=True
+    ),
+    MustHaveLengthBetween: lambda v: _Interval(
+        v.min_value, v.min_inclusive, v.max_value, v.max_inclusive
+    ),
+}
+
+
+def _bound_kind(validator: Validator) -> Optional[str]:
+    if type(validator) in _VALUE_BOUNDS:
+        return "value"
+    if type(validator) in _LENGTH_BOUNDS:
+        return "length"
+    return None
+
+
+def _intersect(a: _Interval, b: _Interval) -> _Interval:
+    lower, lower_inclusive = a.lower, a.lower_inclusive
+    if lower is None or (
+        b.lower is not None
+        and (b.lower > lower or (b.lower == lower and not b.lower_inclusive))
+    ):
+        lower, lower_inclusive = b.lower, b.lower_inclusive
+    upper, upper_inclusive = a.upper, a.upper_inclusive
+    if upper is None or (
+        b.upper is not None
+        and (b.upper < upper or (b.upper == upper and not b.upper_inclusive))
+    ):
+        upper, upper_inclusive = b.upper, b.upper_inclusive
+    return _Interval(lower, lower_inclusive, upper, upper_inclusive)
+
+
+def _integer_interval(interval: _Interval) -> _Interval:
+    """Closed interval of the lengths that `interval` admits."""
+    lower, upper = interval.lower, interval.upper
+    if lower is None:
+        lower = 0
+    elif interval.lower_inclusive:
+        lower = max(ceil(lower), 0)
+    else:
+        lower = max(floor(lower) + 1, 0)
+    if upper is not None:
+        upper = floor(upper) if interval.upper_inclusive else ceil(upper) - 1
+    return _Interval(lower, True, upper, True)
+
+
+def _is_empty(interval: _Interval) -> bool:
+    lower, upper = interval.lower, interval.upper
+    if lower is None or upper is None:
+        return False
+    if lower == upper:
+        return not (interval.lower_inclusive and interval.upper_inclusive)
+    return lower > upper
+
+
+def _compile_test(interval: _Interval, of_length: bool) -> Callable:
+    """Generates `test(x)`, a single comparison chain such as
+    `lower < x <= upper`.
+    """
+    chain = "len(x)" if of_length else "x"
+    if interval.lower is not None:
+        op = "<=" if interval.lower_inclusive else "<"
+        chain = f"lower {op} {chain}"
+    if interval.upper is not None:
+        op = "<=" if interval.upper_inclusive else "<"
+        chain = f"{chain} {op} upper"
+    namespace = {"lower": interval.lower, "upper": interval.upper}
+    exec(f"def test(x):\n    return {chain}", namespace)
+    return namespace["test"]
+
+
+class IntervalCheck(Validator):
+    """Stands for several bound validators of one argument (or of its
+    length), checked with a single comparison chain.
+
+    When the check fails, the original validators run, in order, so the
+    error is the one the first failing validator reports.
+    """
+
+    __slots__ = ("_test",)
+
+    def __init__(self, validators: Iterable[Validator], arg_name: str):
+        """
+        :param validators: Bound validators of the same kind, see
+                           `_merge_bounds`.
+        :param arg_name: Name used when reporting contradictory bounds.
+
+        :raises ValueError: If no value satisfies all the bounds.
+        """
+        super().__init__()
+        self.validators = tuple(validators)
+        kind = _bound_kind(self.validators[0])
+        self.of_length = kind == "length"
+        bounds = _LENGTH_BOUNDS if self.of_length else _VALUE_BOUNDS
+
+        interval = _Interval()
+        for validator in self.validators:
+            interval = _intersect(interval, bounds[type(validator)](validator))
+        if self.of_length:
+            interval = _integer_interval(interval)
+        if _is_empty(interval):
+            names = ", ".join(type(v).__name__ for v in self.validators)
+            raise ValueError(
+                f"Contradictory constraints on {arg_name}: no "
+                f"{kind} satisfies {names}."
+            )
+        self.interval = interval
+        self._test = _compile_test(interval, self.of_length)
+
+    def __call__(self, arg_value: T, arg_name: str) -> None:
+        if self._test(arg_value):
+            return
+        for validator in self.validators:
+            validator(arg_value, arg_name)
+        raise ValidationError(f"{arg_name}: {arg_value!r} is out of bounds.")
+
+
+def _merge_bounds(
+    validators: Iterable[Validator], arg_name: str = "value"
+) -> list[Validator]:
+    """Replaces every run of contiguous bound validators of the same kind
+    (value or length) with an `IntervalCheck`. Only contiguous validators
+    are merged, so the first validator to fail stays the same.
+
+    :raises ValueError: If a run of bounds is contradictory.
+    """
+    merged: list[Validator] = []
+    run: list[Validator] = []
+
+    def flush():
+        if run:
+            try:
+                check = IntervalCheck(run, arg_name)
+            except TypeError:
+                # Bounds of types that do not compare, left alone.
+                merged.extend(run)
+            else:
+                merged.append(check if len(run) > 1 else run[0])
+            run.clear()
+
+    for validator in validators:
+        members = (validator,)
+        if type(validator) is IntervalCheck:
+            # Merged again, with the bounds around it.
+            members = validator.validators
+        for member in members:
+            kind = _bound_kind(member)
+            if run and kind != _bound_kind(run[0]):
+                flush()
+            if kind is None:
+                merged.append(member)
+            else:
+                run.append(member)
+    flush()
+    return merged
+
+
+def _operands(
+    validators: Iterable[Validator], flatten: Optional[type] = None
+) -> tuple[Validator, ...]:
+    operands = []
+    for validator in validators:
+        if not isinstance(validator, Validator):
+            raise TypeError(f"{validator!r} is not a Validator.")
+        if isinstance(validator, DependsOn):
+            raise TypeError("DependsOn can not be combined.")
+        if flatten is not None and type(validator) is flatten:
+            operands.extend(validator.validators)
+        else:
+            operands.append(validator)
+    return tuple(operands)
+
+
+class AllOf(Validator):
+    """Validates that the value passes all the validators, in order; the
+    same as `a & b & ...`.
+
+    Contiguous bound validators are merged into an `IntervalCheck`, see
+    the module documentation.
+    """
+
+    def __init__(self, *validators: Validator, arg_name: str = "value"):
+        """
+        :param validators: The validators to combine.
+        :param arg_name: Name used when reporting contradictory bounds.
+
+        :raises TypeError: If an operand is not a validator, or is
+                           `DependsOn`.
+        :raises ValueError: If the bounds are contradictory.
+        """
+        super().__init__()
+        operands = _operands(validators, AllOf)
+        self.validators = tuple(_merge_bounds(operands, arg_name))
+        self.SCANS_VALUES = any(v.SCANS_VALUES for v in operands)
+        self.CHECKS_EACH_VALUE = all(v.CHECKS_EACH_VALUE for v in operands)
+
+    def __call__(self, arg_value: T, arg_name: str) -> None:
+        for validator in self.validators:
+            validator(arg_value, arg_name)
+
+
+class AnyOf(Validator):
+    """Validates that the value passes at least one of the validators,
+    tried in order; the same as `a | b | ...`.
+    """
+
+    DEFAULT_ERROR_MSG: Final[str] = (
+        "${arg_name}: ${arg_value} must satisfy at least one of: ${reasons}"
+    )
+
+    def __init__(
+        self,
+        *validators: Validator,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param validators: The validators to combine.
+        :param err_msg: Error message. `${reasons}` holds the errors of
+                        the validators.
+
+        :raises TypeError: If an operand is not a validator, or is
+                           `DependsOn`.
+        """
+        super().__init__(
+            err_msg=err_msg,
+            extra_msg_args=extra_msg_args,
+            default_err_msg=self.DEFAULT_ERROR_MSG,
+        )
+        self.validators = _operands(validators, AnyOf)
+        self.SCANS_VALUES = any(v.SCANS_VALUES for v in self.validators)
+
+    def __call__(self, arg_value: T, arg_name: str) -> None:
+        reasons = []
+        for validator in self.validators:
+            try:
+                validator(arg_value, arg_name)
+            except ValidationError as err:
+                reasons.append(str(err))
+            else:
+                return
+        err_msg = ErrorMsg(self.err_msg).transform(
+            arg_name=arg_name,
+            arg_value=arg_value,
+            reasons="; ".join(reasons),
+            **self.extra_msg_args,
+        )
+        raise ValidationError(err_msg)
+
+
+class Not(Validator):
+    """Validates that the value fails the validator; the same as `~v`."""
+
+    DEFAULT_ERROR_MSG: Final[str] = (
+        "${arg_name}: ${arg_value} must not satisfy ${validator}"
+    )
+
+    def __init__(
+        self,
+        validator: Validator,
+        *,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param validator: The validator the value must fail.
+        :param err_msg: Error message.
+
+        :raises TypeError: If `validator` is not a validator, or is
+                           `DependsOn`.
+        """
+        super().__init__(
+            err_msg=err_msg,
+            extra_msg_args=extra_msg_args,
+            default_err_msg=self.DEFAULT_ERROR_MSG,
+        )
+        (self.validator,) = _operands((validator,))
+        self.SCANS_VALUES = self.validator.SCANS_VALUES
+
+    def __invert__(self) -> Validator:
+        return self.validator
+
+    def __call__(self, arg_value: T, arg_name: str) -> None:
+        try:
+            self.validator(arg_value, arg_name)
+        except ValidationError:
+            return
+        err_msg = ErrorMsg(self.err_msg).transform(
+            arg_name=arg_name,
+            arg_value=arg_value,
+            validator=type(self.validator).__name__,
+            **self.extra_msg_args,
+        )
+        raise ValidationError(err_msg)
+
+
+class Each(Validator):
+    """Validates every value of an iterable with `validator`, e.g.
+    `Each(MustBePositive() & MustBeLessThan(10))`.
+    """
+
+    SCANS_VALUES: Final[bool] = True
+    CHECKS_EACH_VALUE: Final[bool] = True
+
+    def __init__(self, validator: Validator):
+        """
+        :param validator: The validator of each value.
+
+        :raises TypeError: If `validator` is not a validator, or is
+                           `DependsOn`.
+        """
+        super().__init__()
+        (self.validator,) = _operands((validator,))
+
+    def __call__(self, values: Iterable, arg_name: str) -> None:
+        validator = self.validator
+        for value in values:
+            validator(value, arg_name)
@@ -0,0 +1,410 @@
+"""Validators of mappings (e.g. JSON objects) and of their values.
+
+`MustHaveValuesFor` compiles the annotations of the keys of a mapping,
+or the fields of a `TypedDict`, into a plan with one entry per key. Plans
+of nested mappings (and of lists of mappings) hang off the entries of
+their key, and are run with an explicit stack rather than by recursion,
+within limits on the depth and the number of values visited, so that a
+hostile payload can neither exhaust the interpreter stack nor stall the
+check.
+"""
+
+import weakref
+from collections.abc import Mapping
+from collections.abc import Sequence as AbstractSequence
+from typing import (
+    Annotated,
+    Any,
+    Final,
+    Hashable,
+    NamedTuple,
+    NotRequired,
+    Optional,
+    Required,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+    is_typeddict,
+)
+
+from ._core import ErrorMsg, T, ValidationError, Validator
+from .dependent_arg_validator import DependsOn
+
+__all__ = ["MAX_DEPTH", "MAX_VALUES", "MustHaveKeys", "MustHaveValuesFor"]
+
+#: Default number of levels of mappings (and lists of mappings) that
+#: `MustHaveValuesFor` descends into below the mapping it checks.
+MAX_DEPTH: Final[int] = 32
+
+#: Default number of keys and list items, all levels together, that
+#: `MustHaveValuesFor` visits before rejecting a mapping.
+MAX_VALUES: Final[int] = 100_000
+
+MISSING_KEYS_ERR_MSG: Final[str] = "${arg_name} is missing keys ${missing}."
+
+#: Looked up in place of the value of an absent key.
+_ABSENT: Final = object()
+
+
+def _missing_keys(mapping: Mapping, keys: tuple) -> list:
+    return [key for key in keys if key not in mapping]
+
+
+class MustHaveKeys(Validator):
+    """Validates that the mapping has all of the specified keys."""
+
+    DEFAULT_ERROR_MSG: Final[str] = MISSING_KEYS_ERR_MSG
+
+    def __init__(
+        self,
+        *keys: Hashable,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+    ):
+        """
+        :param keys: The keys the mapping must have.
+        :param err_msg: Error message.
+        """
+        super().__init__(
+            err_msg=err_msg,
+            extra_msg_args=extra_msg_args,
+            default_err_msg=self.DEFAULT_ERROR_MSG,
+        )
+        self.keys = keys
+        self._key_set = frozenset(keys)
+
+    def __call__(self, arg_value: Mapping, arg_name: str) -> None:
+        try:
+            # A subset test of the keys view, in C for dicts.
+            if arg_value.keys() >= self._key_set:
+                return
+        except AttributeError:
+            raise ValidationError(
+                f"{arg_name} must be a mapping, got "
+                f"{type(arg_value).__name__}."
+            ) from None
+        raise ValidationError(
+            ErrorMsg(self.err_msg).transform(
+                arg_name=arg_name,
+                arg_value=arg_value,
+                missing=_missing_keys(arg_value, self.keys),
+                **self.extra_msg_args,
+            )
+        )
+
+
+class _KeyEntry(NamedTuple):
+    """Checks of the value of a single key."""
+
+    key: Hashable
+    #: Appended to the name of the mapping to name the value.
+    suffix: str
+    validators: tuple[Validator, ...]
+    validators_if_none: tuple[Validator, ...]
+    #: Plan of the value, if it is itself a mapping.
+    fields: Optional["_MappingPlan"]
+    #: Plan of every item of the value, if it is a list of mappings.
+    items: Optional["_MappingPlan"]
+
+
+class _MappingPlan:
+    """Checks of a mapping, one entry per key."""
+
+    __slots__ = ("entries", "required", "depends_on", "checks", "__weakref__")
+
+    def __init__(self) -> None:
+        self.entries: tuple[_KeyEntry, ...] = ()
+        #: Keys the mapping must have, in declaration order.
+        self.required: tuple[Hashable, ...] = ()
+        self.depends_on: tuple[DependsOn, ...] = ()
+        #: Whether the plan checks anything. A plan being built (that of
+        #: a `TypedDict` referring to itself) is assumed to.
+        self.checks = True
+
+    def build(
+        self,
+        annotations: Mapping[Hashable, Any],
+        required: frozenset = frozenset(),
+    ) -> "_MappingPlan":
+        entries = [
+            _key_entry(key, annotation)
+            for key, annotation in annotations.items()
+        ]
+        self.entries = tuple(
+            e
+            for e in entries
+            if e.validators or e.validators_if_none or e.fields or e.items
+        )
+        self.required = tuple(k for k in annotations if k in required)
+        self.depends_on = tuple(
+            v
+            for e in self.entries
+            for v in e.validators
+            if isinstance(v, DependsOn)
+        )
+        self.checks = bool(self.entries)
+        return self
+
+
+#: Plans of the `TypedDict` classes compiled so far.
+_TYPED_DICT_PLANS: "weakref.WeakKeyDictionary[type, _MappingPlan]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _typed_dict_plan(typed_dict: type) -> _MappingPlan:
+    plan = _TYPED_DICT_PLANS.get(typed_dict)
+    if plan is not None:
+        return plan
+    # Registered before its fields are compiled, so that fields referring
+    # back to the `TypedDict` get this (unfinished) plan.
+    plan = _TYPED_DICT_PLANS[typed_dict] = _MappingPlan()
+    try:
+        annotations = get_type_hints(typed_dict, include_extras=True)
+        return plan.build(annotations, typed_dict.__required_keys__)
+    except BaseException:
+        del _TYPED_DICT_PLANS[typed_dict]
+        raise
+
+
+def _strip_required(annotation: T) -> T:
+    """Removes the `Required` and `NotRequired` qualifiers of a
+    `TypedDict` field annotation, which `TypedDict` itself accounts for.
+    """
+    origin = get_origin(annotation)
+    if origin is Required or origin is NotRequired:
+        return _strip_required(get_args(annotation)[0])
+    if origin is Annotated:
+        inner, *metadata = get_args(annotation)
+        return Annotated[(_strip_required(inner), *metadata)]
+    return annotation
+
+
+def _value_type(annotation: T) -> T:
+    """The type of the values an annotation allows, leaving out its
+    metadata and `None` if it is `Optional`.
+    """
+    if get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+    if get_origin(annotation) is Union:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _items_plan(value_type: T) -> Optional[_MappingPlan]:
+    """Plan of the items of `list[TD]`, `tuple[TD, ...]` or
+    `Sequence[TD]` annotations, `TD` being a `TypedDict`.
+    """
+    origin = get_origin(value_type)
+    args = get_args(value_type)
+    if origin is tuple:
+        if len(args) != 2 or args[1] is not Ellipsis:
+            return None
+    elif origin is not list and origin is not AbstractSequence:
+        return None
+    if not args or not is_typeddict(args[0]):
+        return None
+    plan = _typed_dict_plan(args[0])
+    return plan if plan.checks else None
+
+
+def _key_entry(key: Hashable, annotation: T) -> _KeyEntry:
+    # `validate_params` imports the validators.
+    from .._func_arg_validator import _build_arg_plan
+
+    annotation = _strip_required(annotation)
+    suffix = f"[{key!r}]"
+    arg_plan = _build_arg_plan(suffix, annotation, False)
+    if arg_plan is None:
+        validators = validators_if_none = ()
+    else:
+        validators = arg_plan.validators
+        validators_if_none = arg_plan.validators_if_none
+
+    # The first `MustHaveValuesFor` (e.g. added for a `TypedDict` type)
+    # is run as part of this plan, in the same traversal.
+    fields = next(
+        (v for v in validators if type(v) is MustHaveValuesFor), None
+    )
+    if fields is not None:
+        validators = tuple(v for v in validators if v is not fields)
+        validators_if_none = tuple(
+            v for v in validators_if_none if v is not fields
+        )
+        fields = fields.plan
+    items = None
+    if fields is None:
+        items = _items_plan(_value_type(annotation))
+    return _KeyEntry(
+        key, suffix, validators, validators_if_none, fields, items
+    )
+
+
+def _typed_dict_of(arg_type: T) -> Optional[type]:
+    """Returns the `TypedDict` of a `TD` or `Optional[TD]` annotation."""
+    value_type = _value_type(arg_type)
+    return value_type if is_typeddict(value_type) else None
+
+
+class MustHaveValuesFor(Validator):
+    """Validates the values of the keys of a mapping, and of the nested
+    mappings (and lists of mappings) they hold, against the validators
+    of their annotations.
+
+    ```python
+    MustHaveValuesFor(
+        price=Annotated[float, MustBePositive()],
+        side=Annotated[str, MustBeMemberOf({"buy", "sell"})],
+    )
+    ```
+
+    Given a `TypedDict`, its fields are checked, and its required keys
+    must be present. Function arguments (and dataclass fields) annotated
+    with a `TypedDict` whose fields carry validators get this validator
+    on their own. Keys listed in a mapping or as keywords are optional,
+    see `MustHaveKeys`.
+
+    Values of `Optional` annotations that are None are only checked by
+    their `DependsOn` validators, which refer to the other keys of the
+    same mapping. A value annotated with a `TypedDict`, a list of
+    `TypedDict`, or with another `MustHaveValuesFor`, is checked in the
+    same pass, within the limits of the outermost validator.
+    """
+
+    DEFAULT_ERROR_MSG: Final[str] = (
+        "${arg_name} must be a mapping, got ${arg_value_type}."
+    )
+    DEPTH_ERROR_MSG: Final[str] = (
+        "${arg_name} is nested more than ${max_depth} levels deep."
+    )
+    SIZE_ERROR_MSG: Final[str] = (
+        "${arg_name} has more than ${max_values} keys and items."
+    )
+    SCANS_VALUES: Final[bool] = True
+
+    def __init__(
+        self,
+        fields: Union[Mapping[Hashable, Any], type, None] = None,
+        /,
+        *,
+        max_depth: int = MAX_DEPTH,
+        max_values: int = MAX_VALUES,
+        err_msg: Optional[str] = None,
+        extra_msg_args: Optional[dict] = None,
+        **field_annotations: Any,
+    ):
+        """
+        :param fields: A `TypedDict`, or a mapping of keys to their
+                       annotations (for keys that are not identifiers).
+        :param max_depth: Number of levels of nested mappings and lists
+                          checked below the mapping; deeper values fail.
+                          Default is `MAX_DEPTH`.
+        :param max_values: Number of keys and list items checked, all
+                           levels together, above which the mapping
+                           fails. Default is `MAX_VALUES`.
+        :param err_msg: Error message of values that are not mappings.
+        :param field_annotations: Annotations of keys.
+
+        :raises NameError: If an annotation of the `TypedDict` refers to
+                           an undefined name.
+        :raises ValueError: If the bounds of a key are contradictory, or
+                            a limit is negative.
+        """
+        super().__init__(
+            err_msg=err_msg,
+            extra_msg_args=extra_msg_args,
+            default_err_msg=self.DEFAULT_ERROR_MSG,
+        )
+        if max_depth < 0 or max_values < 0:
+            raise ValueError("max_depth and max_values must be >= 0.")
+        self.max_depth = max_depth
+        self.max_values = max_values
+        if is_typeddict(fields):
+            if field_annotations:
+                raise ValueError(
+                    "Keys can not be annotated on top of a TypedDict."
+                )
+            self.plan = _typed_dict_plan(fields)
+        else:
+            annotations = {**(fields or {}), **field_annotations}
+            self.plan = _MappingPlan().build(annotations)
+
+    def _fail(self, template: str, arg_name: str, **kwargs) -> None:
+        raise ValidationError(
+            ErrorMsg(template).transform(
+                arg_name=arg_name,
+                max_depth=self.max_depth,
+                max_values=self.max_values,
+                **kwargs,
+                **self.extra_msg_args,
+            )
+        )
+
+    def __call__(self, arg_value: Mapping, arg_name: str) -> int:
+        budget = self.max_values
+        max_depth = self.max_depth
+        stack = [(self.plan, arg_value, arg_name, 0)]
+        while stack:
+            plan, mapping, name, depth = stack.pop()
+            if not isinstance(mapping, Mapping):
+                self._fail(
+                    self.err_msg,
+                    name,
+                    arg_value=mapping,
+                    arg_value_type=type(mapping).__name__,
+                )
+            budget -= len(mapping)
+            if budget < 0:
+                self._fail(self.SIZE_ERROR_MSG, arg_name)
+            if plan.required:
+                missing = _missing_keys(mapping, plan.required)
+                if missing:
+                    self._fail(
+                        MISSING_KEYS_ERR_MSG,
+                        name,
+                        arg_value=mapping,
+                        missing=missing,
+                    )
+            for dep_validator in plan.depends_on:
+                dep_validator.arguments = mapping
+
+            nested = []
+            for entry in plan.entries:
+                value = mapping.get(entry.key, _ABSENT)
+                if value is _ABSENT:
+                    continue
+                value_name = name + entry.suffix
+                if value is None:
+                    for validator in entry.validators_if_none:
+                        validator(value, value_name)
+                    continue
+                for validator in entry.validators:
+                    validator(value, value_name)
+
+                if entry.fields is not None:
+                    if depth == max_depth:
+                        self._fail(self.DEPTH_ERROR_MSG, value_name)
+                    nested.append((entry.fields, value, value_name, depth + 1))
+                elif entry.items is not None:
+                    if depth == max_depth:
+                        self._fail(self.DEPTH_ERROR_MSG, value_name)
+                    if not isinstance(value, (list, tuple)):
+                        self._fail(
+                            "${arg_name} must be a list, got "
+                            "${arg_value_type}.",
+                            value_name,
+                            arg_value_type=type(value).__name__,
+                        )
+                    budget -= len(value)
+                    if budget < 0:
+                        self._fail(self.SIZE_ERROR_MSG, arg_name)
+                    nested.extend(
+                        (entry.items, item, f"{value_name}[{i}]", depth + 1)
+                        for i, item in enumerate(value)
+                    )
+            # Popped in declaration (and list) order.
+            stack.extend(reversed(nested))
+        return self.max_values - budget
@@ -0,0 +1,152 @@
+from typing import Annotated, Optional
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from func_validator import (
+    MustBeNonEmpty,
+    ValidationError,
+    validate_params,
+    validated_dataclass,
+)
+from func_validator.validators.array import (
+    ANY,
+    MustBeFinite,
+    MustHaveDtype,
+    MustHaveShape,
+    MustHaveValuesBetween,
+    MustHaveValuesGreaterThan,
+    MustHaveValuesGreaterThanOrEqual,
+    MustHaveValuesLessThan,
+    MustHaveValuesLessThanOrEqual,
+)
+
+
+class TestMustHaveShape:
+
+    def test_shape(self):
+        MustHaveShape((2, 3))(np.zeros((2, 3)), "x")
+        MustHaveShape((ANY, 3))(np.zeros((5, 3)), "x")
+        MustHaveShape((3,))([1, 2, 3], "x")
+
+    @pytest.mark.parametrize("shape", [(2,), (2, 4), (2, 3, 1)])
+    def test_wrong_shape(self, shape):
+        with pytest.raises(ValidationError, match=r"got \(2, 3\)"):
+            MustHaveShape(shape)(np.zeros((2, 3)), "x")
+
+
+class TestMustHaveDtype:
+
+    def test_dtype(self):
+        MustHaveDtype(np.float64)(np.zeros(3), "x")
+        MustHaveDtype(np.floating)(np.zeros(3, dtype=np.float32), "x")
+        MustHaveDtype(np.integer, np.bool_)(np.zeros(3, dtype=bool), "x")
+
+    def test_wrong_dtype(self):
+        with pytest.raises(ValidationError, match="floating or complex"):
+            MustHaveDtype(np.floating, np.complexfloating)(np.arange(3), "x")
+
+    def test_no_dtype(self):
+        with pytest.raises(ValueError):
+            MustHaveDtype()
+
+
+class TestMustBeFinite:
+
+    def test_finite(self):
+        MustBeFinite()(np.arange(5.0), "x")
+        MustBeFinite()(np.arange(5), "x")
+
+    @pytest.mark.parametrize("value", [np.nan, np.inf, -np.inf])
+    def test_not_finite(self, value):
+        array = np.zeros((2, 3))
+        array[1, 2] = value
+        with pytest.raises(ValidationError, match=r"index \(1, 2\)"):
+            MustBeFinite()(array, "x")
+
+    def test_object_array(self):
+        MustBeFinite()(np.array([1.0, 2, 3j], dtype=object), "x")
+        for value in [np.nan, np.inf, "1.0", None]:
+            array = np.array([1.0, value], dtype=object)
+            with pytest.raises(ValidationError, match="at index 1"):
+                MustBeFinite()(array, "x")
+
+
+class TestArrayBounds:
+
+    @pytest.mark.parametrize(
+        "validator, passes",
+        [
+            (MustHaveValuesGreaterThan(0), False),
+            (MustHaveValuesGreaterThan(-1), True),
+            (MustHaveValuesGreaterThanOrEqual(0), True),
+            (MustHaveValuesGreaterThanOrEqual(min_value=1), False),
+            (MustHaveValuesLessThan(4), False),
+            (MustHaveValuesLessThan(5), True),
+            (MustHaveValuesLessThanOrEqual(4), True),
+            (MustHaveValuesLessThanOrEqual(max_value=3), False),
+            (MustHaveValuesBetween(min_value=0, max_value=4), True),
+            (
+                MustHaveValuesBetween(
+                    min_value=0, max_value=4, max_inclusive=False
+                ),
+                False,
+            ),
+        ],
+    )
+    def test_bounds(self, validator, passes):
+        array = np.arange(5.0)
+        if passes:
+            validator(array, "x")
+        else:
+            with pytest.raises(ValidationError, match="at index"):
+                validator(array, "x")
+
+    def test_reports_first_failing_value(self):
+        array = np.array([[1.0, 2.0], [-3.0, -4.0]])
+        with pytest.raises(
+            ValidationError, match=r"> 0, got -3.0 at index \(1, 0\)"
+        ):
+            MustHaveValuesGreaterThan(0)(array, "x")
+
+    def test_nan_is_out_of_bounds(self):
+        with pytest.raises(ValidationError, match="nan at index 1"):
+            MustHaveValuesBetween(min_value=0, max_value=9)(
+                np.array([1.0, np.nan]), "x"
+            )
+
+    def test_empty_array(self):
+        MustHaveValuesGreaterThan(0)(np.array([]), "x")
+        MustHaveValuesBetween(min_value=0, max_value=1)(np.array([]), "x")
+
+
+class TestDecoratedArrays:
+
+    def test_optional_array_argument(self):
+        @validate_params
+        def func(
+            x: Annotated[
+                Optional[np.ndarray],
+                MustHaveShape((ANY,)),
+                MustBeFinite(),
+                MustBeNonEmpty(),
+            ] = None,
+        ):
+            return x
+
+        assert func() is None
+        array = np.arange(3.0)
+        assert func(array) is array
+        with pytest.raises(ValidationError):
+            func(np.array([1.0, np.inf]))
+
+    def test_optional_array_field(self):
+        @validated_dataclass
+        class Series:
+            values: Annotated[Optional[np.ndarray], MustBeFinite()] = None
+
+        Series()
+        Series(np.arange(3.0))
+        with pytest.raises(ValidationError):
+            Series(np.array([np.nan]))
@@ -0,0 +1,202 @@
+import dataclasses
+import gc
+from typing import Annotated, Optional
+
+import pytest
+
+from func_validator import (
+    Certified,
+    DependsOn,
+    MustBeGreaterThan,
+    MustBeMemberOf,
+    MustBePositive,
+    MustHaveLengthLessThanOrEqual,
+    MustHaveValuesGreaterThan,
+    ValidationError,
+    ValidationSpec,
+    Validator,
+    validate_params,
+)
+from func_validator._proof import _PROOFS
+
+
+class CountingValuesGreaterThan(MustHaveValuesGreaterThan):
+    calls = 0
+
+    def __call__(self, arg_value, arg_name: str):
+        CountingValuesGreaterThan.calls += 1
+        super().__call__(arg_value, arg_name)
+
+
+POSITIVE_IDS = ValidationSpec(
+    CountingValuesGreaterThan(0),
+    MustHaveLengthLessThanOrEqual(3),
+    spec_id="positive_ids",
+)
+
+
+class CountingAccept(Validator):
+    calls = 0
+
+    def __call__(self, arg_value, arg_name: str):
+        CountingAccept.calls += 1
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    retries: int
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    CountingValuesGreaterThan.calls = 0
+    CountingAccept.calls = 0
+
+
+class TestValidationSpec:
+
+    def test_certify_checks_value(self):
+        with pytest.raises(ValidationError):
+            POSITIVE_IDS.certify([1, -2])
+        with pytest.raises(ValidationError):
+            POSITIVE_IDS.certify([1, 2, 3, 4])
+
+    def test_certify_wraps_plain_values(self):
+        certified = POSITIVE_IDS.certify([1, 2])
+        assert isinstance(certified, Certified)
+        assert certified.value == [1, 2]
+        assert certified.spec_id == "positive_ids"
+
+    def test_default_spec_id(self):
+        spec = ValidationSpec(MustBePositive(), MustBeGreaterThan(1))
+        assert spec.spec_id == "MustBePositive, MustBeGreaterThan"
+
+
+class TestCertifiedArguments:
+
+    def test_covered_validators_are_skipped(self):
+        @validate_params
+        def total(ids: Annotated[list, CountingValuesGreaterThan(0)]):
+            return sum(ids)
+
+        certified = POSITIVE_IDS.certify([1, 2])
+        assert CountingValuesGreaterThan.calls == 1
+        assert total(certified) == 3
+        assert total(ids=certified) == 3
+        assert CountingValuesGreaterThan.calls == 1
+
+        assert total([1, 2]) == 3
+        assert CountingValuesGreaterThan.calls == 2
+
+    def test_function_receives_plain_value(self):
+        @validate_params
+        def identity(ids: Annotated[list, MustHaveLengthLessThanOrEqual(3)]):
+            return ids
+
+        ids = [1, 2]
+        assert identity(POSITIVE_IDS.certify(ids)) is ids
+
+    def test_validators_outside_spec_still_run(self):
+        @validate_params
+        def first(ids: Annotated[list, CountingValuesGreaterThan(1)]):
+            return ids[0]
+
+        with pytest.raises(ValidationError):
+            # Certified for values > 0, not > 1.
+            first(POSITIVE_IDS.certify([1, 2]))
+
+    def test_lookalike_validators_still_run(self):
+        # The same items, in a list of pairs and in a dict.
+        spec = ValidationSpec(MustBeMemberOf([("a", 1)]))
+
+        @validate_params
+        def f(x: Annotated[object, MustBeMemberOf({"a": 1})]):
+            return x
+
+        with pytest.raises(ValidationError):
+            f(spec.certify(("a", 1)))
+
+    def test_optional_certified_none(self):
+        spec = ValidationSpec(CountingAccept())
+
+        @validate_params
+        def f(x: Annotated[Optional[int], MustBePositive()] = 1):
+            return x
+
+        assert f(spec.certify(None, wrap=True)) is None
+
+    def test_depends_on_sees_unwrapped_values(self):
+        spec = ValidationSpec(MustBePositive())
+
+        @validate_params
+        def f(
+            low: Annotated[int, DependsOn(high=MustBeGreaterThan)],
+            high: Annotated[int, MustBePositive()],
+        ):
+            return low, high
+
+        assert f(spec.certify(2), spec.certify(1)) == (2, 1)
+
+    @pytest.mark.parametrize(
+        "kwargs", [{}, {"cache": True}, {"mode": "shadow"}]
+    )
+    def test_unvalidated_arguments_are_unwrapped(self, kwargs):
+        spec = ValidationSpec(MustBePositive())
+
+        @validate_params(**kwargs)
+        def f(x: Annotated[int, MustBePositive()], y, *args, **kw):
+            return x, y, args, kw
+
+        certify = spec.certify
+        assert f(1, certify(2), certify(3), 4, z=certify(5)) == (
+            1,
+            2,
+            (3, 4),
+            {"z": 5},
+        )
+
+    def test_trusted_and_instrumented_paths(self):
+        for kwargs in ({"trust_chain": True}, {"instrument": True}):
+
+            @validate_params(**kwargs)
+            def total(ids: Annotated[tuple, CountingValuesGreaterThan(0)]):
+                return sum(ids)
+
+            CountingValuesGreaterThan.calls = 0
+            assert total(POSITIVE_IDS.certify((1, 2))) == 3
+            assert CountingValuesGreaterThan.calls == 1
+
+
+class TestIdentityProofs:
+
+    def test_frozen_dataclasses_are_not_wrapped(self):
+        spec = ValidationSpec(CountingAccept())
+        config = Config(3)
+        assert spec.certify(config) is config
+
+    def test_identity_proof_skips_validators(self):
+        spec = ValidationSpec(CountingAccept())
+
+        @validate_params
+        def retries(config: Annotated[Config, CountingAccept()]):
+            return config.retries
+
+        config = spec.certify(Config(3))
+        assert CountingAccept.calls == 1
+        assert retries(config) == 3
+        assert CountingAccept.calls == 1
+        assert retries(Config(3)) == 3
+        assert CountingAccept.calls == 2
+
+    def test_proofs_are_dropped_with_the_object(self):
+        spec = ValidationSpec(CountingAccept())
+        config = spec.certify(Config(3))
+        assert id(config) in _PROOFS
+        config_id = id(config)
+        del config
+        gc.collect()
+        assert config_id not in _PROOFS
+
+    def test_wrap_false_requires_weak_references(self):
+        with pytest.raises(TypeError):
+            ValidationSpec(MustBePositive()).certify(3, wrap=False)
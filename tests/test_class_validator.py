@@ -0,0 +1,143 @@
+from typing import Annotated, Optional
+
+import pytest
+
+from func_validator import (
+    DependsOn,
+    MustBeGreaterThan,
+    MustBePositive,
+    MustBeProvided,
+    Validated,
+    ValidationError,
+    validate_class,
+    validate_params,
+)
+
+
+@validate_class
+class Account:
+    def __init__(self, balance: Annotated[float, MustBePositive()]):
+        self.balance = balance
+
+    def deposit(self, amount: Annotated[float, MustBePositive()]):
+        self.balance += amount
+        return self.balance
+
+    def merge(self, other: "Account") -> "Account":
+        return Account(self.balance + other.balance)
+
+    @staticmethod
+    def fee(amount: Annotated[float, MustBePositive()]):
+        return amount * 0.01
+
+    @classmethod
+    def opening(cls, amount: Annotated[float, MustBeGreaterThan(100)]):
+        return cls(amount)
+
+    def __repr__(self):
+        return f"Account({self.balance})"
+
+
+@validate_class(slots=True)
+class Rectangle:
+    __slots__ = ("shape",)
+
+    width: Annotated[float, MustBePositive()] = Validated()
+    height: Annotated[
+        Optional[float],
+        DependsOn(shape="rectangle", kw_strategy=MustBeProvided),
+        MustBePositive(),
+    ] = Validated()
+
+    def __init__(self, width: float, height: Optional[float] = None):
+        self.shape = "square" if height is None else "rectangle"
+        self.width = width
+        self.height = height
+
+    def area(self):
+        if self.height is None:
+            return self.width**2
+        return self.width * self.height
+
+
+class Square(Rectangle):
+    def __init__(self, width: float):
+        super().__init__(width)
+
+
+class TestValidateClass:
+
+    def test_methods_are_validated(self):
+        account = Account(10)
+        assert account.deposit(5) == 15
+        assert Account.fee(100) == 1
+        assert Account.opening(200).balance == 200
+        assert account.merge(Account(1)).balance == 16
+
+        with pytest.raises(ValidationError):
+            Account(-1)
+        with pytest.raises(ValidationError):
+            account.deposit(-5)
+        with pytest.raises(ValidationError):
+            Account.fee(-1)
+        with pytest.raises(ValidationError):
+            Account.opening(50)
+
+    def test_already_decorated_methods_are_kept(self):
+        @validate_params
+        def method(self, arg__1: Annotated[int, MustBePositive()]):
+            return arg__1
+
+        cls = validate_class(type("Cls", (), {"method": method}))
+        assert cls.method is method
+        assert method.__validation_plan__.owner is cls
+
+    def test_errors(self):
+        with pytest.raises(TypeError):
+            validate_class(lambda: None)
+
+
+class TestValidated:
+
+    def test_validated_on_assignment(self):
+        rect = Rectangle(2, 3)
+        assert rect.area() == 6
+        assert Rectangle(2).area() == 4
+
+        with pytest.raises(ValidationError):
+            Rectangle(-2, 3)
+        with pytest.raises(ValidationError):
+            rect.width = 0
+        assert rect.width == 2
+
+    def test_depends_on_reads_instance_attributes(self):
+        rect = Rectangle(2, 3)
+        with pytest.raises(ValidationError):
+            rect.height = None
+        rect.shape = "square"
+        rect.height = None
+
+    def test_values_are_stored_in_slots(self):
+        assert Rectangle.__slots__ == (
+            "shape",
+            "_validated_width",
+            "_validated_height",
+        )
+        assert not hasattr(Rectangle(1), "__dict__")
+
+    def test_subclasses_and_super(self):
+        square = Square(3)
+        assert square.area() == 9
+        with pytest.raises(ValidationError):
+            Square(-3)
+
+    def test_plain_attribute(self):
+        @validate_class
+        class Point:
+            x: int = Validated()
+
+        point = Point()
+        point.x = -1
+        assert point.x == -1
+        point.x = None
+        assert point.x is None
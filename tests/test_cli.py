@@ -0,0 +1,149 @@
+import io
+import json
+import sys
+import textwrap
+
+import pytest
+
+from func_validator.__main__ import main
+
+SCHEMA = textwrap.dedent(
+    """
+    from typing import Annotated, Optional
+
+    from func_validator import (
+        DependsOn,
+        MustBeMemberOf,
+        MustBePositive,
+        MustMatchRegex,
+        validate_params,
+    )
+
+    @validate_params
+    def trade(
+        trade_id: Annotated[int, MustBePositive()],
+        symbol: Annotated[str, MustMatchRegex("[A-Z]{1,5}")],
+        price: Annotated[float, MustBePositive()],
+        side: Annotated[str, MustBeMemberOf({"buy", "sell"})] = "buy",
+        limit: Annotated[Optional[float], DependsOn(side="sell")] = None,
+    ):
+        raise AssertionError("rows must not call the function")
+
+    def undecorated(x):
+        return x
+    """
+)
+
+ROWS = [
+    {"trade_id": 1, "symbol": "ABC", "price": 1.5},
+    {"trade_id": -2, "symbol": "abc", "price": 1.5},
+    {"trade_id": 3, "symbol": "XYZ", "price": 2.0, "side": "hold"},
+    {"trade_id": 4, "price": 2.0},
+    {"trade_id": 5, "symbol": "XYZ", "price": 2.0, "venue": "X"},
+    {"trade_id": 6, "symbol": "XYZ", "price": 2.0, "side": "sell"},
+]
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    (tmp_path / "feed_schema.py").write_text(SCHEMA)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    sys.modules.pop("feed_schema", None)
+
+
+def run(*argv) -> tuple[int, str]:
+    out = io.StringIO()
+    status = main(["validate", "feed_schema:trade", *argv], out=out)
+    return status, out.getvalue()
+
+
+def read_rejects(path) -> list[dict]:
+    with open(path) as file:
+        return [json.loads(line) for line in file]
+
+
+class TestValidateCommand:
+
+    @pytest.mark.parametrize("workers", ["1", "2"])
+    def test_jsonl(self, workdir, workers):
+        lines = [json.dumps(row) for row in ROWS]
+        lines.insert(2, "")
+        lines.append("{not json")
+        lines.append("[1, 2]")
+        (workdir / "trades.jsonl").write_text("\n".join(lines) + "\n")
+
+        status, out = run(
+            "trades.jsonl", "--workers", workers, "--chunk-rows", "2"
+        )
+        assert status == 1
+        assert out.startswith("8 rows checked, 7 rejected")
+
+        rejects = read_rejects(workdir / "trades.jsonl.rejects.jsonl")
+        assert [r["line"] for r in rejects] == [2, 4, 5, 6, 7, 8, 9]
+        assert rejects[0]["row"] == ROWS[1]
+        assert [
+            (e["argument"], e["validator"]) for e in rejects[0]["errors"]
+        ] == [("trade_id", "MustBePositive"), ("symbol", "MustMatchRegex")]
+        assert rejects[1]["errors"][0]["argument"] == "side"
+        assert rejects[2]["errors"] == [
+            {
+                "argument": "symbol",
+                "validator": None,
+                "message": "Missing value.",
+            }
+        ]
+        assert rejects[3]["errors"][0]["message"] == "Unexpected value."
+        assert rejects[4]["errors"][0]["validator"] == "DependsOn"
+        assert rejects[5]["errors"][0]["message"].startswith("Invalid JSON")
+        assert rejects[6]["row"] == [1, 2]
+
+    def test_csv_values_are_parsed(self, workdir):
+        (workdir / "trades.csv").write_text(
+            "trade_id,symbol,price,side,limit\n"
+            "1,ABC,1.5,buy,\n"
+            "2,ABC,x,buy,\n"
+            "3,ABC,1.5,sell,9.5\n"
+            "4,ABC,1.5,buy,,extra\n"
+        )
+        status, _ = run("trades.csv", "--rejects", "bad.jsonl")
+        assert status == 1
+        rejects = read_rejects(workdir / "bad.jsonl")
+        assert [r["line"] for r in rejects] == [3, 5]
+        assert rejects[0]["errors"][0]["argument"] == "price"
+        assert "extra" in rejects[1]["errors"][0]["message"]
+
+    def test_valid_file(self, workdir):
+        (workdir / "trades.jsonl").write_text(json.dumps(ROWS[0]) + "\n")
+        status, out = run("trades.jsonl")
+        assert (status, out) == (0, "1 rows checked, 0 rejected.\n")
+
+    def test_path_is_restored(self, workdir):
+        (workdir / "trades.jsonl").write_text(json.dumps(ROWS[0]) + "\n")
+        path = sys.path[:]
+        run("trades.jsonl")
+        assert sys.path == path
+
+    @pytest.mark.parametrize("workers", ["0", "-2"])
+    def test_invalid_workers(self, workdir, workers, capsys):
+        (workdir / "trades.jsonl").write_text(json.dumps(ROWS[0]) + "\n")
+        with pytest.raises(SystemExit):
+            run("trades.jsonl", "--workers", workers)
+        assert "must be a positive integer" in capsys.readouterr().err
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["feed_schema:undecorated", "trades.jsonl"],
+            ["feed_schema:missing", "trades.jsonl"],
+            ["feed_schema", "trades.jsonl"],
+            ["feed_schema:trade", "missing.jsonl"],
+            ["feed_schema:trade", "trades.txt"],
+        ],
+    )
+    def test_errors(self, workdir, argv):
+        (workdir / "trades.jsonl").write_text("")
+        (workdir / "trades.txt").write_text("")
+        with pytest.raises(SystemExit):
+            main(["validate", *argv], out=io.StringIO())
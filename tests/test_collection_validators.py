@@ -5,18 +5,23 @@ import pytest
 from func_validator import (
     MustBeEmpty,
     MustBeMemberOf,
+    MustBeMonotonic,
     MustBeNonEmpty,
+    MustBeSorted,
+    MustBeStrictlyIncreasing,
     MustHaveLengthBetween,
     MustHaveLengthEqual,
     MustHaveLengthGreaterThan,
     MustHaveLengthGreaterThanOrEqual,
     MustHaveLengthLessThan,
     MustHaveLengthLessThanOrEqual,
+    MustHaveUniqueValues,
     MustHaveValuesBetween,
     MustHaveValuesGreaterThan,
     MustHaveValuesGreaterThanOrEqual,
     MustHaveValuesLessThan,
     MustHaveValuesLessThanOrEqual,
+    MustHaveValuesMemberOf,
     ValidationError,
     validate_params,
 )
@@ -220,3 +225,293 @@ class TestCollectionValidator:
         with pytest.raises(ValidationError):
             fn__2([2, 3])
             fn__2([4, 5])
+
+
+# Uniqueness validation tests
+
+
+class TestMustHaveValuesMemberOf:
+
+    @pytest.mark.parametrize(
+        "values",
+        [[], ["a", "b", "a"], ("c",), "abc", iter("cab"), {"a": 1}],
+    )
+    def test_members(self, values):
+        MustHaveValuesMemberOf("abc")(values, "xs")
+
+    @pytest.mark.parametrize(
+        "values, value, index",
+        [
+            (["a", "d", "e"], "'d'", 1),
+            (iter("abxc"), "'x'", 2),
+            (["a", ["b"], "z"], r"\['b'\]", 1),
+        ],
+    )
+    def test_first_non_member_is_reported(self, values, value, index):
+        with pytest.raises(
+            ValidationError, match=f"got {value} at index {index}"
+        ):
+            MustHaveValuesMemberOf(["a", "b", "c"])(values, "xs")
+
+    def test_unhashable_value_set(self):
+        validator = MustHaveValuesMemberOf([[1], [2]])
+        assert validator([[2], [1], [2]], "xs") == 3
+        with pytest.raises(ValidationError, match=r"got 3 at index 1"):
+            validator([[1], 3], "xs")
+
+    def test_returns_values_checked(self):
+        validator = MustHaveValuesMemberOf(range(10))
+        assert validator(list(range(10)) * 3, "xs") == 30
+        assert validator(iter(range(5)), "xs") == 5
+
+    def test_numpy_array(self):
+        np = pytest.importorskip("numpy")
+        validator = MustHaveValuesMemberOf({1, 2, 3})
+        validator(np.array([1, 2, 3, 3]), "xs")
+        with pytest.raises(ValidationError, match="at index 2"):
+            validator(np.array([1, 2, 4]), "xs")
+
+    def test_decorated_function(self):
+        @validate_params
+        def fn(sides: Annotated[list, MustHaveValuesMemberOf({"b", "s"})]):
+            return sides
+
+        assert fn(["b", "s"]) == ["b", "s"]
+        with pytest.raises(ValidationError, match="'h' at index 0"):
+            fn(["h"])
+
+
+class TestMustHaveUniqueValues:
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [],
+            [1],
+            list(range(20_000)),
+            (3, 1, 2),
+            "abc",
+            iter([1, 2, 3]),
+            {1, 2, 3},
+            {"a": 1, "b": 1},
+            [[1], [2], [3]],
+            [{1: 2}, {2: 1}],
+        ],
+    )
+    def test_unique(self, values):
+        MustHaveUniqueValues()(values, "xs")
+
+    @pytest.mark.parametrize(
+        "values, first, second",
+        [
+            ([1, 2, 1, 2, 3], 0, 2),
+            ([1, 2, 3, 3, 1], 2, 3),
+            (list(range(20_000)) + [9_000], 9_000, 20_000),
+            ([1, 1.0], 0, 1),
+            ("abca", 0, 3),
+            (iter([5, 6, 5]), 0, 2),
+            # Unhashable: sorted.
+            ([[3], [1], [2], [1], [3]], 1, 3),
+            # Neither hashable nor orderable: compared pairwise.
+            ([{1: 2}, {2: 1}, {2: 1}], 1, 2),
+            # Only partially ordered: compared pairwise.
+            ([{1}, {2}, {1}], 0, 2),
+        ],
+    )
+    def test_first_duplicate_is_reported(self, values, first, second):
+        with pytest.raises(
+            ValidationError, match=f"at indices {first} and {second}"
+        ):
+            MustHaveUniqueValues()(values, "xs")
+
+    @pytest.mark.parametrize("dtype", ["i8", "f8", "U3"])
+    def test_numpy_arrays(self, dtype):
+        np = pytest.importorskip("numpy")
+        MustHaveUniqueValues()(np.arange(1_000).astype(dtype), "xs")
+        values = np.array([5, 1, 7, 1, 5, 1]).astype(dtype)
+        with pytest.raises(ValidationError, match="indices 1 and 3"):
+            MustHaveUniqueValues()(values, "xs")
+        rows = np.array([[1, 2], [3, 4], [1, 2]]).astype(dtype)
+        with pytest.raises(ValidationError, match="indices 0 and 2"):
+            MustHaveUniqueValues()(rows, "xs")
+
+    def test_decorated_function(self):
+        @validate_params
+        def fn(ids: Annotated[list, MustHaveUniqueValues()]):
+            return ids
+
+        assert fn([1, 2, 3]) == [1, 2, 3]
+        with pytest.raises(ValidationError, match="got 2 at indices 1"):
+            fn([1, 2, 2])
+
+
+# Ordering validation tests
+
+
+class TestOrderValidators:
+
+    @pytest.mark.parametrize(
+        "validator, values",
+        [
+            (MustBeSorted(), []),
+            (MustBeSorted(), [1]),
+            (MustBeSorted(), [1, 1, 2, 3]),
+            (MustBeSorted(reverse=True), (3, 2, 2, 1)),
+            (MustBeSorted(key=len), ["b", "aa", "zz"]),
+            (MustBeSorted(), "abcc"),
+            (MustBeStrictlyIncreasing(), range(5)),
+            (MustBeStrictlyIncreasing(reverse=True), [3, 2, 1]),
+            (MustBeMonotonic(), [1, 1, 2, 3]),
+            (MustBeMonotonic(), [3, 3, 2, 2]),
+            (MustBeMonotonic(strict=True), [3, 2, 1]),
+            (MustBeMonotonic(), [5, 5, 5]),
+        ],
+    )
+    def test_ordered(self, validator, values):
+        validator(values, "xs")
+        validator(iter(values), "xs")
+
+    @pytest.mark.parametrize(
+        "validator, values, message",
+        [
+            (MustBeSorted(), [1, 3, 2], "be sorted, got 2 after 3 at index 2"),
+            (MustBeSorted(reverse=True), [3, 1, 2], "reverse, got 2 after"),
+            (MustBeSorted(key=abs), [1, -3, 2], "got 2 after 3 at index 2"),
+            (MustBeStrictlyIncreasing(), [1, 2, 2], "increasing, got 2"),
+            (
+                MustBeStrictlyIncreasing(reverse=True),
+                [3, 2, 2],
+                "decreasing, got 2 after 2 at index 2",
+            ),
+            (MustBeMonotonic(), [1, 2, 1], "got 1 after 2 at index 2"),
+            (MustBeMonotonic(), [2, 2, 1, 2], "got 2 after 1 at index 3"),
+            (MustBeMonotonic(strict=True), [2, 2], "got 2 after 2 at index 1"),
+            (MustBeMonotonic(strict=True), [3, 2, 2], "at index 2"),
+        ],
+    )
+    def test_unordered(self, validator, values, message):
+        for arg_value in (values, iter(values)):
+            with pytest.raises(ValidationError, match=message):
+                validator(arg_value, "xs")
+
+    def test_stops_at_first_unordered_value(self):
+        def values():
+            yield from (1, 2, 0)
+            raise AssertionError("read past the first unordered value")
+
+        with pytest.raises(ValidationError):
+            MustBeSorted()(values(), "xs")
+
+    def test_buffers(self):
+        from array import array
+
+        MustBeStrictlyIncreasing()(array("d", [0.5, 1.5]), "xs")
+        MustBeSorted()(b"abc", "xs")
+        with pytest.raises(ValidationError, match="index 1"):
+            MustBeSorted()(memoryview(array("i", [2, 1])), "xs")
+
+    @pytest.mark.parametrize(
+        "validator, values, message",
+        [
+            (MustBeSorted(), [1, 3, 2], "got 2 after 3 at index 2"),
+            (MustBeStrictlyIncreasing(), [1, 1], "at index 1"),
+            (MustBeMonotonic(), [2, 2, 1, 2], "got 2 after 1 at index 3"),
+            (MustBeMonotonic(strict=True), [3, 2, 2], "at index 2"),
+            (MustBeMonotonic(), [1, 2, 1], "got 1 after 2 at index 2"),
+        ],
+    )
+    def test_numpy_arrays(self, validator, values, message):
+        np = pytest.importorskip("numpy")
+        for dtype in ("u1", "i8"):
+            with pytest.raises(ValidationError, match=message):
+                validator(np.array(values, dtype=dtype), "xs")
+        MustBeMonotonic()(np.array([3, 3, 1], dtype="u1"), "xs")
+        MustBeStrictlyIncreasing()(np.arange(5.0), "xs")
+
+
+# Sampling tests
+
+
+class TestSampledValues:
+
+    @pytest.mark.parametrize(
+        "validator, invalid",
+        [
+            (MustHaveValuesGreaterThan(0, sample=50, seed=0), -1),
+            (MustHaveValuesGreaterThanOrEqual(0, sample_fraction=0.01), -1),
+            (MustHaveValuesLessThan(10, sample=5), 11),
+            (MustHaveValuesLessThanOrEqual(10, sample_fraction=0.5), 11),
+            (MustHaveValuesBetween(min_value=0, max_value=10, sample=3), 11),
+        ],
+    )
+    def test_sample_is_checked(self, validator, invalid):
+        assert validator([5] * 10_000, "xs") in (3, 5, 50, 100, 5_000)
+        with pytest.raises(ValidationError):
+            validator([invalid] * 10_000, "xs")
+
+    def test_only_sampled_values_are_read(self):
+        class Values(list):
+            reads = 0
+
+            def __getitem__(self, index):
+                Values.reads += 1
+                return super().__getitem__(index)
+
+            def __iter__(self):
+                raise AssertionError("the whole sequence was iterated")
+
+        values = Values(range(1, 100_001))
+        MustHaveValuesGreaterThan(0, sample=100)(values, "xs")
+        assert Values.reads == 100
+
+    def test_seed_makes_the_sample_reproducible(self):
+        values = list(range(100))
+        values[37] = -1
+
+        def outcomes(seed):
+            validator = MustHaveValuesGreaterThan(-1, sample=10, seed=seed)
+            result = []
+            for _ in range(20):
+                try:
+                    validator(values, "xs")
+                    result.append(True)
+                except ValidationError:
+                    result.append(False)
+            return result
+
+        assert outcomes(7) == outcomes(7)
+        assert not all(outcomes(7))
+
+    @pytest.mark.parametrize("size", [0, 3, 100_000])
+    def test_reservoir_sample_of_iterators(self, size):
+        validator = MustHaveValuesGreaterThan(-1, sample=50, seed=3)
+        assert validator(iter(range(size)), "xs") == min(size, 50)
+
+    def test_fraction_of_iterators(self):
+        validator = MustHaveValuesGreaterThan(-1, sample_fraction=0.1, seed=3)
+        assert 800 < validator(iter(range(10_000)), "xs") < 1_200
+        assert validator(iter(range(10)), "xs") <= 10
+
+    def test_reservoir_sample_is_uniform(self):
+        validator = MustHaveValuesGreaterThan(10, sample=1, seed=5)
+        failures = 0
+        for _ in range(2_000):
+            try:
+                validator(iter(range(20)), "xs")
+            except ValidationError:
+                failures += 1
+        # 11 of the 20 values fail.
+        assert 0.45 < failures / 2_000 < 0.65
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"sample": 0},
+            {"sample_fraction": 0},
+            {"sample_fraction": 1.5},
+            {"sample": 5, "sample_fraction": 0.5},
+        ],
+    )
+    def test_invalid_options(self, kwargs):
+        with pytest.raises(ValueError):
+            MustHaveValuesGreaterThan(0, **kwargs)
@@ -0,0 +1,142 @@
+from typing import Annotated
+
+import pytest
+
+from func_validator import (
+    AllOf,
+    AnyOf,
+    DependsOn,
+    Each,
+    MustBeA,
+    MustBeEmpty,
+    MustBeGreaterThan,
+    MustBeLessThan,
+    MustBeLessThanOrEqual,
+    MustBeNonEmpty,
+    MustBePositive,
+    MustHaveLengthGreaterThan,
+    MustHaveLengthLessThan,
+    MustMatchRegex,
+    Not,
+    ValidationError,
+    validate_params,
+)
+from func_validator.validators.combinators import IntervalCheck
+
+
+class TestOperators:
+
+    def test_and(self):
+        validator = MustBeA(int) & MustBePositive()
+        assert isinstance(validator, AllOf)
+        validator(1, "x")
+        with pytest.raises(ValidationError):
+            validator(1.5, "x")
+        with pytest.raises(ValidationError):
+            validator(-1, "x")
+
+    def test_or(self):
+        validator = MustBeLessThan(0) | MustBeGreaterThan(10)
+        assert isinstance(validator, AnyOf)
+        validator(-1, "x")
+        validator(11, "x")
+        with pytest.raises(ValidationError, match="at least one of"):
+            validator(5, "x")
+
+    def test_not(self):
+        validator = ~MustMatchRegex(r"\d+")
+        assert isinstance(validator, Not)
+        validator("abc", "x")
+        with pytest.raises(ValidationError, match="must not satisfy"):
+            validator("123", "x")
+        assert isinstance(~validator, MustMatchRegex)
+
+    def test_nested_operands_are_flattened(self):
+        validator = MustBeA(int) & MustMatchRegex("a") & MustBeA(str)
+        assert len(validator.validators) == 3
+
+    def test_each(self):
+        validator = Each(MustBeA(str) | MustBePositive())
+        validator([1, "a", 2.5], "xs")
+        with pytest.raises(ValidationError):
+            validator([1, -1], "xs")
+        assert validator.SCANS_VALUES and validator.CHECKS_EACH_VALUE
+
+    def test_depends_on_can_not_be_combined(self):
+        with pytest.raises(TypeError):
+            DependsOn("y") & MustBePositive()
+
+    def test_non_validators_are_rejected(self):
+        with pytest.raises(TypeError):
+            MustBePositive() & 1
+
+
+class TestIntervalSimplification:
+
+    def test_bounds_are_merged(self):
+        validator = (
+            MustBeGreaterThan(0)
+            & MustBePositive()
+            & MustBeLessThan(10)
+            & MustBeLessThanOrEqual(100)
+        )
+        (check,) = validator.validators
+        assert isinstance(check, IntervalCheck)
+        assert check.interval == (0, False, 10, False)
+        check(5, "x")
+
+    def test_error_of_first_failing_validator(self):
+        check = IntervalCheck([MustBeLessThan(10), MustBePositive()], "x")
+        with pytest.raises(ValidationError, match="must be > 0"):
+            check(-1, "x")
+        with pytest.raises(ValidationError, match="must be < 10"):
+            check(10, "x")
+
+    def test_contradictions(self):
+        with pytest.raises(ValueError, match="Contradictory"):
+            MustBeGreaterThan(5) & MustBeLessThan(3)
+        with pytest.raises(ValueError, match="Contradictory"):
+            MustBeGreaterThan(3) & MustBeLessThan(3)
+        with pytest.raises(ValueError, match="Contradictory"):
+            (
+                MustHaveLengthGreaterThan(2)
+                & MustHaveLengthLessThan(4)
+                & MustBeEmpty()
+            )
+        with pytest.raises(ValueError, match="Contradictory"):
+            MustHaveLengthGreaterThan(2) & MustHaveLengthLessThan(3)
+
+    def test_length_bounds(self):
+        validator = MustBeNonEmpty() & MustHaveLengthLessThan(3)
+        (check,) = validator.validators
+        assert check.interval == (1, True, 2, True)
+        check([1], "xs")
+        with pytest.raises(ValidationError):
+            check([], "xs")
+
+    def test_only_contiguous_bounds_are_merged(self):
+        validator = MustBePositive() & MustMatchRegex("a") & MustBeLessThan(3)
+        assert len(validator.validators) == 3
+
+    def test_stacked_annotation_bounds_are_merged(self):
+        @validate_params
+        def f(
+            x: Annotated[
+                float, MustBePositive(), MustBeLessThan(10), MustBePositive()
+            ],
+        ):
+            return x
+
+        assert f(1.5) == 1.5
+        with pytest.raises(ValidationError, match="must be < 10"):
+            f(10)
+        (arg_plan,) = f.__validation_plan__.arg_plans
+        assert [type(v) for v in arg_plan.validators] == [IntervalCheck]
+
+    def test_contradictory_annotation(self):
+        @validate_params
+        def f(x: Annotated[int, MustBePositive(), MustBeLessThan(0)]):
+            return x
+
+        with pytest.raises(ValueError, match="Contradictory constraints on x"):
+            f(1)
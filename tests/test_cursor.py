@@ -0,0 +1,124 @@
+import sqlite3
+from typing import Annotated, Optional
+
+import pytest
+
+from func_validator import (
+    DependsOn,
+    MustBeMemberOf,
+    MustBePositive,
+    MustMatchRegex,
+    validate_cursor,
+    validate_params,
+)
+
+
+@validate_params
+def trade(
+    trade_id: Annotated[int, MustBePositive()],
+    symbol: Annotated[str, MustMatchRegex("[A-Z]{1,5}")],
+    side: Annotated[str, MustBeMemberOf({"buy", "sell"})] = "buy",
+    limit: Annotated[Optional[float], DependsOn(side="sell")] = None,
+):
+    raise AssertionError("rows must not call the function")
+
+
+ROWS = [
+    (1, "ABC", "buy", None),
+    (-2, "abc", "buy", None),
+    (3, "XYZ", "hold", None),
+    (4, "XYZ", "sell", None),
+    (5, "XYZ", "sell", 9.5),
+    (6, "XYZ", "buy", 1.0),
+]
+
+
+@pytest.fixture
+def cursor():
+    connection = sqlite3.connect(":memory:")
+    connection.execute('CREATE TABLE trades (trade_id, symbol, side, "limit")')
+    connection.executemany("INSERT INTO trades VALUES (?, ?, ?, ?)", ROWS)
+    cursor = connection.cursor()
+    yield cursor
+    connection.close()
+
+
+def query(cursor, columns='trade_id, symbol, side, "limit"'):
+    cursor.execute(f"SELECT {columns} FROM trades ORDER BY rowid")
+    return cursor
+
+
+class TestValidateCursor:
+
+    @pytest.mark.parametrize("batch_size", [1, 2, 1_000])
+    def test_only_valid_rows_are_yielded(self, cursor, batch_size):
+        rows = validate_cursor(query(cursor), trade, batch_size=batch_size)
+        assert list(rows) == [ROWS[0], ROWS[4], ROWS[5]]
+
+    def test_with_errors(self, cursor):
+        pairs = list(validate_cursor(query(cursor), trade, with_errors=True))
+        assert [row for row, _ in pairs] == ROWS
+        errors = [
+            [(e["argument"], e["validator"]) for e in row_errors]
+            for _, row_errors in pairs
+        ]
+        assert errors == [
+            [],
+            [("trade_id", "MustBePositive"), ("symbol", "MustMatchRegex")],
+            [("side", "MustBeMemberOf")],
+            [("limit", "DependsOn")],
+            [],
+            [],
+        ]
+
+    def test_columns_with_defaults_may_be_left_out(self, cursor):
+        rows = validate_cursor(query(cursor, "trade_id, symbol"), trade)
+        assert list(rows) == [(i, s) for i, s, *_ in ROWS if i != -2]
+
+    def test_fetchmany_batches(self, cursor):
+        sizes = []
+
+        class Cursor:
+            description = query(cursor).description
+
+            def fetchmany(self, size):
+                rows = cursor.fetchmany(size)
+                sizes.append(len(rows))
+                return rows
+
+        rows = validate_cursor(Cursor(), trade, batch_size=4)
+        assert sizes == []
+        assert len(list(rows)) == 3
+        assert sizes == [4, 2, 0]
+
+    def test_annotated_column_spec(self, cursor):
+        spec = {
+            "trade_id": Annotated[int, MustBePositive()],
+            "limit": Annotated[Optional[float], MustBePositive()],
+            "symbol": str,
+        }
+        pairs = validate_cursor(
+            query(cursor), spec, with_errors=True, batch_size=4
+        )
+        assert [len(errors) for _, errors in pairs] == [0, 1, 0, 0, 0, 0]
+
+    def test_check_arg_types(self, cursor):
+        spec = {"symbol": Annotated[int, MustBePositive()]}
+        rows = validate_cursor(query(cursor), spec, check_arg_types=True)
+        assert list(rows) == []
+
+    def test_row_factory(self, cursor):
+        cursor.connection.row_factory = sqlite3.Row
+        cursor = cursor.connection.cursor()
+        rows = list(validate_cursor(query(cursor), trade))
+        assert [row["trade_id"] for row in rows] == [1, 5, 6]
+
+    def test_errors(self, cursor):
+        with pytest.raises(ValueError, match="No query"):
+            validate_cursor(cursor, trade)
+        with pytest.raises(ValueError, match="'trade_id'"):
+            validate_cursor(query(cursor, "symbol"), trade)
+        with pytest.raises(ValueError, match="batch_size"):
+            validate_cursor(query(cursor), trade, batch_size=0)
+        with pytest.raises(TypeError):
+            validate_cursor(query(cursor), lambda trade_id: None)
@@ -1,8 +1,11 @@
+import pickle
+from string import Template
 from typing import Annotated
 
 import pytest
 
 from func_validator import ValidationError, Validator, validate_params
+from func_validator.validators._core import ErrorMsg
 
 
 def test_custom_validator():
@@ -19,3 +22,18 @@ def test_custom_validator():
 
     with pytest.raises(ValidationError):
         fn(3)
+
+
+def test_error_msg_is_a_template():
+    msg = ErrorMsg("${arg_name} must be even, got ${value}.")
+    assert isinstance(msg, ErrorMsg) and isinstance(msg, Template)
+    assert msg.substitute(arg_name="x", value=3) == "x must be even, got 3."
+    assert msg.transform(arg_name="x") == "x must be even, got ${value}."
+    assert pickle.loads(pickle.dumps(msg)).template == msg.template
+
+    class PercentMsg(ErrorMsg):
+        delimiter = "%"
+
+    msg = PercentMsg("%arg_name must be even.")
+    assert isinstance(msg, PercentMsg) and isinstance(msg, Template)
+    assert msg.transform(arg_name="x") == "x must be even."
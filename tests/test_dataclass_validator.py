@@ -0,0 +1,83 @@
+import dataclasses
+from typing import Annotated, Optional
+
+import pytest
+
+from func_validator import (
+    DependsOn,
+    MustBeMemberOf,
+    MustBeNonNegative,
+    MustBePositive,
+    MustBeProvided,
+    ValidationError,
+    validated_dataclass,
+)
+
+
+@validated_dataclass(frozen=True, slots=True)
+class Point:
+    x: Annotated[float, MustBeNonNegative()]
+    y: Annotated[float, MustBeNonNegative()] = 0.0
+
+
+@validated_dataclass(kw_only=True)
+class Shape:
+    kind: Annotated[str, MustBeMemberOf(["square", "rectangle"])] = "square"
+    width: Annotated[float, MustBePositive()]
+    height: Annotated[
+        Optional[float],
+        DependsOn(kind="rectangle", kw_strategy=MustBeProvided),
+        MustBePositive(),
+    ] = None
+    tags: list = dataclasses.field(default_factory=list)
+    area: float = dataclasses.field(init=False, default=0.0)
+
+    def __post_init__(self):
+        self.area = self.width * (self.height or self.width)
+
+
+@validated_dataclass
+class Labelled(Shape):
+    label: Annotated[Optional["Label"], MustBeMemberOf(["a", "b"])] = None
+
+
+Label = str
+
+
+class TestValidatedDataclass:
+
+    def test_defaults_and_frozen(self):
+        assert Point(1) == Point(1, 0.0)
+        with pytest.raises(ValidationError):
+            Point(-1)
+        with pytest.raises(ValidationError):
+            Point(1, -1)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            Point(1).x = 2
+        assert not hasattr(Point(1), "__dict__")
+
+    def test_kw_only_depends_on_and_user_post_init(self):
+        assert Shape(width=2).area == 4
+        assert Shape(kind="rectangle", width=2, height=3).area == 6
+
+        with pytest.raises(TypeError):
+            Shape(2)
+        with pytest.raises(ValidationError):
+            Shape(width=-2)
+        with pytest.raises(ValidationError):
+            Shape(kind="rectangle", width=2)
+        with pytest.raises(ValidationError):
+            Shape(kind="circle", width=2)
+
+    def test_subclass_and_forward_references(self):
+        assert Labelled(width=2, label="a").area == 4
+        assert Labelled(width=2).label is None
+
+        with pytest.raises(ValidationError):
+            Labelled(width=2, label="c")
+        with pytest.raises(ValidationError):
+            Labelled(width=-2, label="a")
+
+    def test_errors(self):
+        with pytest.raises(TypeError):
+            validated_dataclass(lambda: None)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import gc
+from typing import Annotated
+
+import pytest
+
+import func_validator
+from func_validator import MustBePositive, ValidationError, validate_params
+
+
+@validate_params(check_arg_types=True)
+def area(shape: Annotated[Square, MustBeA_positive_side()]):
+    return shape.side**2
+
+
+@validate_params
+def scale(factor: Annotated[float, MustBePositive()], shape: Square):
+    return Square(shape.side * factor)
+
+
+class Square:
+    def __init__(self, side: float):
+        self.side = side
+
+
+class MustBeA_positive_side(MustBePositive):
+    def __call__(self, arg_value: Square, arg_name: str):
+        super().__call__(arg_value.side, arg_name)
+
+
+class TestDeferredAnnotations:
+
+    def test_forward_references_resolve_on_first_call(self):
+        assert area(Square(2)) == 4
+        assert scale(2, Square(1)).side == 2
+
+        with pytest.raises(ValidationError):
+            area(Square(-1))
+        with pytest.raises(ValidationError):
+            area("not a square")
+        with pytest.raises(ValidationError):
+            scale(-1, Square(1))
+
+    def test_plan_is_built_once(self):
+        plan = area.__validation_plan__
+        area(Square(3))
+        arg_plans = plan.arg_plans
+        area(Square(4))
+        assert plan.arg_plans is arg_plans
+
+    def test_compile_all(self):
+        @validate_params
+        def fn(arg__1: Annotated[int, MustBePositive()]):
+            return arg__1
+
+        assert not fn.__validation_plan__.is_compiled
+        assert func_validator.compile_all() >= 1
+        assert fn.__validation_plan__.is_compiled
+        assert func_validator.compile_all() == 0
+
+    def test_compile_all_reports_unresolvable_annotations(self):
+        @validate_params
+        def fn(arg__1: Annotated[Undefined, MustBePositive()]):  # noqa
+            return arg__1
+
+        with pytest.raises(NameError):
+            func_validator.compile_all()
+
+        del fn
+        gc.collect()
+        assert func_validator.compile_all() == 0
@@ -0,0 +1,137 @@
+import dataclasses
+import gc
+from typing import Annotated
+
+import pytest
+
+import func_validator
+from func_validator import (
+    MustHaveValuesGreaterThan,
+    ValidationError,
+    Validator,
+    validate_params,
+)
+
+
+class CountingAccept(Validator):
+    calls = 0
+
+    def __call__(self, arg_value, arg_name: str):
+        CountingAccept.calls += 1
+
+
+class VersionedList(list):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+
+    def append(self, item):
+        super().append(item)
+        self.version += 1
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    name: str
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    CountingAccept.calls = 0
+    func_validator.reset_stats()
+
+
+def counters(fn) -> dict:
+    name = f"{fn.__module__}.{fn.__qualname__}"
+    return func_validator.stats()[name]["counters"]
+
+
+class TestIdentityCache:
+
+    def test_immutable_values_are_scanned_once(self):
+        @validate_params(identity_cache=True)
+        def total(values: Annotated[tuple, CountingAccept()]):
+            return sum(values)
+
+        values = tuple(range(10))
+        assert total(values) == 45
+        assert total(values) == 45
+        assert CountingAccept.calls == 1
+        # Equal but distinct objects are checked again.
+        assert total(tuple(range(10))) == 45
+        assert CountingAccept.calls == 2
+        assert counters(total) == {
+            "identity_cache_misses": 2,
+            "identity_cache_hits": 1,
+        }
+
+    def test_failing_values_are_not_remembered(self):
+        @validate_params(identity_cache=True)
+        def total(values: Annotated[tuple, MustHaveValuesGreaterThan(0)]):
+            return sum(values)
+
+        values = (1, -1)
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                total(values)
+
+    def test_mutable_values_need_version(self):
+        @validate_params(identity_cache=True)
+        def total(values: Annotated[list, CountingAccept()]):
+            return sum(values)
+
+        values = [1, 2]
+        total(values)
+        total(values)
+        assert CountingAccept.calls == 2
+
+    def test_version_of(self):
+        @validate_params(
+            version_of=lambda v: getattr(v, "version", None),
+        )
+        def total(values: Annotated[list, MustHaveValuesGreaterThan(0)]):
+            return sum(values)
+
+        values = VersionedList([1, 2])
+        assert total(values) == 3
+        assert total(values) == 3
+        values.append(-5)
+        with pytest.raises(ValidationError):
+            total(values)
+        assert counters(total)["identity_cache_hits"] == 1
+
+    def test_weakly_referenced_values_are_dropped(self):
+        @validate_params(identity_cache=True)
+        def name(config: Annotated[Config, CountingAccept()]):
+            return config.name
+
+        config = Config("a")
+        assert name(config) == name(config) == "a"
+        assert CountingAccept.calls == 1
+
+        cache = name.__validation_plan__.identity_cache
+        assert len(cache.entries) == 1
+        del config
+        gc.collect()
+        assert not cache.entries
+
+    def test_cache_is_bounded(self):
+        @validate_params(identity_cache=True)
+        def size(values: Annotated[tuple, CountingAccept()]):
+            return len(values)
+
+        cache = size.__validation_plan__.identity_cache
+        cache.maxsize = 2
+        for n in range(4):
+            size(tuple(range(n)) + ("x",))
+        assert len(cache.entries) == 2
+        assert counters(size)["identity_cache_evictions"] == 2
+
+    def test_counters_in_prometheus_output(self):
+        @validate_params(identity_cache=True)
+        def size(values: Annotated[tuple, CountingAccept()]):
+            return len(values)
+
+        size(("a",))
+        text = func_validator.stats().to_prometheus()
+        assert "# TYPE func_validator_identity_cache_misses_total" in text
@@ -0,0 +1,62 @@
+import ast
+import os
+import subprocess
+import sys
+
+#: Budget (in microseconds) for the cumulative import time of
+#: `func_validator`, as reported by `python -X importtime`.
+IMPORT_BUDGET_US = int(
+    os.environ.get("FUNC_VALIDATOR_IMPORT_BUDGET_US", 50_000)
+)
+
+
+def _run(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_import_time_us(module: str) -> int:
+    proc = _run(f"import {module}", "-X", "importtime")
+    for line in proc.stderr.splitlines():
+        *_, cumulative, name = line.split("|")
+        if name.strip() == module and not name.startswith("  "):
+            return int(cumulative)
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+def test_import_time_within_budget():
+    # Best of a few runs, to keep the test stable on noisy machines.
+    best = min(_cumulative_import_time_us("func_validator") for _ in range(3))
+    assert best <= IMPORT_BUDGET_US, (
+        f"import func_validator took {best} us, "
+        f"budget is {IMPORT_BUDGET_US} us"
+    )
+
+
+def test_validator_families_are_loaded_lazily():
+    proc = _run(
+        "import sys, func_validator\n"
+        "func_validator.MustBePositive\n"
+        "print(sorted(m for m in sys.modules if m.startswith('func_')))"
+    )
+    loaded = ast.literal_eval(proc.stdout)
+
+    assert "func_validator.validators.numeric_arg_validators" in loaded
+    assert "func_validator.validators.text_arg_validators" not in loaded
+    assert "func_validator.validators.collection_arg_validators" not in loaded
+    assert "func_validator._func_arg_validator" not in loaded
+
+
+def test_lazy_names_match_all():
+    import func_validator
+    from func_validator import validators
+
+    for name in func_validator.__all__:
+        assert getattr(func_validator, name) is not None
+    for name in validators.__all__:
+        assert getattr(func_validator, name) is getattr(validators, name)
+    assert set(validators.__all__) <= set(dir(func_validator))
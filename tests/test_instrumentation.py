@@ -0,0 +1,123 @@
+import json
+from typing import Annotated
+
+import pytest
+
+import func_validator
+from func_validator import (
+    MustBeNegative,
+    MustBePositive,
+    MustHaveValuesGreaterThan,
+    ValidationError,
+    Validator,
+    validate_params,
+)
+from func_validator._func_arg_validator import _process_func
+
+
+class TestInstrumentation:
+
+    def test_instrumented_function_records_calls_and_failures(self):
+        @validate_params(instrument=True)
+        def fn__1(
+            arg__1: Annotated[int, MustBePositive()],
+            arg__2: Annotated[int, MustBeNegative()],
+        ):
+            return arg__1, arg__2
+
+        func_validator.reset_stats()
+        assert fn__1(1, -1) == (1, -1)
+        with pytest.raises(ValidationError):
+            fn__1(1, 1)
+
+        data = func_validator.stats()[
+            f"{fn__1.__module__}.{fn__1.__qualname__}"
+        ]
+        assert data["calls"] == 2
+        assert data["failures"] == 1
+        assert sum(data["histogram"]["counts"]) == 2
+
+        validators = {
+            (v["argument"], v["validator"]): v for v in data["validators"]
+        }
+        assert validators[("arg__1", "MustBePositive")]["calls"] == 2
+        assert validators[("arg__1", "MustBePositive")]["failures"] == 0
+        assert validators[("arg__2", "MustBeNegative")]["failures"] == 1
+
+    def test_validators_raising_other_errors_are_failures(self):
+        class Broken(Validator):
+            def __call__(self, arg_value, arg_name: str):
+                raise RuntimeError(arg_name)
+
+        @validate_params(instrument=True)
+        def fn__1(arg__1: Annotated[int, Broken()]):
+            return arg__1
+
+        func_validator.reset_stats()
+        with pytest.raises(RuntimeError):
+            fn__1(1)
+
+        data = func_validator.stats()[
+            f"{fn__1.__module__}.{fn__1.__qualname__}"
+        ]
+        assert (data["calls"], data["failures"]) == (1, 1)
+        assert data["validators"][0]["failures"] == 1
+
+    def test_instrumentation_is_chosen_at_decoration_time(self):
+        def fn__1(arg__1: Annotated[int, MustBePositive()]):
+            return arg__1
+
+        func_validator.enable_instrumentation()
+        try:
+            instrumented = validate_params(fn__1)
+        finally:
+            func_validator.disable_instrumentation()
+        plain = validate_params(fn__1)
+
+        assert instrumented.__code__ is not plain.__code__
+        assert plain.__code__ is _process_func(fn__1, False).__code__
+
+    def test_stats_exports(self):
+        @validate_params(instrument=True)
+        def fn__1(arg__1: Annotated[int, MustBePositive()]):
+            return arg__1
+
+        fn__1(3)
+        snapshot = func_validator.stats()
+        name = f"{fn__1.__module__}.{fn__1.__qualname__}"
+
+        assert json.loads(snapshot.to_json())["functions"][name]["calls"] >= 1
+
+        text = snapshot.to_prometheus()
+        assert "# TYPE func_validator_calls_total counter" in text
+        assert f'func_validator_calls_total{{function="{name}"}}' in text
+        assert (
+            f'func_validator_validation_seconds_bucket{{function="{name}",'
+            f'le="+Inf"}}'
+        ) in text
+
+    def test_values_checked(self):
+        @validate_params(instrument=True)
+        def fn__1(
+            arg__1: Annotated[list, MustHaveValuesGreaterThan(0)],
+            arg__2: Annotated[
+                list, MustHaveValuesGreaterThan(0, sample=10, seed=1)
+            ],
+        ):
+            return arg__1, arg__2
+
+        func_validator.reset_stats()
+        values = list(range(1, 1_001))
+        fn__1(values, values)
+        fn__1(values, values)
+
+        data = func_validator.stats()[
+            f"{fn__1.__module__}.{fn__1.__qualname__}"
+        ]
+        checked = {
+            v["argument"]: v["values_checked"] for v in data["validators"]
+        }
+        assert checked == {"arg__1": 2_000, "arg__2": 20}
+        assert "func_validator_validator_values_checked_total" in (
+            func_validator.stats().to_prometheus()
+        )
@@ -0,0 +1,208 @@
+import sys
+from dataclasses import field
+from typing import Annotated, NotRequired, Optional, TypedDict
+
+import pytest
+
+from func_validator import (
+    DependsOn,
+    MustBeMemberOf,
+    MustBeNonNegative,
+    MustBePositive,
+    MustHaveKeys,
+    MustHaveLengthLessThan,
+    MustHaveValuesFor,
+    MustMatchRegex,
+    ValidationError,
+    validate_params,
+    validated_dataclass,
+)
+
+
+class Line(TypedDict):
+    sku: Annotated[str, MustMatchRegex("[A-Z]+")]
+    qty: Annotated[int, MustBePositive()]
+
+
+class Node(TypedDict, total=False):
+    value: Annotated[int, MustBeNonNegative()]
+    child: "Node"
+
+
+class Order(TypedDict):
+    order_id: Annotated[int, MustBePositive()]
+    lines: list[Line]
+    note: NotRequired[Annotated[Optional[str], MustHaveLengthLessThan(5)]]
+    tree: NotRequired[Node]
+
+
+class Plain(TypedDict):
+    name: str
+
+
+def nested(depth: int) -> dict:
+    root = node = {}
+    for _ in range(depth):
+        node["child"] = node = {}
+    return root
+
+
+class TestMustHaveKeys:
+
+    def test_keys(self):
+        MustHaveKeys("a", "b")({"a": 1, "b": 2, "c": 3}, "m")
+        MustHaveKeys()({}, "m")
+
+    def test_missing_keys_in_order(self):
+        with pytest.raises(
+            ValidationError, match=r"missing keys \['c', 'a'\]"
+        ):
+            MustHaveKeys("c", "b", "a")({"b": 1}, "m")
+
+    def test_not_a_mapping(self):
+        with pytest.raises(ValidationError, match="must be a mapping"):
+            MustHaveKeys("a")(["a"], "m")
+
+
+class TestMustHaveValuesFor:
+
+    def test_keyword_and_mapping_annotations(self):
+        validator = MustHaveValuesFor(
+            {"unit price": Annotated[float, MustBePositive()]},
+            side=Annotated[str, MustBeMemberOf({"buy", "sell"})],
+        )
+        assert validator({"unit price": 1.5, "side": "buy"}, "m") == 2
+        # Keys are optional.
+        validator({}, "m")
+        with pytest.raises(ValidationError, match=r"m\['unit price'\]"):
+            validator({"unit price": -1.0}, "m")
+        with pytest.raises(ValidationError, match=r"m\['side'\]"):
+            validator({"side": "hold"}, "m")
+
+    def test_depends_on_sibling_keys(self):
+        validator = MustHaveValuesFor(
+            limit=Annotated[Optional[float], DependsOn(side="sell")]
+        )
+        validator({"side": "buy", "limit": None}, "m")
+        with pytest.raises(ValidationError, match="must be provided"):
+            validator({"side": "sell", "limit": None}, "m")
+
+    @pytest.mark.parametrize(
+        "order, message",
+        [
+            ({"order_id": 1}, r"o is missing keys \['lines'\]"),
+            ({"order_id": 0, "lines": []}, r"o\['order_id'\]"),
+            (
+                {"order_id": 1, "lines": [{"sku": "A", "qty": 1}, {}]},
+                r"o\['lines'\]\[1\] is missing keys \['sku', 'qty'\]",
+            ),
+            (
+                {"order_id": 1, "lines": [{"sku": "A", "qty": 0}]},
+                r"o\['lines'\]\[0\]\['qty'\]",
+            ),
+            ({"order_id": 1, "lines": {}}, r"o\['lines'\] must be a list"),
+            ({"order_id": 1, "lines": [5]}, r"\[0\] must be a mapping"),
+            (
+                {"order_id": 1, "lines": [], "note": "too long"},
+                r"o\['note'\]",
+            ),
+            (
+                {"order_id": 1, "lines": [], "tree": {"child": {"value": -1}}},
+                r"o\['tree'\]\['child'\]\['value'\]",
+            ),
+        ],
+    )
+    def test_typed_dict(self, order, message):
+        with pytest.raises(ValidationError, match=message):
+            MustHaveValuesFor(Order)(order, "o")
+
+    def test_values_checked(self):
+        validator = MustHaveValuesFor(Order)
+        order = {
+            "order_id": 1,
+            "lines": [{"sku": "A", "qty": 1}] * 3,
+            "note": None,
+        }
+        # 3 keys, 3 lines and 2 keys per line.
+        assert validator(order, "o") == 12
+
+    def test_depth_limit(self):
+        MustHaveValuesFor(Node, max_depth=5)(nested(5), "t")
+        with pytest.raises(ValidationError, match="more than 5 levels"):
+            MustHaveValuesFor(Node, max_depth=5)(nested(6), "t")
+
+    def test_deep_payload_is_not_recursed_into(self):
+        depth = sys.getrecursionlimit() * 2
+        validator = MustHaveValuesFor(Node, max_depth=depth, max_values=depth)
+        assert validator(nested(depth), "t") == depth
+        with pytest.raises(ValidationError, match="levels deep"):
+            MustHaveValuesFor(Node)(nested(depth), "t")
+
+    def test_size_limit(self):
+        validator = MustHaveValuesFor(Order, max_values=10)
+        lines = [{"sku": "A", "qty": 1}] * 4
+        validator({"order_id": 1, "lines": lines[:2]}, "o")
+        with pytest.raises(ValidationError, match="more than 10 keys"):
+            validator({"order_id": 1, "lines": lines}, "o")
+
+    def test_nested_validator_runs_in_the_same_pass(self):
+        validator = MustHaveValuesFor(
+            inner=Annotated[
+                dict, MustHaveValuesFor(x=Annotated[int, MustBePositive()])
+            ],
+            max_depth=0,
+        )
+        validator({}, "m")
+        with pytest.raises(ValidationError, match="levels deep"):
+            validator({"inner": {"x": 1}}, "m")
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            MustHaveValuesFor(max_depth=-1)
+        with pytest.raises(ValueError):
+            MustHaveValuesFor(Order, note=int)
+
+
+class TestTypedDictAnnotations:
+
+    def test_function_argument(self):
+        @validate_params
+        def place(order: Order, plain: Optional[Plain] = None):
+            return order
+
+        order = {"order_id": 1, "lines": [{"sku": "AB", "qty": 2}]}
+        assert place(order) is order
+        # Without validators, a TypedDict is not checked.
+        place(order, {})
+        with pytest.raises(ValidationError, match=r"order\['lines'\]\[0\]"):
+            place({"order_id": 1, "lines": [{"sku": "ab", "qty": 2}]})
+
+    def test_optional_argument_and_type_check(self):
+        @validate_params(check_arg_types=True)
+        def place(order: Optional[Order] = None):
+            return order
+
+        assert place() is None
+        place({"order_id": 1, "lines": []})
+        with pytest.raises(ValidationError, match="must be of type"):
+            place([])
+
+    def test_plain_typed_dict_is_not_type_checked(self):
+        @validate_params(check_arg_types=True)
+        def name(plain: Plain, count: int):
+            return plain
+
+        assert name(3, "x") == 3
+
+    def test_dataclass_field(self):
+        @validated_dataclass
+        class Batch:
+            orders: list = field(default_factory=list)
+            first: Annotated[Optional[Order], MustHaveKeys("note")] = None
+
+        Batch()
+        Batch(first={"order_id": 1, "lines": [], "note": "ok"})
+        with pytest.raises(ValidationError, match="missing keys"):
+            Batch(first={"order_id": 1, "lines": []})
+        with pytest.raises(ValidationError, match=r"first\['order_id'\]"):
+            Batch(first={"order_id": -1, "lines": [], "note": "ok"})
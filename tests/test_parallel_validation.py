@@ -0,0 +1,114 @@
+from array import array
+from typing import Annotated
+
+import pytest
+
+from func_validator import (
+    MustHaveValuesBetween,
+    MustHaveValuesGreaterThanOrEqual,
+    ValidationError,
+    _parallel,
+    disable_parallel_validation,
+    enable_parallel_validation,
+    validate_params,
+)
+
+SIZE = 50_000
+
+
+@pytest.fixture(params=["thread", "process"])
+def executor(request):
+    enable_parallel_validation(
+        workers=2, threshold=1_000, executor=request.param
+    )
+    yield request.param
+    disable_parallel_validation()
+
+
+def failing_at(*indexes: int, typecode=None):
+    values = [0.5] * SIZE
+    for index in indexes:
+        values[index] = -1.0
+    return values if typecode is None else array(typecode, values)
+
+
+class TestParallelValidation:
+
+    @pytest.mark.parametrize("typecode", [None, "d"])
+    def test_valid_values(self, executor, typecode):
+        MustHaveValuesBetween(min_value=0, max_value=1)(
+            failing_at(typecode=typecode), "xs"
+        )
+
+    @pytest.mark.parametrize("typecode", [None, "d"])
+    def test_first_failure_is_reported(self, executor, typecode):
+        values = failing_at(SIZE - 1, 31_000, 12_345, typecode=typecode)
+        with pytest.raises(ValidationError, match="-1.0") as exc_info:
+            MustHaveValuesBetween(min_value=0, max_value=1)(values, "xs")
+        assert exc_info.value.__notes__ == [
+            "First failing value at index 12345."
+        ]
+
+    def test_errors_match_sequential_scan(self, executor):
+        values = failing_at(40_000)
+        validator = MustHaveValuesGreaterThanOrEqual(0)
+        with pytest.raises(ValidationError) as parallel:
+            validator(values, "xs")
+        disable_parallel_validation()
+        with pytest.raises(ValidationError) as sequential:
+            validator(values, "xs")
+        assert str(parallel.value) == str(sequential.value)
+
+    def test_type_errors_are_raised_in_order(self, executor):
+        values = failing_at(30_000)
+        values[20_000] = "a"
+        with pytest.raises(TypeError):
+            MustHaveValuesBetween(min_value=0, max_value=1)(values, "xs")
+
+    def test_small_sequences_are_not_split(self, executor, monkeypatch):
+        monkeypatch.setattr(_parallel, "check_values", None)
+        MustHaveValuesBetween(min_value=0, max_value=1)([0.5] * 999, "xs")
+        MustHaveValuesBetween(min_value=0, max_value=1)(
+            set(failing_at()), "xs"
+        )
+
+    def test_decorated_function(self, executor):
+        @validate_params
+        def total(
+            xs: Annotated[list, MustHaveValuesGreaterThanOrEqual(0)],
+        ):
+            return sum(xs)
+
+        assert total(failing_at()) == SIZE / 2
+        with pytest.raises(ValidationError):
+            total(failing_at(1_001))
+
+
+class TestSettings:
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"workers": 0}, {"threshold": 0}, {"executor": "gpu"}],
+    )
+    def test_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            enable_parallel_validation(**kwargs)
+
+    def test_unpicklable_validator_runs_sequentially(self):
+        enable_parallel_validation(workers=2, threshold=10, executor="process")
+        try:
+            seen = []
+            _parallel.check_values(
+                range(100), "xs", lambda value, _: seen.append(value)
+            )
+            assert seen == list(range(100))
+            assert "process" not in _parallel._POOLS
+        finally:
+            disable_parallel_validation()
+
+    def test_workers_are_reused(self, executor):
+        validator = MustHaveValuesBetween(min_value=0, max_value=1)
+        validator(failing_at(), "xs")
+        pool = _parallel._POOLS[executor]
+        validator(failing_at(), "xs")
+        assert _parallel._POOLS[executor] is pool
@@ -0,0 +1,57 @@
+import io
+import sys
+import textwrap
+
+from func_validator import profile
+
+WORKLOAD = textwrap.dedent(
+    """
+    from typing import Annotated
+
+    from func_validator import (
+        MustBePositive,
+        MustHaveValuesGreaterThan,
+        validate_params,
+    )
+
+    @validate_params
+    def hot_fn(values: Annotated[list, MustHaveValuesGreaterThan(0)]):
+        return len(values)
+
+    @validate_params(check_arg_types=True)
+    def cold_fn(arg__1: Annotated[int, MustBePositive()]):
+        return arg__1
+
+    for _ in range(50):
+        hot_fn([1, 2, 3])
+    cold_fn(1)
+    """
+)
+
+
+def test_profile_report(tmp_path):
+    script = tmp_path / "workload.py"
+    script.write_text(WORKLOAD)
+
+    out = io.StringIO()
+    profile.main(["--hot-calls", "10", str(script)], out=out)
+    report = out.getvalue()
+
+    lines = report.splitlines()
+    hot_row = next(i for i, ln in enumerate(lines) if "hot_fn" in ln)
+    cold_row = next(i for i, ln in enumerate(lines) if "cold_fn" in ln)
+    assert hot_row < cold_row
+    assert "values: MustHaveValuesGreaterThan" in report
+    assert "arg__1: MustBeA" in report
+    assert "! __main__.hot_fn: MustHaveValuesGreaterThan scans" in report
+    assert "cold_fn: MustBePositive scans" not in report
+
+
+def test_profile_restores_argv_and_path(tmp_path):
+    script = tmp_path / "workload.py"
+    script.write_text("import sys\nassert sys.argv[1:] == ['-x']\n")
+    argv, path = sys.argv[:], sys.path[:]
+
+    profile.main([str(script), "-x"], out=io.StringIO())
+    assert sys.argv == argv
+    assert sys.path == path
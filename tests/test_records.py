@@ -0,0 +1,141 @@
+import struct
+
+import pytest
+
+from func_validator import (
+    DependsOn,
+    MustBeBetween,
+    MustBeMemberOf,
+    MustBeNonEmpty,
+    MustBePositive,
+    MustBeSorted,
+    MustHaveLengthLessThan,
+    MustHaveUniqueValues,
+    MustHaveValuesGreaterThanOrEqual,
+    RecordFailure,
+    validate_records,
+)
+
+LAYOUT = [("id", "<u8"), ("price", "<f8"), ("side", "<i1")]
+RECORD = struct.Struct("<Qdb")
+
+
+@pytest.fixture
+def trades(tmp_path):
+    path = tmp_path / "trades.bin"
+    records = [(i, 1.0 + i, 1 if i % 2 else -1) for i in range(1_000)]
+    records[12] = (12, -5.0, 1)
+    records[700] = (700, 3.0, 0)
+    records[701] = (701, 0.0, 1)
+    with open(path, "wb") as file:
+        for record in records:
+            file.write(RECORD.pack(*record))
+    return path
+
+
+class TestValidateRecords:
+
+    @pytest.mark.parametrize("chunk_records", [1, 7, 65_536])
+    def test_failing_records_are_reported(self, trades, chunk_records):
+        failures = validate_records(
+            trades,
+            LAYOUT,
+            {"price": MustBePositive(), "side": MustBeMemberOf({-1, 1})},
+            chunk_records=chunk_records,
+        )
+        assert [(f.record, f.column, f.value) for f in failures] == [
+            (12, "price", -5.0),
+            (700, "side", 0),
+            (701, "price", 0.0),
+        ]
+        assert failures[0].offset == 12 * RECORD.size
+        assert "must be > 0" in failures[0].message
+
+    def test_struct_layout(self, trades):
+        failures = validate_records(
+            trades, "<Qdb", {1: [MustBeBetween(min_value=0, max_value=1e4)]}
+        )
+        assert [f.record for f in failures] == [12]
+
+    def test_collection_validators_check_each_value(self, trades):
+        failures = validate_records(
+            trades,
+            LAYOUT,
+            {"price": MustHaveValuesGreaterThanOrEqual(0)},
+            chunk_records=100,
+        )
+        assert [f.record for f in failures] == [12]
+        assert failures[0] == RecordFailure(
+            12,
+            12 * RECORD.size,
+            "price",
+            -5.0,
+            failures[0].message,
+        )
+
+    def test_length_validators_check_the_number_of_records(self, trades):
+        failures = validate_records(
+            trades,
+            LAYOUT,
+            {"id": [MustBeNonEmpty(), MustHaveLengthLessThan(1_000)]},
+        )
+        assert [(f.record, f.value) for f in failures] == [(None, 1_000)]
+
+    def test_max_failures(self, trades):
+        failures = validate_records(
+            trades, LAYOUT, {"id": MustBePositive()}, max_failures=None
+        )
+        assert [f.record for f in failures] == [0]
+        failures = validate_records(
+            trades,
+            LAYOUT,
+            {"price": MustBeBetween(min_value=10, max_value=20)},
+            max_failures=5,
+            chunk_records=3,
+        )
+        assert [f.record for f in failures] == [0, 1, 2, 3, 4]
+
+    def test_single_column_files_are_cast(self, tmp_path):
+        path = tmp_path / "values.bin"
+        path.write_bytes(struct.pack("=4d", 1.0, 2.0, -3.0, 4.0))
+        failures = validate_records(path, "=d", {0: MustBePositive()})
+        assert [(f.record, f.value) for f in failures] == [(2, -3.0)]
+
+    def test_header_offset(self, tmp_path):
+        path = tmp_path / "values.bin"
+        path.write_bytes(b"HDR" + struct.pack(">3i", 1, -2, 3))
+        failures = validate_records(
+            path, [("x", ">i4")], {"x": MustBePositive()}, offset=3
+        )
+        assert [(f.record, f.offset) for f in failures] == [(1, 7)]
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        assert validate_records(path, "<d", {0: MustBePositive()}) == []
+
+    def test_partial_record(self, tmp_path):
+        path = tmp_path / "values.bin"
+        path.write_bytes(struct.pack("<d", 1.0) + b"\0")
+        with pytest.raises(ValueError, match="whole number"):
+            validate_records(path, "<d", {0: MustBePositive()})
+
+    @pytest.mark.parametrize(
+        "layout, validators, error",
+        [
+            ("<q", {"x": MustBePositive()}, ValueError),
+            ("<z", {0: MustBePositive()}, ValueError),
+            (
+                [("x", "<i4"), ("y", ">i4")],
+                {"x": MustBePositive()},
+                ValueError,
+            ),
+            ([("x", "4i")], {"x": MustBePositive()}, ValueError),
+            ("<q", {0: DependsOn("y")}, TypeError),
+            ("<q", {0: MustHaveUniqueValues()}, TypeError),
+            ("<q", {0: MustBeSorted()}, TypeError),
+        ],
+    )
+    def test_invalid_arguments(self, trades, layout, validators, error):
+        with pytest.raises(error):
+            validate_records(trades, layout, validators)
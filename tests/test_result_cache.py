@@ -0,0 +1,210 @@
+from typing import Annotated
+
+import pytest
+
+import func_validator
+from func_validator import (
+    MustBeA,
+    MustBePositive,
+    ValidationError,
+    Validator,
+    validate_params,
+)
+
+
+class CountingAccept(Validator):
+    calls = 0
+
+    def __call__(self, arg_value, arg_name: str):
+        CountingAccept.calls += 1
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    CountingAccept.calls = 0
+    func_validator.reset_stats()
+
+
+@pytest.fixture(params=[False, True], ids=["plain", "instrumented"])
+def instrument(request):
+    return request.param
+
+
+class TestResultCache:
+
+    def test_hits_skip_validation_and_call(self, instrument):
+        body_calls = []
+
+        @validate_params(cache=True, instrument=instrument)
+        def double(x: Annotated[int, CountingAccept()], factor: int = 2):
+            body_calls.append(x)
+            return x * factor
+
+        assert double(3) == 6
+        assert double(3) == 6
+        assert double(x=3) == 6
+        assert double(3, 2) == 6
+        assert CountingAccept.calls == 1
+        assert body_calls == [3]
+
+        info = double.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (3, 1, 1)
+
+    def test_argument_types_are_part_of_the_key(self):
+        @validate_params(cache=True)
+        def f(x: Annotated[int, MustBeA(int)]):
+            return x
+
+        assert f(1) == 1
+        with pytest.raises(ValidationError):
+            f(1.0)
+
+    def test_variadic_argument_types_are_part_of_the_key(self, instrument):
+        @validate_params(cache=True, instrument=instrument)
+        def f(*args: int, **kwargs: int):
+            return args, kwargs
+
+        assert f(1, x=1) == ((1,), {"x": 1})
+        assert type(f(1, x=1.0)[1]["x"]) is float
+        assert [type(f(value)[0][0]) for value in (2, 2.0, True)] == [
+            int,
+            float,
+            bool,
+        ]
+
+    def test_failures_are_not_cached(self, instrument):
+        @validate_params(cache=True, instrument=instrument)
+        def f(x: Annotated[int, MustBePositive()]):
+            return x
+
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                f(-1)
+        assert f.cache_info().currsize == 0
+
+    def test_lru_eviction(self):
+        @validate_params(cache=2)
+        def f(x: Annotated[int, CountingAccept()]):
+            return x
+
+        f(1)
+        f(2)
+        f(1)
+        f(3)
+        assert CountingAccept.calls == 3
+        f(1)
+        assert CountingAccept.calls == 3
+        f(2)
+        assert CountingAccept.calls == 4
+
+        info = f.cache_info()
+        assert (info.maxsize, info.currsize, info.evictions) == (2, 2, 2)
+
+    def test_ttl(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr(
+            "func_validator._result_cache.monotonic", lambda: now[0]
+        )
+
+        @validate_params(cache=True, cache_ttl=10)
+        def f(x: Annotated[int, CountingAccept()]):
+            return x
+
+        f(1)
+        now[0] = 5.0
+        f(1)
+        assert CountingAccept.calls == 1
+        now[0] = 10.0
+        f(1)
+        assert CountingAccept.calls == 2
+        assert f.cache_info().expirations == 1
+
+    def test_unhashable_arguments_are_not_cached(self):
+        @validate_params(cache=True)
+        def f(xs: Annotated[list, CountingAccept()], **options):
+            return len(xs), options
+
+        assert f([1], a=1) == (1, {"a": 1})
+        assert f([1], a=1) == (1, {"a": 1})
+        assert CountingAccept.calls == 2
+
+    def test_unhashable_var_keyword_arguments_are_not_cached(self, instrument):
+        @validate_params(cache=True, instrument=instrument)
+        def f(x: Annotated[int, CountingAccept()], **options):
+            return x, options
+
+        assert f(1, b=[1]) == (1, {"b": [1]})
+        assert f(1, b=[1]) == (1, {"b": [1]})
+        assert CountingAccept.calls == 2
+
+    def test_var_keyword_arguments(self):
+        @validate_params(cache=True)
+        def f(x: Annotated[int, CountingAccept()], **options):
+            return x, options
+
+        assert f(1, a=1, b=2) == (1, {"a": 1, "b": 2})
+        assert f(1, b=2, a=1) == (1, {"a": 1, "b": 2})
+        assert f(1, a=2, b=2) == (1, {"a": 2, "b": 2})
+        assert CountingAccept.calls == 2
+
+    def test_cache_clear(self):
+        @validate_params(cache=True)
+        def f(x: Annotated[int, CountingAccept()]):
+            return x
+
+        f(1)
+        f.cache_clear()
+        f(1)
+        assert CountingAccept.calls == 2
+
+    def test_trust_chain(self):
+        @validate_params(cache=True, trust_chain=True)
+        def f(x: Annotated[int, CountingAccept()]):
+            return x
+
+        assert f(1) == f(1) == 1
+        assert CountingAccept.calls == 1
+
+    def test_stats_counters(self):
+        @validate_params(cache=1)
+        def f(x: int):
+            return x
+
+        f(1)
+        f(1)
+        f(2)
+        name = f"{f.__module__}.{f.__qualname__}"
+        assert func_validator.stats()[name]["counters"] == {
+            "result_cache_hits": 1,
+            "result_cache_misses": 2,
+            "result_cache_evictions": 1,
+        }
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"cache": 0},
+            {"cache": -1},
+            {"cache_ttl": 1},
+            {"cache": True, "cache_ttl": 0},
+        ],
+    )
+    def test_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            validate_params(**kwargs)(lambda x: x)
+
+    def test_info_is_kept_per_cache(self):
+        def make():
+            @validate_params(cache=True)
+            def f(x: int):
+                return x
+
+            return f
+
+        first, second = make(), make()
+        first(1)
+        first(1)
+        second(1)
+        func_validator.reset_stats()
+        assert first.cache_info()[:2] == (1, 1)
+        assert second.cache_info()[:2] == (0, 1)
@@ -0,0 +1,193 @@
+import logging
+import threading
+from typing import Annotated
+
+import pytest
+
+import func_validator
+from func_validator import (
+    SHADOW_QUEUE_SIZE,
+    MustBePositive,
+    ValidationError,
+    ValidationSpec,
+    Validator,
+    flush_shadow_queue,
+    set_shadow_queue_size,
+    validate_params,
+)
+
+
+class Blocking(Validator):
+    """Holds the shadow worker until `release` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, arg_value, arg_name: str):
+        self.started.set()
+        self.release.wait(10)
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    func_validator.reset_stats()
+
+
+class TestShadowMode:
+
+    def test_calls_are_not_rejected(self):
+        failures = []
+
+        @validate_params(
+            mode="shadow",
+            on_shadow_failure=lambda name, e: failures.append((name, e)),
+        )
+        def double(x: Annotated[int, MustBePositive()]):
+            return 2 * x
+
+        assert double(2) == 4
+        assert double(-3) == -6
+        assert double(x=-1) == -2
+        flush_shadow_queue()
+
+        info = double.shadow_info()
+        assert (info.checks, info.failures, info.drops) == (3, 2, 0)
+        assert info.depth == 0
+        assert info.maxsize == SHADOW_QUEUE_SIZE
+        assert [name for name, _ in failures] == [
+            f"{__name__}.{double.__qualname__}"
+        ] * 2
+        assert all(isinstance(e, ValidationError) for _, e in failures)
+
+    def test_failures_are_logged_by_default(self, caplog):
+        @validate_params(mode="shadow")
+        def ident(x: Annotated[int, MustBePositive()]):
+            return x
+
+        with caplog.at_level(logging.WARNING, logger="func_validator"):
+            ident(-1)
+            flush_shadow_queue()
+        assert "Shadow validation of" in caplog.text
+
+    def test_drops_when_the_queue_is_full(self):
+        blocking = Blocking()
+
+        @validate_params(mode="shadow")
+        def ident(x: Annotated[int, blocking]):
+            return x
+
+        try:
+            ident(0)
+            assert blocking.started.wait(10)
+            for i in range(SHADOW_QUEUE_SIZE + 5):
+                assert ident(i) == i
+            info = ident.shadow_info()
+            assert info.depth == SHADOW_QUEUE_SIZE
+            assert info.drops == 5
+        finally:
+            blocking.release.set()
+        flush_shadow_queue()
+
+        info = ident.shadow_info()
+        assert (info.checks, info.drops, info.depth) == (
+            SHADOW_QUEUE_SIZE + 1,
+            5,
+            0,
+        )
+        name = f"{__name__}.{ident.__qualname__}"
+        assert func_validator.stats()[name]["counters"] == {
+            "shadow_checks": SHADOW_QUEUE_SIZE + 1,
+            "shadow_drops": 5,
+        }
+
+    def test_queue_size(self):
+        blocking = Blocking()
+
+        @validate_params(mode="shadow")
+        def ident(x: Annotated[int, blocking]):
+            return x
+
+        set_shadow_queue_size(2)
+        try:
+            ident(0)
+            assert blocking.started.wait(10)
+            for i in range(5):
+                ident(i)
+            info = ident.shadow_info()
+            assert (info.depth, info.maxsize, info.drops) == (2, 2, 3)
+        finally:
+            blocking.release.set()
+            set_shadow_queue_size(SHADOW_QUEUE_SIZE)
+        flush_shadow_queue()
+        with pytest.raises(ValueError):
+            set_shadow_queue_size(0)
+
+    def test_info_is_kept_per_function(self):
+        def make():
+            @validate_params(mode="shadow", on_shadow_failure=print)
+            def ident(x: Annotated[int, MustBePositive()]):
+                return x
+
+            return ident
+
+        first, second = make(), make()
+        first(1)
+        second(1)
+        flush_shadow_queue()
+        func_validator.reset_stats()
+        assert first.shadow_info().checks == 1
+        assert second.shadow_info().checks == 1
+
+    def test_failing_handler_does_not_stop_the_worker(self):
+        def handler(name, error):
+            raise RuntimeError(name)
+
+        @validate_params(mode="shadow", on_shadow_failure=handler)
+        def ident(x: Annotated[int, MustBePositive()]):
+            return x
+
+        ident(-1)
+        ident(-2)
+        flush_shadow_queue()
+        assert ident.shadow_info().failures == 2
+
+    def test_certified_values_are_unwrapped(self):
+        spec = ValidationSpec(MustBePositive())
+
+        @validate_params(mode="shadow")
+        def ident(x: Annotated[int, MustBePositive()], y: int = 0):
+            return x, y
+
+        assert ident(spec.certify(3), y=spec.certify(4)) == (3, 4)
+        flush_shadow_queue()
+        assert ident.shadow_info().failures == 0
+
+    def test_bad_calls_are_not_counted_as_failures(self):
+        @validate_params(mode="shadow")
+        def ident(x: Annotated[int, MustBePositive()]):
+            return x
+
+        with pytest.raises(TypeError):
+            ident(1, 2)
+        flush_shadow_queue()
+        assert ident.shadow_info().failures == 0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"mode": "audit"},
+            {"mode": "shadow", "cache": True},
+            {"mode": "shadow", "trust_chain": True},
+            {"mode": "shadow", "instrument": True},
+            {"mode": "shadow", "version_of": id},
+            {"on_shadow_failure": print},
+        ],
+    )
+    def test_invalid_options(self, kwargs):
+        with pytest.raises(ValueError):
+
+            @validate_params(**kwargs)
+            def ident(x: int):
+                return x
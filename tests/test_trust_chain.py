@@ -0,0 +1,96 @@
+from typing import Annotated
+
+import pytest
+
+import func_validator
+from func_validator import (
+    MustBePositive,
+    ValidationError,
+    Validator,
+    validate_params,
+)
+
+
+class CountingPositive(MustBePositive):
+    calls = 0
+
+    def __call__(self, arg_value, arg_name: str):
+        CountingPositive.calls += 1
+        super().__call__(arg_value, arg_name)
+
+
+class CountingNonEmpty(Validator):
+    calls = 0
+
+    def __call__(self, arg_value, arg_name: str):
+        CountingNonEmpty.calls += 1
+        if not arg_value:
+            raise ValidationError(f"{arg_name} must not be empty")
+
+
+@validate_params(trust_chain=True)
+def inner(
+    amount: Annotated[int, CountingPositive()],
+    items: Annotated[list, CountingNonEmpty()],
+):
+    return amount
+
+
+@validate_params(trust_chain=True)
+def outer(
+    amount: Annotated[int, CountingPositive()],
+    items: Annotated[list, CountingNonEmpty()],
+):
+    return inner(amount, items) + inner(amount, items)
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    CountingPositive.calls = 0
+    CountingNonEmpty.calls = 0
+
+
+class TestTrustChain:
+
+    def test_immutable_values_are_checked_once_per_chain(self):
+        assert outer(1000, [1]) == 2000
+        assert CountingPositive.calls == 1
+        # Lists are mutable, so they are checked on every call.
+        assert CountingNonEmpty.calls == 3
+
+    def test_context_ends_with_the_outermost_call(self):
+        outer(1000, [1])
+        outer(1000, [1])
+        assert CountingPositive.calls == 2
+
+    def test_failures_are_not_trusted(self):
+        with pytest.raises(ValidationError):
+            outer(-1000, [1])
+        with pytest.raises(ValidationError):
+            inner(-1000, [1])
+        assert CountingPositive.calls == 2
+
+    def test_trusted_context(self):
+        with func_validator.trusted_context():
+            inner(1000, [1])
+            inner(1000, [1])
+        inner(1000, [1])
+        assert CountingPositive.calls == 2
+
+    def test_untrusted_functions_always_validate(self):
+        @validate_params
+        def plain(amount: Annotated[int, CountingPositive()]):
+            return amount
+
+        with func_validator.trusted_context():
+            plain(1000)
+            plain(1000)
+        assert CountingPositive.calls == 2
+
+    def test_instrumented_trust_chain(self):
+        @validate_params(trust_chain=True, instrument=True)
+        def fn(amount: Annotated[int, CountingPositive()]):
+            return inner(amount, [1])
+
+        fn(1000)
+        assert CountingPositive.calls == 1
@@ -0,0 +1,171 @@
+import copy
+import pickle
+from typing import Annotated
+
+import pytest
+
+from func_validator import (
+    MustBeNonEmpty,
+    MustHaveLengthLessThanOrEqual,
+    MustHaveValuesGreaterThan,
+    MustHaveValuesGreaterThanOrEqual,
+    MustMatchRegex,
+    ValidatedDict,
+    ValidatedList,
+    ValidatedSet,
+    ValidationError,
+    validate_params,
+)
+
+
+class CountingNonNegative(MustHaveValuesGreaterThanOrEqual):
+    calls = 0
+
+    def __call__(self, values, arg_name: str):
+        CountingNonNegative.calls += 1
+        super().__call__(values, arg_name)
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    CountingNonNegative.calls = 0
+
+
+class TestValidatedList:
+
+    def test_initial_values_are_checked(self):
+        with pytest.raises(ValidationError):
+            ValidatedList([1, -1], MustHaveValuesGreaterThan(0))
+        with pytest.raises(ValidationError):
+            ValidatedList([], MustBeNonEmpty())
+
+    def test_unsupported_validators(self):
+        with pytest.raises(TypeError):
+            ValidatedList([], MustMatchRegex("a"))
+
+    def test_invalid_mutations_are_rejected(self):
+        values = ValidatedList(
+            [1, 2],
+            MustHaveValuesGreaterThan(0),
+            MustHaveLengthLessThanOrEqual(3),
+            MustBeNonEmpty(),
+        )
+        with pytest.raises(ValidationError):
+            values.append(0)
+        with pytest.raises(ValidationError):
+            values.extend([3, 4])
+        with pytest.raises(ValidationError):
+            values[0] = -1
+        with pytest.raises(ValidationError):
+            values[:] = [1, 2, 3, 4]
+        with pytest.raises(ValidationError):
+            values *= 2
+        assert values == [1, 2]
+
+        values.pop()
+        with pytest.raises(ValidationError):
+            values.pop()
+        with pytest.raises(ValidationError):
+            del values[0]
+        with pytest.raises(ValidationError):
+            values.clear()
+        assert values == [1]
+
+    def test_valid_mutations(self):
+        values = ValidatedList([1], MustHaveValuesGreaterThan(0))
+        values.append(2)
+        values.insert(0, 3)
+        values += [4, 5]
+        values[1:3] = [6]
+        values.remove(6)
+        del values[0]
+        assert values == [4, 5]
+        assert type(values) is ValidatedList
+
+    def test_copy_and_pickle_keep_validators(self):
+        values = ValidatedList([1], MustHaveValuesGreaterThan(0), name="xs")
+        for clone in (
+            copy.deepcopy(values),
+            pickle.loads(pickle.dumps(values)),
+        ):
+            assert type(clone) is ValidatedList
+            assert clone == [1]
+            with pytest.raises(ValidationError, match="xs"):
+                clone.append(-1)
+
+
+class TestValidatedSet:
+
+    def test_mutations(self):
+        values = ValidatedSet(
+            {1}, MustHaveValuesGreaterThan(0), MustHaveLengthLessThanOrEqual(3)
+        )
+        values.add(2)
+        values.add(2)
+        with pytest.raises(ValidationError):
+            values.add(-1)
+        with pytest.raises(ValidationError):
+            values |= {3, 4}
+        values ^= {2, 3}
+        assert values == {1, 3}
+        values &= {1}
+        assert values == {1}
+
+
+class TestValidatedDict:
+
+    def test_keys_and_values_are_checked(self):
+        counts = ValidatedDict(
+            {1: 1},
+            MustHaveValuesGreaterThan(0),
+            value_validators=[MustHaveValuesGreaterThanOrEqual(0)],
+        )
+        counts[2] = 0
+        counts.update({3: 1})
+        with pytest.raises(ValidationError):
+            counts[-1] = 1
+        with pytest.raises(ValidationError):
+            counts[1] = -1
+        with pytest.raises(ValidationError):
+            counts.update({-2: 1})
+        assert counts == {1: 1, 2: 0, 3: 1}
+        assert counts.pop(4, None) is None
+        assert counts.setdefault(4, 2) == 2
+
+
+class TestDecoratorRecognition:
+
+    def test_covered_scan_is_skipped(self):
+        @validate_params
+        def last(values: Annotated[list, CountingNonNegative(0)]):
+            return values[-1]
+
+        values = ValidatedList([0, 1], CountingNonNegative(0))
+        values.append(2)
+        calls = CountingNonNegative.calls
+        assert last(values) == 2
+        assert CountingNonNegative.calls == calls
+
+        assert last([0, 1]) == 1
+        assert CountingNonNegative.calls == calls + 1
+
+    def test_sampled_validators_still_run(self):
+        sampled = CountingNonNegative(0, sample=1)
+
+        @validate_params
+        def last(values: Annotated[list, sampled]):
+            return values[-1]
+
+        values = ValidatedList([0, 1], sampled)
+        values.extend([2, 3])
+        calls = CountingNonNegative.calls
+        assert last(values) == 3
+        assert CountingNonNegative.calls == calls + 1
+
+    def test_uncovered_validators_still_run(self):
+        @validate_params
+        def last(values: Annotated[list, MustHaveValuesGreaterThan(1)]):
+            return values[-1]
+
+        with pytest.raises(ValidationError):
+            last(ValidatedList([1], MustHaveValuesGreaterThan(0)))
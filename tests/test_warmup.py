@@ -0,0 +1,70 @@
+import gc
+import sys
+import textwrap
+import types
+
+import pytest
+
+import func_validator
+
+MODULE_SOURCE = textwrap.dedent(
+    """
+    from typing import Annotated
+
+    from func_validator import MustBePositive, validate_params
+
+    @validate_params
+    def fn(arg__1: Annotated[int, MustBePositive()]):
+        return arg__1
+
+    class Model:
+        @validate_params
+        def method(self, arg__1: Annotated[int, MustBePositive()]):
+            return arg__1
+
+        @staticmethod
+        @validate_params
+        def static(arg__1: Annotated[int, MustBePositive()]):
+            return arg__1
+
+        class Nested:
+            @validate_params
+            def method(self, arg__1: Annotated[int, MustBePositive()]):
+                return arg__1
+    """
+)
+
+
+@pytest.fixture
+def module():
+    mod = types.ModuleType("_warmup_test_module")
+    exec(MODULE_SOURCE, vars(mod))
+    sys.modules[mod.__name__] = mod
+    yield mod
+    del sys.modules[mod.__name__]
+
+
+def _plans(mod):
+    return [
+        mod.fn.__validation_plan__,
+        mod.Model.method.__validation_plan__,
+        mod.Model.static.__validation_plan__,
+        mod.Model.Nested.method.__validation_plan__,
+    ]
+
+
+class TestWarmup:
+
+    def test_warmup_compiles_module_plans(self, module):
+        assert not any(plan.is_compiled for plan in _plans(module))
+
+        assert func_validator.warmup([module.__name__], freeze=False) == 4
+        assert all(plan.is_compiled for plan in _plans(module))
+        assert func_validator.warmup([module], freeze=False) == 0
+
+    def test_warmup_freezes_gc(self, module):
+        try:
+            func_validator.warmup([module])
+            assert gc.get_freeze_count() > 0
+        finally:
+            gc.unfreeze()